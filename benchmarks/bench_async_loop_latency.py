@@ -0,0 +1,90 @@
+"""
+Measures event-loop latency while an asyncio application mutates tasks concurrently.
+
+A ticker coroutine asks to wake up every millisecond and records how late it
+actually runs. Meanwhile `--concurrency` coroutines each mark one task as
+done, through either
+- "sync": TodoService called directly from the coroutines, which rewrites
+  tasks.json on the event loop for every mutation, or
+- "async": AsyncTodoService over AsyncTaskRepository, which saves on a worker
+  thread and coalesces concurrent mutations into one save.
+
+Usage:
+    python -m benchmarks.bench_async_loop_latency [--size 20000] [--concurrency 100]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, percentile, print_table
+from src.application.AsyncTodoService_adapter import AsyncTodoService
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.persistence.AsyncTaskRepository_adapter import AsyncTaskRepository
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+TICK = 0.001
+
+
+async def measure_lag(stop: asyncio.Event, lags: list):
+    """Sleeps for TICK seconds in a loop and records how late every wake-up is."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def run_sync(path: str, task_ids):
+    service = TodoService(TaskJsonRepository(path, lazy=True))
+
+    async def complete(task_id):
+        service.complete_task(task_id) # Blocks the event loop for the whole save
+    await asyncio.gather(*(complete(task_id) for task_id in task_ids))
+
+
+async def run_async(path: str, task_ids):
+    repository = AsyncTaskRepository(TaskJsonRepository(path, lazy=True)) # Loads on the worker thread
+    service = AsyncTodoService(repository)
+    await asyncio.gather(*(service.complete_task(task_id) for task_id in task_ids))
+    await repository.close()
+
+
+async def scenario(run, path: str, task_ids):
+    """Runs one scenario next to the lag monitor and returns (elapsed seconds, lag samples)."""
+    stop, lags = asyncio.Event(), []
+    monitor = asyncio.ensure_future(measure_lag(stop, lags))
+    await asyncio.sleep(0.05) # Let the monitor settle
+    start = time.perf_counter()
+    await run(path, task_ids)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+    return elapsed, lags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=20000, help="Number of tasks in the dataset.")
+    parser.add_argument("--concurrency", type=int, default=100, help="Number of concurrent mutations.")
+    args = parser.parse_args()
+
+    task_ids = list(range(1, min(args.size, args.concurrency) + 1))
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, run in (("sync", run_sync), ("async", run_async)):
+            path = os.path.join(temp_dir, f"{name}.json")
+            write_tasks_json(path, args.size)
+            # Loading the file is part of the run for both scenarios
+            elapsed, lags = asyncio.run(scenario(run, path, task_ids))
+            rows.append([name, len(task_ids), f"{elapsed:.3f}",
+                         f"{percentile(lags, 50) * 1000:.2f}", f"{percentile(lags, 99) * 1000:.2f}",
+                         f"{max(lags) * 1000:.2f}"])
+
+    print(f"Dataset: {args.size} tasks, {len(task_ids)} concurrent mark-done calls")
+    print_table(["service", "mutations", "total s", "lag p50 ms", "lag p99 ms", "lag max ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares running CLI commands one per invocation with running them as one batch.
+
+A single invocation is simulated in-process by building a fresh repository,
+service and CLIHandler for every command, which pays the load of tasks.json
+and the save after each mutation. The batch runs every command through one
+`batch` call instead. Interpreter start-up is not included, so the real gap
+is larger.
+
+Usage:
+    python -m benchmarks.bench_batch_cli [--size 10000] [--commands 200]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shlex
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, print_table
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.cli.handler import CLIHandler
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+
+def build_commands(size: int, count: int):
+    """Returns `count` command lines mixing adds, status changes and lookups."""
+    commands = []
+    for i in range(count):
+        task_id = (i * 7919) % size + 1
+        commands.append(['add "Batch task %d"' % i, f"mark-done {task_id}", f"get {task_id}"][i % 3])
+    return commands
+
+
+def run_single(path: str, commands):
+    """Runs every command with its own repository, like separate CLI invocations."""
+    for command in commands:
+        handler = CLIHandler(TodoService(TaskJsonRepository(path)))
+        handler.handle(shlex.split(command))
+
+
+def run_batch(path: str, commands, flush_every: int):
+    """Runs every command through one batch invocation."""
+    batch_path = path + ".commands"
+    with open(batch_path, 'w') as f:
+        f.write("\n".join(commands) + "\n")
+    CLIHandler(TodoService(TaskJsonRepository(path))).handle(["batch", batch_path, "--flush-every", str(flush_every)])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10000, help="Number of tasks in the dataset.")
+    parser.add_argument("--commands", type=int, default=200, help="Number of commands to run.")
+    args = parser.parse_args()
+
+    commands = build_commands(args.size, args.commands)
+    runs = [
+        ("one command per invocation", lambda path: run_single(path, commands)),
+        ("batch", lambda path: run_batch(path, commands, 0)),
+        ("batch --flush-every 50", lambda path: run_batch(path, commands, 50)),
+    ]
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, run in runs:
+            path = os.path.join(temp_dir, "tasks.json")
+            write_tasks_json(path, args.size)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                run(path)
+            elapsed = time.perf_counter() - start
+            rows.append([name, args.commands, f"{elapsed:.3f}", f"{elapsed / args.commands * 1000:.3f}"])
+
+    print(f"Dataset: {args.size} tasks")
+    print_table(["mode", "commands", "total s", "per command ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures cold-start time of a single-task lookup as the dataset grows.
+
+Each sample opens a fresh repository and calls get_by_id once, which is what a
+`python main.py get <id>` invocation does. The binary repository is compared
+with the JSON repository in lazy mode.
+
+Usage:
+    python -m benchmarks.bench_binary_cold_start [--sizes 1000 100000 1000000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+
+from benchmarks.common import generate_task_records, write_tasks_json, time_calls, percentile, print_table
+from src.domain.Task import TaskStatusEnum
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskBinaryRepository_adapter import (
+    TaskBinaryRepository, HEADER, HEADER_SIZE, MAGIC, RECORD, STATUS_CODES, VERSION
+)
+import datetime
+
+
+def write_tasks_bin(path: str, count: int):
+    """Writes a binary task file (and its heap) holding `count` synthetic tasks."""
+    epoch = datetime.datetime(1970, 1, 1)
+    heap_offset = 0
+    with open(path, 'wb') as records, open(path + '.heap', 'wb') as heap:
+        records.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count, count + 1).ljust(HEADER_SIZE, b"\0"))
+        for record in generate_task_records(count):
+            description = record["description"].encode('utf-8')
+            heap.write(description)
+            records.write(RECORD.pack(
+                record["id"], STATUS_CODES[TaskStatusEnum(record["status"])],
+                (datetime.datetime.fromisoformat(record["createdAt"]) - epoch).total_seconds(),
+                (datetime.datetime.fromisoformat(record["updatedAt"]) - epoch).total_seconds(),
+                heap_offset, len(description)
+            ))
+            heap_offset += len(description)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000], help="Number of tasks.")
+    parser.add_argument("--repeat", type=int, default=20, help="Cold lookups measured per size.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            bin_path = os.path.join(temp_dir, f"tasks-{size}.bin")
+            write_tasks_bin(bin_path, size)
+            json_path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(json_path, size)
+            target = size // 2 # A task in the middle of the file
+
+            def binary_lookup():
+                repository = TaskBinaryRepository(bin_path)
+                repository.get_by_id(target)
+                repository.close()
+
+            def json_lookup():
+                TaskJsonRepository(json_path, lazy=True).get_by_id(target)
+
+            for name, lookup, repeat in (("binary", binary_lookup, args.repeat), ("json lazy", json_lookup, 3)):
+                samples = time_calls(lookup, repeat)
+                rows.append([size, name, f"{statistics.mean(samples) * 1000:.3f}", f"{percentile(samples, 95) * 1000:.3f}"])
+
+    print_table(["tasks", "adapter", "mean ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
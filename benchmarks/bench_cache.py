@@ -0,0 +1,74 @@
+"""
+Measures how CachingTaskRepository speeds up lookups by id on the SQLite backend, by cache size.
+
+Lookups follow a skewed pattern: --hot-share of them go to the first
+--hot-ratio of the ids, the rest are spread over every id. Each cache size
+is run against a fresh cache over the same database, with one write in
+every --write-every lookups (which clears the cached listings but keeps the
+tasks current). The hit rate shows which cache size covers the working set;
+"none" is the uncached repository.
+
+Usage:
+    python -m benchmarks.bench_cache [--size 100000] [--cache-sizes 100 1000 10000] [--lookups 20000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+
+from benchmarks.common import populate_sqlite, time_calls, percentile, print_table
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.CachingTaskRepository_adapter import CachingTaskRepository
+from src.infrastructure.persistence.TaskSqliteRepository_adapter import TaskSqliteRepository
+
+
+def measure(label: str, repository: TaskRepositoryPort, ids, write_every: int):
+    """Returns a result row for looking up `ids` in order, updating every `write_every`-th task."""
+    lookups = iter(enumerate(ids, 1))
+    def lookup():
+        number, task_id = next(lookups)
+        task = repository.get_by_id(task_id)
+        if write_every and number % write_every == 0:
+            repository.update(task)
+    samples = time_calls(lookup, len(ids))
+    hit_rate = "-"
+    if isinstance(repository, CachingTaskRepository):
+        tasks = repository.stats()["tasks"]
+        hit_rate = f"{tasks['hits'] / (tasks['hits'] + tasks['misses']):.1%}"
+    return [label, hit_rate, f"{statistics.mean(samples) * 1e6:.1f}",
+            f"{percentile(samples, 50) * 1e6:.1f}", f"{percentile(samples, 99) * 1e6:.1f}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="Tasks in the database.")
+    parser.add_argument("--cache-sizes", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Cache sizes (tasks) to measure.")
+    parser.add_argument("--lookups", type=int, default=20000, help="Lookups per cache size.")
+    parser.add_argument("--hot-ratio", type=float, default=0.01, help="Share of the ids that are hot.")
+    parser.add_argument("--hot-share", type=float, default=0.9, help="Share of the lookups that go to hot ids.")
+    parser.add_argument("--write-every", type=int, default=50, help="Update one task every N lookups (0: never).")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the lookup pattern.")
+    args = parser.parse_args()
+
+    generator = random.Random(args.seed)
+    hot = max(1, int(args.size * args.hot_ratio))
+    ids = [generator.randint(1, hot) if generator.random() < args.hot_share else generator.randint(1, args.size)
+           for _ in range(args.lookups)]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "tasks.db")
+        populate_sqlite(path, args.size)
+        rows.append(measure("none", TaskSqliteRepository(path), ids, args.write_every))
+        for cache_size in args.cache_sizes:
+            repository = CachingTaskRepository(TaskSqliteRepository(path), max_tasks=cache_size)
+            rows.append(measure(f"{cache_size} tasks", repository, ids, args.write_every))
+
+    print(f"{args.size} tasks, {args.lookups} lookups, {args.hot_share:.0%} of them to {hot} hot ids")
+    print_table(["cache", "hit rate", "mean us", "p50 us", "p99 us"], rows)
+
+
+if __name__ == "__main__":
+    main()
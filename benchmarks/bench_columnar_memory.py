@@ -0,0 +1,52 @@
+"""
+Reports bytes per task for TaskMemoryRepository and TaskColumnarRepository.
+
+Memory is measured with tracemalloc as the growth in traced allocations while
+the repository is filled through its add() method.
+
+Usage:
+    python -m benchmarks.bench_columnar_memory [--sizes 100000 1000000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks.common import print_table
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.infrastructure.persistence.TaskColumnarRepository_adapter import TaskColumnarRepository
+
+
+def measure(repository_class, size: int):
+    """Returns (bytes per task, seconds to fill) for a repository holding `size` tasks."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    repository = repository_class()
+    for i in range(size):
+        repository.add(f"Synthetic task number {i} for benchmarking")
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del repository
+    return (after - before) / size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000], help="Number of tasks.")
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        for repository_class in (TaskMemoryRepository, TaskColumnarRepository):
+            bytes_per_task, elapsed = measure(repository_class, size)
+            rows.append([size, repository_class.__name__, f"{bytes_per_task:.1f}", f"{elapsed:.2f}"])
+
+    print_table(["tasks", "repository", "bytes/task", "fill s (traced)"], rows)
+
+
+if __name__ == "__main__":
+    main()
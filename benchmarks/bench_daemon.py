@@ -0,0 +1,84 @@
+"""
+Compares CLI command latency with and without the resident task daemon.
+
+For each dataset size the script measures:
+- "in-process": `python main.py <command>` with no daemon running, which
+  starts an interpreter and loads the data for every command,
+- "client": `python main.py <command>` forwarded to a running daemon,
+- "round-trip": one framed request on an open socket, i.e. the cost the
+  daemon adds on top of running the command itself.
+
+Usage:
+    python -m benchmarks.bench_daemon [--sizes 1000 100000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, time_calls, print_table
+from src.infrastructure.daemon import client
+
+MAIN = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+
+
+def run_cli(args, env) -> float:
+    """Runs one CLI invocation and returns its wall-clock duration in seconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, MAIN] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def wait_for_daemon(socket_path: str, timeout: float = 60.0):
+    """Blocks until the daemon answers a ping."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if client.request(socket_path, {"op": "ping"}) is not None:
+            return
+        time.sleep(0.05)
+    raise RuntimeError("The task daemon did not start.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000], help="Dataset sizes (number of tasks).")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per command.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        socket_path = os.path.join(temp_dir, "daemon.sock")
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            env = dict(os.environ, TASK_TRACKER_BACKEND="json", TASK_TRACKER_FILE=path, TASK_TRACKER_SOCKET=socket_path)
+            store = {"backend": "json", "file": os.path.abspath(path)}
+            commands = [("get", ["get", str(size // 2 or 1)]), ("mark-done", ["mark-done", str(size // 3 or 1)]),
+                        ("list --status to do", ["list", "--status", "to do"])]
+
+            for name, command in commands:
+                samples = [run_cli(command, env) for _ in range(args.repeat)]
+                rows.append([size, name, "in-process", f"{statistics.median(samples) * 1000:.2f}"])
+
+            daemon = subprocess.Popen([sys.executable, MAIN, "daemon"], env=env, stdout=subprocess.DEVNULL)
+            try:
+                wait_for_daemon(socket_path)
+                for name, command in commands:
+                    client.request(socket_path, {"op": "command", "args": command, "store": store}) # Warm-up: loads the data
+                    samples = [run_cli(command, env) for _ in range(args.repeat)]
+                    rows.append([size, name, "client", f"{statistics.median(samples) * 1000:.2f}"])
+                    samples = time_calls(lambda: client.request(socket_path, {"op": "command", "args": command, "store": store}),
+                                         args.repeat * 10)
+                    rows.append([size, name, "round-trip", f"{statistics.median(samples) * 1000:.2f}"])
+            finally:
+                client.request(socket_path, {"op": "shutdown"})
+                daemon.wait()
+
+    print_table(["tasks", "command", "mode", "median ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Measures the per-save cost of each DurabilityLevel in TaskJsonRepository.
+
+Usage:
+    python -m benchmarks.bench_durability [--sizes 10000 100000] [--saves 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+
+from benchmarks.common import write_tasks_json, time_calls, percentile, print_table
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository, DurabilityLevel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="Number of tasks in the file.")
+    parser.add_argument("--saves", type=int, default=20, help="Number of saves measured per level.")
+    parser.add_argument("--dir", default=None, help="Directory for the data files (defaults to a temp dir). "
+                                                    "Use a directory on the disk you care about: tmpfs makes fsync free.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory(dir=args.dir) as temp_dir:
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            file_mb = os.path.getsize(path) / (1024 * 1024)
+            for level in DurabilityLevel:
+                repository = TaskJsonRepository(path, durability=level)
+                samples = time_calls(repository._save, args.saves)
+                rows.append([size, f"{file_mb:.1f}", level.value,
+                             f"{statistics.mean(samples) * 1000:.1f}",
+                             f"{percentile(samples, 50) * 1000:.1f}",
+                             f"{percentile(samples, 95) * 1000:.1f}"])
+
+    print_table(["tasks", "file MB", "durability", "mean ms", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Shows that get_by_id, update and delete cost the same no matter how many tasks exist.
+
+The memory repository is measured directly; the JSON repository is measured in
+journal mode with durability "none", so its mutations do not rewrite the file
+and the numbers reflect the index rather than disk I/O.
+
+Usage:
+    python -m benchmarks.bench_id_index [--sizes 10000 100000 1000000] [--ops 2000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+
+from benchmarks.common import write_tasks_json, time_calls, percentile, print_table
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository, DurabilityLevel
+
+
+def measure(repository, size: int, ops: int):
+    """Returns mean/p95 microseconds for get_by_id, update and delete on random IDs."""
+    ids = random.Random(size).sample(range(1, size + 1), ops)
+    lookups = iter(ids)
+    updates = iter(ids)
+    deletes = iter(ids)
+    results = {}
+    results["get_by_id"] = time_calls(lambda: repository.get_by_id(next(lookups)), ops)
+    results["update"] = time_calls(lambda: repository.update(repository.get_by_id(next(updates))), ops)
+    results["delete"] = time_calls(lambda: repository.delete(next(deletes)), ops)
+    return {name: (statistics.mean(samples) * 1e6, percentile(samples, 95) * 1e6) for name, samples in results.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Number of tasks.")
+    parser.add_argument("--ops", type=int, default=2000, help="Operations measured per size and method.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            memory_repository = TaskMemoryRepository()
+            for i in range(size):
+                memory_repository.add(f"Task {i}")
+
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            json_repository = TaskJsonRepository(path, journal=True, compact_records=10 ** 9,
+                                                 compact_bytes=10 ** 12, durability=DurabilityLevel.NONE)
+
+            for name, repository in (("memory", memory_repository), ("json+journal", json_repository)):
+                for method, (mean_us, p95_us) in measure(repository, size, args.ops).items():
+                    rows.append([size, name, method, f"{mean_us:.2f}", f"{p95_us:.2f}"])
+
+    print_table(["tasks", "adapter", "method", "mean us", "p95 us"], rows)
+
+
+if __name__ == "__main__":
+    main()
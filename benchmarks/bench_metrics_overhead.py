@@ -0,0 +1,76 @@
+"""
+Measures what the metrics instrumentation costs on the hot paths.
+
+The same operations run against three stacks over an in-memory repository:
+- the plain TodoService, which is what runs when TASK_TRACKER_METRICS is unset,
+- the plain service over a JSON repository constructed with metrics=None, to
+  show the cost of the phase checks that stay in that adapter,
+- and the instrumented service over the instrumented repository, as main.py
+  builds it when metrics are enabled.
+
+Usage:
+    python -m benchmarks.bench_metrics_overhead [--tasks 10000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+
+from benchmarks.common import time_calls, print_table
+from src.application.InstrumentedTodoService_adapter import InstrumentedTodoService
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+from src.infrastructure.persistence.InstrumentedTaskRepository_adapter import InstrumentedTaskRepository
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+
+
+def memory_service(instrumented: bool):
+    """Returns a service over an empty in-memory repository, optionally instrumented."""
+    if not instrumented:
+        return TodoService(TaskMemoryRepository())
+    metrics = MetricsRegistry()
+    return InstrumentedTodoService(TodoService(InstrumentedTaskRepository(TaskMemoryRepository(), metrics)), metrics)
+
+
+def workload(service, count: int):
+    """Adds `count` tasks one by one, reads each back and completes every other one."""
+    for i in range(count):
+        service.add_task(f"Task {i}")
+    for task_id in range(1, count + 1):
+        service.get_task(task_id)
+    for task_id in range(1, count + 1, 2):
+        service.complete_task(task_id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000, help="Tasks added per run.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per stack.")
+    args = parser.parse_args()
+    calls = args.tasks * 2 + (args.tasks + 1) // 2
+
+    rows = []
+    plain = statistics.median(time_calls(lambda: workload(memory_service(False), args.tasks), args.repeat))
+    instrumented = statistics.median(time_calls(lambda: workload(memory_service(True), args.tasks), args.repeat))
+    for label, seconds in (("memory, metrics disabled", plain), ("memory, instrumented", instrumented)):
+        rows.append([label, f"{seconds * 1000:.1f}", f"{seconds / calls * 1e6:.2f}",
+                     f"{(seconds - plain) / calls * 1e6:+.2f}"])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for label, metrics in (("json, metrics disabled", None), ("json, phases recorded", MetricsRegistry())):
+            path = os.path.join(temp_dir, f"tasks-{len(rows)}.json")
+            def run():
+                if os.path.exists(path):
+                    os.remove(path)
+                repository = TaskJsonRepository(path, metrics=metrics)
+                with repository.defer_writes():
+                    workload(TodoService(repository), args.tasks)
+            seconds = statistics.median(time_calls(run, args.repeat))
+            rows.append([label, f"{seconds * 1000:.1f}", f"{seconds / calls * 1e6:.2f}", "-"])
+
+    print_table(["stack", "median ms", "µs per call", "overhead µs per call"], rows)
+
+
+if __name__ == "__main__":
+    main()
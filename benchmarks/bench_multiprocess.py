@@ -0,0 +1,84 @@
+"""
+Measures the throughput of several processes mutating one JSON task file at once.
+
+Every worker process opens its own multiprocess TaskJsonRepository on the same
+file and runs a mix of adds and status updates. Each operation takes the file
+lock and catches up with the other processes' writes before applying its own
+change. Afterwards the benchmark checks that no update was lost and that no id
+was handed out twice.
+
+Usage:
+    python -m benchmarks.bench_multiprocess [--size 1000] [--processes 1 2 4 8] [--ops 200]
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, print_table
+from src.domain.Task import TaskStatusEnum
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+
+def worker(path: str, journal: bool, ops: int, start_event):
+    """Alternates adds with marking one of the added tasks as done."""
+    repository = TaskJsonRepository(path, journal=journal, lazy=True, multiprocess=True, background_compaction=False)
+    start_event.wait()
+    for i in range(ops):
+        if i % 2 == 0:
+            task = repository.add(f"Task {os.getpid()}-{i}")
+        else:
+            task.mark_as_done()
+            repository.update(task)
+    repository.close()
+
+
+def run(path: str, journal: bool, processes: int, ops: int) -> float:
+    """Runs the workers against the file and returns the elapsed seconds."""
+    start_event = multiprocessing.Event()
+    workers = [multiprocessing.Process(target=worker, args=(path, journal, ops, start_event)) for _ in range(processes)]
+    for process in workers:
+        process.start()
+    start = time.perf_counter()
+    start_event.set()
+    for process in workers:
+        process.join()
+    return time.perf_counter() - start
+
+
+def check(path: str, size: int, processes: int, ops: int) -> str:
+    """Returns "ok" if every add and update made it to the file with a unique id."""
+    tasks = TaskJsonRepository(path, journal=True).get_all()
+    ids = [task.id for task in tasks]
+    added = processes * ((ops + 1) // 2)
+    completed = sum(1 for task in tasks[size:] if task.status == TaskStatusEnum.DONE)
+    if len(ids) != len(set(ids)) or len(tasks) != size + added or completed != processes * (ops // 2):
+        return "LOST WRITES"
+    return "ok"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=1000, help="Number of tasks in the dataset.")
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8], help="Numbers of worker processes.")
+    parser.add_argument("--ops", type=int, default=200, help="Operations per worker process.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for mode, journal in (("snapshot", False), ("journal", True)):
+            for processes in args.processes:
+                path = os.path.join(temp_dir, f"tasks-{mode}-{processes}.json")
+                write_tasks_json(path, args.size)
+                elapsed = run(path, journal, processes, args.ops)
+                total = processes * args.ops
+                rows.append([mode, processes, total, f"{elapsed:.3f}", f"{total / elapsed:.0f}",
+                             check(path, args.size, processes, args.ops)])
+
+    print(f"Dataset: {args.size} tasks, {args.ops} operations per process")
+    print_table(["mode", "processes", "ops", "total s", "ops/s", "check"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compares full-text search through the inverted index with scanning every description.
+
+For each dataset size the JSON repository is loaded once. The benchmark then
+measures:
+- the scan that the port's default search() does over every task,
+- the first indexed search, which builds the index,
+- repeated searches on the built index,
+- the first search of a fresh repository that loads the index saved next to
+  tasks.json instead of building it.
+
+Usage:
+    python -m benchmarks.bench_search [--sizes 10000 100000 1000000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, time_calls, print_table
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+QUERIES = ["number 4321", "benchmarking 432*"]
+
+
+def open_repository(path: str) -> TaskJsonRepository:
+    """Opens and fully loads the repository, so load time is not part of the measurements."""
+    repository = TaskJsonRepository(path, journal=True, persist_search_index=True, background_compaction=False)
+    repository.get_all()
+    return repository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Dataset sizes (number of tasks) to measure.")
+    parser.add_argument("--repeat", type=int, default=20, help="Searches measured per query on the built index.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            repository = open_repository(path)
+            repository.compact() # Gives the snapshot a version the saved index can refer to
+
+            for query in QUERIES:
+                scan = time_calls(lambda: TaskRepositoryPort.search(repository, query), 3)
+                rows.append([size, query, "scan every task", f"{statistics.median(scan) * 1000:.2f}"])
+
+            start = time.perf_counter()
+            repository.search(QUERIES[0])
+            rows.append([size, QUERIES[0], "first search (build index)", f"{(time.perf_counter() - start) * 1000:.2f}"])
+
+            for query in QUERIES:
+                indexed = time_calls(lambda: repository.search(query), args.repeat)
+                rows.append([size, query, "indexed search", f"{statistics.median(indexed) * 1000:.2f}"])
+
+            reopened = open_repository(path)
+            start = time.perf_counter()
+            reopened.search(QUERIES[0])
+            rows.append([size, QUERIES[0], "first search (load saved index)", f"{(time.perf_counter() - start) * 1000:.2f}"])
+
+    print_table(["tasks", "query", "method", "median ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
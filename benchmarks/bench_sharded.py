@@ -0,0 +1,68 @@
+"""
+Compares the cost of a single-task change in the sharded and single-file JSON repositories.
+
+For each dataset size both stores are opened fresh and one task is updated
+repeatedly. The single-file repository is measured in snapshot mode (every
+change rewrites tasks.json) and in journal mode (every change appends a
+record). The sharded repository rewrites one shard of --shard-size ids per
+change, so its cost should stay flat as the dataset grows. The first lookup
+is reported too: it reads one shard, against the whole file.
+
+Usage:
+    python -m benchmarks.bench_sharded [--sizes 10000 100000 1000000] [--shard-size 1000] [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, time_calls, print_table
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskShardedJsonRepository_adapter import TaskShardedJsonRepository
+
+
+def measure(label: str, repository: TaskRepositoryPort, task_id: int, repeat: int, size: int):
+    """Returns a result row for the first lookup and repeated updates of one task."""
+    start = time.perf_counter()
+    task = repository.get_by_id(task_id)
+    first_get = time.perf_counter() - start
+    def update():
+        task.mark_as_done()
+        repository.update(task)
+    updates = time_calls(update, repeat)
+    return [size, label, f"{first_get * 1000:.2f}", f"{statistics.median(updates) * 1000:.2f}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Dataset sizes (number of tasks) to measure.")
+    parser.add_argument("--shard-size", type=int, default=1000, help="Ids per shard of the sharded store.")
+    parser.add_argument("--repeat", type=int, default=20, help="Updates measured per store.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            task_id = size // 2
+            rows.append(measure("json snapshot", TaskJsonRepository(path), task_id, args.repeat, size))
+            repository = TaskJsonRepository(path, journal=True, lazy=True, background_compaction=False)
+            rows.append(measure("json journal", repository, task_id, args.repeat, size))
+            repository.close()
+
+            directory = os.path.join(temp_dir, f"tasks-{size}.shards")
+            sharded = TaskShardedJsonRepository(directory, shard_size=args.shard_size)
+            with sharded.defer_writes():
+                sharded.add_many(["Synthetic task number %d for benchmarking" % i for i in range(1, size + 1)])
+            rows.append(measure(f"sharded ({args.shard_size} per shard)",
+                                TaskShardedJsonRepository(directory), task_id, args.repeat, size))
+
+    print_table(["tasks", "store", "first get ms", "update median ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
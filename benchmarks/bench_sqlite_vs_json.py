@@ -0,0 +1,73 @@
+"""
+Compares mutation latency of TaskSqliteRepository with TaskJsonRepository.
+
+The JSON repository is measured both in its default snapshot mode, where every
+mutation rewrites the whole file, and in journal mode.
+
+Usage:
+    python -m benchmarks.bench_sqlite_vs_json [--size 100000] [--ops 200] [--json-snapshot-ops 5]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+
+from benchmarks.common import populate_sqlite, write_tasks_json, time_calls, percentile, print_table
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskSqliteRepository_adapter import TaskSqliteRepository
+
+
+def measure(repository, size: int, ops: int):
+    """Returns latency samples for add, update (mark done) and delete."""
+    ids = iter(random.Random(size).sample(range(1, size + 1), 2 * ops))
+
+    def update():
+        task = repository.get_by_id(next(ids))
+        task.mark_as_done()
+        repository.update(task)
+
+    return {
+        "add": time_calls(lambda: repository.add("Benchmark task"), ops),
+        "update": time_calls(update, ops),
+        "delete": time_calls(lambda: repository.delete(next(ids)), ops),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100000, help="Number of tasks in the dataset.")
+    parser.add_argument("--ops", type=int, default=200, help="Operations measured per method.")
+    parser.add_argument("--json-snapshot-ops", type=int, default=5,
+                        help="Operations measured for the JSON snapshot mode, which rewrites the file every time.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        db_path = os.path.join(temp_dir, "tasks.db")
+        populate_sqlite(db_path, args.size)
+        snapshot_path = os.path.join(temp_dir, "snapshot.json")
+        write_tasks_json(snapshot_path, args.size)
+        journal_path = os.path.join(temp_dir, "journal.json")
+        write_tasks_json(journal_path, args.size)
+
+        adapters = [
+            ("sqlite", TaskSqliteRepository(db_path), args.ops),
+            ("json", TaskJsonRepository(snapshot_path), args.json_snapshot_ops),
+            ("json+journal", TaskJsonRepository(journal_path, journal=True), args.ops),
+        ]
+        for name, repository, ops in adapters:
+            for method, samples in measure(repository, args.size, ops).items():
+                rows.append([name, method, ops,
+                             f"{statistics.mean(samples) * 1000:.3f}",
+                             f"{percentile(samples, 50) * 1000:.3f}",
+                             f"{percentile(samples, 95) * 1000:.3f}"])
+            if hasattr(repository, "close"):
+                repository.close()
+
+    print(f"Dataset: {args.size} tasks")
+    print_table(["adapter", "method", "ops", "mean ms", "p50 ms", "p95 ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Measures the wall-clock time of single CLI invocations of main.py.
+
+Each command runs in a fresh interpreter against a generated tasks.json, the
+way a user or a script calls the CLI, so the numbers include interpreter
+start-up, imports, parser construction, loading and saving. A bare
+`python -c pass` run is reported as the floor. The `list --limit 20` row
+shows how long the first page of a large list takes.
+
+Usage:
+    python -m benchmarks.bench_startup [--sizes 1000 100000 1000000] [--repeat 5] [--backend json]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, print_table
+
+MAIN = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+
+
+def run_command(args, env) -> float:
+    """Runs one CLI invocation and returns its wall-clock duration in seconds."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                        help="Dataset sizes (number of tasks) to measure.")
+    parser.add_argument("--repeat", type=int, default=5, help="Invocations measured per command.")
+    parser.add_argument("--backend", default="json", help="Value of TASK_TRACKER_BACKEND (only json reads the generated file).")
+    args = parser.parse_args()
+
+    env = dict(os.environ, TASK_TRACKER_BACKEND=args.backend)
+    floor = [run_command(["-c", "pass"], env) for _ in range(args.repeat)]
+    rows = [["-", "python -c pass", f"{statistics.median(floor) * 1000:.1f}", f"{min(floor) * 1000:.1f}"]]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            env["TASK_TRACKER_FILE"] = path
+            commands = [
+                ("add", [MAIN, "add", "Benchmark task"]),
+                ("get", [MAIN, "get", str(size // 2 or 1)]),
+                ("list", [MAIN, "list"]),
+                ("list --limit 20", [MAIN, "list", "--limit", "20"]),
+            ]
+            for name, command in commands:
+                samples = [run_command(command, env) for _ in range(args.repeat)]
+                rows.append([size, name, f"{statistics.median(samples) * 1000:.1f}", f"{min(samples) * 1000:.1f}"])
+
+    print(f"Backend: {args.backend}, {args.repeat} invocations per command")
+    print_table(["tasks", "command", "median ms", "min ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
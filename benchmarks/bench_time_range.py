@@ -0,0 +1,78 @@
+"""
+Compares time range queries through the sorted timestamp index with filtering every task.
+
+For each dataset size the JSON repository is loaded once. The benchmark then
+measures, for a narrow window (about 100 tasks) and a wide one (about 10% of
+the tasks) on createdAt:
+- the port's default get_in_range(), which checks every task and sorts the matches,
+- the first indexed query, which builds the createdAt/updatedAt indexes,
+- repeated queries on the built index,
+- and the cost of an update, which moves the task's updatedAt entry.
+
+Usage:
+    python -m benchmarks.bench_time_range [--sizes 10000 100000 1000000] [--repeat 20]
+"""
+import argparse
+import datetime
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.common import write_tasks_json, time_calls, print_table
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+BASE = datetime.datetime(2025, 1, 1) # Task n is created n seconds after BASE, see generate_task_records()
+
+
+def windows(size: int):
+    """Returns (label, since, until) for a window of about 100 tasks and one of about 10% of the tasks."""
+    middle = BASE + datetime.timedelta(seconds=size // 2)
+    return [
+        ("100 tasks", middle, middle + datetime.timedelta(seconds=100)),
+        ("10% of tasks", middle, middle + datetime.timedelta(seconds=size // 10)),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000],
+                        help="Dataset sizes (number of tasks) to measure.")
+    parser.add_argument("--repeat", type=int, default=20, help="Queries measured per window on the built index.")
+    args = parser.parse_args()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in args.sizes:
+            path = os.path.join(temp_dir, f"tasks-{size}.json")
+            write_tasks_json(path, size)
+            repository = TaskJsonRepository(path, journal=True, background_compaction=False)
+            repository.get_all() # Loads the tasks, so load time is not part of the measurements
+
+            for label, since, until in windows(size):
+                scan = time_calls(lambda: TaskRepositoryPort.get_in_range(repository, "createdAt", since, until), 3)
+                rows.append([size, label, "filter every task", f"{statistics.median(scan) * 1000:.2f}"])
+
+            label, since, until = windows(size)[0]
+            start = time.perf_counter()
+            repository.get_in_range("createdAt", since, until)
+            rows.append([size, label, "first query (build index)", f"{(time.perf_counter() - start) * 1000:.2f}"])
+
+            for label, since, until in windows(size):
+                indexed = time_calls(lambda: repository.get_in_range("createdAt", since, until), args.repeat)
+                rows.append([size, label, "indexed query", f"{statistics.median(indexed) * 1000:.2f}"])
+
+            task = repository.get_by_id(size // 2)
+            def update():
+                task.mark_as_done()
+                repository.update(task)
+            updates = time_calls(update, args.repeat)
+            rows.append([size, "-", "update (index maintained)", f"{statistics.median(updates) * 1000:.2f}"])
+            repository.close()
+
+    print_table(["tasks", "window", "method", "median ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks are run from the project root as modules, e.g.:
+
+    python -m benchmarks.bench_durability
+"""
+import datetime
+import json
+import sqlite3
+import time
+from typing import Callable, Dict, Iterator, List, Any
+
+from src.domain.Task import TaskStatusEnum
+from src.infrastructure.persistence.TaskSqliteRepository_adapter import SCHEMA
+
+# Mirrors the workloads we see in practice: most tasks are done, few are open.
+STATUS_MIX = [TaskStatusEnum.DONE] * 8 + [TaskStatusEnum.TODO, TaskStatusEnum.INPROGRESS]
+
+
+def generate_task_records(count: int) -> Iterator[Dict[str, Any]]:
+    """Yields `count` task dictionaries in the format stored in tasks.json."""
+    base = datetime.datetime(2025, 1, 1)
+    for i in range(1, count + 1):
+        created = base + datetime.timedelta(seconds=i)
+        updated = created + datetime.timedelta(minutes=i % 90)
+        yield {
+            "id": i,
+            "description": f"Synthetic task number {i} for benchmarking",
+            "status": STATUS_MIX[i % len(STATUS_MIX)].value,
+            "createdAt": created.isoformat(),
+            "updatedAt": updated.isoformat()
+        }
+
+
+def write_tasks_json(path: str, count: int):
+    """Writes a tasks.json file holding `count` synthetic tasks."""
+    with open(path, 'w') as f:
+        json.dump({"next_id": count + 1, "tasks": list(generate_task_records(count))}, f, indent=4)
+
+
+def populate_sqlite(path: str, size: int):
+    """Creates a database at `path` holding `size` synthetic tasks."""
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    with connection:
+        connection.executemany(
+            "INSERT INTO tasks (id, description, status, createdAt, updatedAt) VALUES (?, ?, ?, ?, ?)",
+            ((r["id"], r["description"], r["status"], r["createdAt"], r["updatedAt"]) for r in generate_task_records(size))
+        )
+    connection.close()
+
+
+def time_calls(func: Callable[[], Any], repeat: int) -> List[float]:
+    """Calls `func` `repeat` times and returns the duration of each call in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Returns the `pct` percentile (0-100) of `samples` using nearest-rank."""
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def print_table(headers: List[str], rows: List[List[Any]]):
+    """Prints rows as a plain-text table with right-aligned columns."""
+    cells = [headers] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
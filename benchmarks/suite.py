@@ -0,0 +1,341 @@
+"""
+Benchmark suite covering the repositories, the service and the CLI.
+
+`run` generates synthetic datasets (1k, 10k, 100k and 1M tasks by default)
+and, for every target and size, measures the throughput and latency
+percentiles of add, get_by_id, update, delete, list and list_by_status, plus
+the time to load the stored dataset and the peak memory (maximum resident
+set size). Every target and size runs in a fresh child process, so the peak
+memory belongs to that case alone and one case cannot warm up another.
+
+Targets:
+- memory, json, sharded, sqlite, binary: the repository adapters, configured the way
+  main.py creates them (the JSON repository in lazy journal mode with file
+  locking) and called directly.
+- service: TodoService over TaskMemoryRepository, i.e. the service layer
+  without any I/O.
+- cli: `main.py` invocations in a fresh interpreter against a tasks.json
+  file, including start-up; only a few calls per command are measured.
+
+The results are written as JSON (benchmarks/results/latest.json by default).
+`compare` reads two result files and flags every latency or memory figure
+that got worse by more than the threshold, exiting with status 1 if any did,
+so it can gate a change against a stored baseline:
+
+    python -m benchmarks.suite run --output benchmarks/results/baseline.json
+    ... change the code ...
+    python -m benchmarks.suite run --baseline benchmarks/results/baseline.json
+
+Usage:
+    python -m benchmarks.suite run [--sizes 1000 10000 100000 1000000] [--targets memory json ...]
+                                   [--ops 200] [--list-repeat 5] [--output PATH] [--baseline PATH]
+    python -m benchmarks.suite compare BASELINE [CURRENT] [--threshold 0.25]
+"""
+import argparse
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from benchmarks.common import STATUS_MIX, populate_sqlite, write_tasks_json, time_calls, percentile, print_table
+from main import create_repository
+from src.application.TodoService_adapter import TodoService
+from src.domain.Task import TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_OUTPUT = os.path.join(RESULTS_DIR, "latest.json")
+MAIN = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'main.py'))
+FORMAT_VERSION = 1 # Bumped when the layout of the result file changes
+
+TARGETS = ["memory", "json", "sharded", "sqlite", "binary", "service", "cli"]
+LATENCY_METRICS = ["p50_ms", "p95_ms"] # Compared by `compare`, together with max_rss_mib
+NOISE_FLOOR_MS = 0.01 # Latency differences below this are never reported as regressions
+CLI_CALLS = 5 # Invocations measured per CLI command
+
+Summary = Dict[str, Any]
+
+
+def summarize(samples: List[float]) -> Summary:
+    """Reduces latency samples in seconds to throughput and millisecond percentiles."""
+    total = sum(samples)
+    return {
+        "count": len(samples),
+        "ops_per_s": round(len(samples) / total, 1) if total else None,
+        "mean_ms": round(total / len(samples) * 1000, 4),
+        "p50_ms": round(percentile(samples, 50) * 1000, 4),
+        "p95_ms": round(percentile(samples, 95) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+    }
+
+
+def seed_repository(repository: TaskRepositoryPort, size: int):
+    """Adds `size` tasks through the repository and gives them the status mix of the generated files."""
+    chunk = 10000
+    for start in range(0, size, chunk):
+        tasks = repository.add_many([f"Synthetic task number {i} for benchmarking"
+                                     for i in range(start + 1, min(start + chunk, size) + 1)])
+        for task in tasks:
+            task.status = STATUS_MIX[task.id % len(STATUS_MIX)]
+        repository.update_many([task for task in tasks if task.status != TaskStatusEnum.TODO])
+    repository.flush()
+
+
+def open_target(target: str, size: int, temp_dir: str) -> Tuple[TaskRepositoryPort, Optional[float]]:
+    """
+    Creates the dataset of a target and opens it.
+
+    Returns:
+        Tuple[TaskRepositoryPort, Optional[float]]: The repository (the service's
+        repository for "service") and, for stored datasets, the seconds it took
+        to open it and read every task.
+    """
+    if target in ("memory", "service"):
+        repository = create_repository("memory")
+        seed_repository(repository, size)
+        return repository, None
+
+    path = os.path.join(temp_dir, f"tasks-{size}.{target}")
+    if target == "json":
+        write_tasks_json(path, size)
+    elif target == "sqlite":
+        populate_sqlite(path, size)
+    else:
+        repository = create_repository(target, path)
+        seed_repository(repository, size)
+        if hasattr(repository, "close"):
+            repository.close()
+
+    start = time.perf_counter()
+    repository = create_repository(target, path)
+    repository.get_all()
+    return repository, time.perf_counter() - start
+
+
+def measure_operations(target: str, repository: TaskRepositoryPort, size: int, ops: int,
+                       list_repeat: int) -> Dict[str, List[float]]:
+    """Times each operation of the suite on a repository, or through TodoService for the service target."""
+    rng = random.Random(size)
+    get_ids = iter([rng.randint(1, size) for _ in range(ops)])
+    update_ids = iter([rng.randint(1, size) for _ in range(ops)])
+    delete_ids = rng.sample(range(1, size + 1), min(size, ops)) # Deletes run last, so they may hit updated tasks
+    deletes = len(delete_ids)
+    delete_ids = iter(delete_ids)
+
+    if target == "service":
+        service = TodoService(repository)
+        operations: Dict[str, Tuple[Callable[[], Any], int]] = {
+            "add": (lambda: service.add_task("Benchmark task"), ops),
+            "get_by_id": (lambda: service.get_task(next(get_ids)), ops),
+            "update": (lambda: service.complete_task(next(update_ids)), ops),
+            "delete": (lambda: service.remove_task(next(delete_ids)), deletes),
+            "list": (lambda: service.list_tasks(), list_repeat),
+            "list_by_status": (lambda: service.list_tasks(TaskStatusEnum.TODO), list_repeat),
+        }
+    else:
+        def update():
+            task = repository.get_by_id(next(update_ids))
+            task.mark_as_done()
+            repository.update(task)
+
+        operations = {
+            "add": (lambda: repository.add("Benchmark task"), ops),
+            "get_by_id": (lambda: repository.get_by_id(next(get_ids)), ops),
+            "update": (update, ops),
+            "delete": (lambda: repository.delete(next(delete_ids)), deletes),
+            "list": (lambda: repository.get_all(), list_repeat),
+            "list_by_status": (lambda: repository.get_all(status=TaskStatusEnum.TODO), list_repeat),
+        }
+    return {name: time_calls(func, repeat) for name, (func, repeat) in operations.items()}
+
+
+def measure_cli(size: int, temp_dir: str) -> Dict[str, List[float]]:
+    """Times single main.py invocations in fresh interpreters against a generated tasks.json."""
+    path = os.path.join(temp_dir, f"tasks-{size}.json")
+    write_tasks_json(path, size)
+    env = dict(os.environ, TASK_TRACKER_BACKEND="json", TASK_TRACKER_FILE=path,
+               TASK_TRACKER_SOCKET=os.path.join(temp_dir, "no-daemon.sock"))
+    middle = str(size // 2 or 1)
+    commands = {
+        "add": ["add", "Benchmark task"],
+        "get_by_id": ["get", middle],
+        "update": ["mark-done", middle],
+        "list": ["list", "--limit", "20"],
+        "list_by_status": ["list", "--status", "to do", "--limit", "20"],
+    }
+    delete_ids = iter(range(size, 0, -1)) # From the top: away from `middle`, and the adds got new ids
+
+    def run(args: List[str]):
+        subprocess.run([sys.executable, MAIN] + args, env=env, stdout=subprocess.DEVNULL, check=True)
+
+    samples = {name: time_calls(lambda: run(args), CLI_CALLS) for name, args in commands.items()}
+    samples["delete"] = time_calls(lambda: run(["remove", str(next(delete_ids))]), min(size, CLI_CALLS))
+    return samples
+
+
+def run_case(target: str, size: int, ops: int, list_repeat: int) -> Dict[str, Any]:
+    """Runs one target at one size; meant to run in its own child process."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if target == "cli":
+            samples = measure_cli(size, temp_dir)
+        else:
+            repository, load_seconds = open_target(target, size, temp_dir)
+            samples = measure_operations(target, repository, size, ops, list_repeat)
+            if load_seconds is not None:
+                samples["load"] = [load_seconds]
+            if hasattr(repository, "close"):
+                repository.close()
+    # The CLI commands run in their own interpreters; ru_maxrss is in kilobytes on Linux
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if target == "cli" else resource.RUSAGE_SELF)
+    max_rss_mib = usage.ru_maxrss / 1024
+    return {
+        "operations": {name: summarize(values) for name, values in samples.items()},
+        "max_rss_mib": round(max_rss_mib, 1),
+    }
+
+
+def run_suite(sizes: List[int], targets: List[str], ops: int, list_repeat: int) -> Dict[str, Any]:
+    """Runs every target at every size, each in a fresh child process, and collects the results."""
+    results, memory = [], []
+    for size in sizes:
+        for target in targets:
+            print(f"Running {target} with {size} tasks...", file=sys.stderr)
+            with multiprocessing.Pool(1) as pool:
+                case = pool.apply(run_case, (target, size, ops, list_repeat))
+            for operation, summary in case["operations"].items():
+                results.append(dict(target=target, size=size, operation=operation, **summary))
+            memory.append({"target": target, "size": size, "max_rss_mib": case["max_rss_mib"]})
+    return {
+        "format": FORMAT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {"sizes": sizes, "targets": targets, "ops": ops, "list_repeat": list_repeat},
+        "results": results,
+        "memory": memory,
+    }
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """
+    Reads a result file written by `run`.
+
+    Raises:
+        ValueError: If the file is not a result file of this format.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("format") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a benchmark result file of format {FORMAT_VERSION}.")
+    return data
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[List[Any]]:
+    """
+    Lists the figures of `current` that are worse than in `baseline` by more than `threshold`.
+
+    Latencies (LATENCY_METRICS) and peak memory are compared for every case
+    present in both runs; higher is worse. Latency differences below
+    NOISE_FLOOR_MS are ignored.
+
+    Returns:
+        List[List[Any]]: One row per regression: target, size, operation, metric,
+                         baseline value, current value and the relative change.
+    """
+    regressions = []
+
+    def check(key: Tuple[str, int, str], metric: str, old: Optional[float], new: Optional[float], floor: float):
+        if old is None or new is None or new - old <= floor:
+            return
+        if old == 0 or (new - old) / old > threshold:
+            change = f"+{(new - old) / old:.0%}" if old else "new"
+            regressions.append(list(key) + [metric, old, new, change])
+
+    old_results = {(r["target"], r["size"], r["operation"]): r for r in baseline["results"]}
+    for result in current["results"]:
+        key = (result["target"], result["size"], result["operation"])
+        if key in old_results:
+            for metric in LATENCY_METRICS:
+                check(key, metric, old_results[key].get(metric), result.get(metric), NOISE_FLOOR_MS)
+
+    old_memory = {(m["target"], m["size"]): m for m in baseline["memory"]}
+    for entry in current["memory"]:
+        key = (entry["target"], entry["size"])
+        if key in old_memory:
+            check(key + ("-",), "max_rss_mib", old_memory[key]["max_rss_mib"], entry["max_rss_mib"], 0)
+    return regressions
+
+
+def report_comparison(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> int:
+    """Prints the regressions of current against baseline and returns the exit status (1 if any)."""
+    regressions = compare(baseline, current, threshold)
+    if not regressions:
+        print(f"No regressions beyond {threshold:.0%} against the baseline from {baseline['created']}.")
+        return 0
+    print(f"{len(regressions)} regression(s) beyond {threshold:.0%} against the baseline from {baseline['created']}:")
+    print_table(["target", "tasks", "operation", "metric", "baseline", "current", "change"], regressions)
+    return 1
+
+
+def print_results(data: Dict[str, Any]):
+    """Prints the results of a run as tables."""
+    rows = [[r["target"], r["size"], r["operation"], r["count"], r["ops_per_s"], r["p50_ms"], r["p95_ms"], r["p99_ms"]]
+            for r in data["results"]]
+    print_table(["target", "tasks", "operation", "calls", "ops/s", "p50 ms", "p95 ms", "p99 ms"], rows)
+    print()
+    print_table(["target", "tasks", "peak RSS MiB"], [[m["target"], m["size"], m["max_rss_mib"]] for m in data["memory"]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parser_run = subparsers.add_parser("run", help="Run the suite and write the results.")
+    parser_run.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                            help="Dataset sizes (number of tasks) to measure.")
+    parser_run.add_argument("--targets", nargs="+", choices=TARGETS, default=TARGETS, help="Targets to measure.")
+    parser_run.add_argument("--ops", type=int, default=200, help="Calls measured per add, get, update and delete.")
+    parser_run.add_argument("--list-repeat", type=int, default=5, help="Calls measured per list operation.")
+    parser_run.add_argument("--output", default=DEFAULT_OUTPUT, help=f"Result file to write (default: {DEFAULT_OUTPUT}).")
+    parser_run.add_argument("--baseline", default=None, help="Result file to compare the new results with.")
+    parser_run.add_argument("--threshold", type=float, default=0.25,
+                            help="Relative slowdown reported as a regression (default: 0.25, i.e. 25%%).")
+
+    parser_compare = subparsers.add_parser("compare", help="Compare a result file with a baseline.")
+    parser_compare.add_argument("baseline", help="The baseline result file.")
+    parser_compare.add_argument("current", nargs="?", default=DEFAULT_OUTPUT,
+                                help=f"The result file to check (default: {DEFAULT_OUTPUT}).")
+    parser_compare.add_argument("--threshold", type=float, default=0.25,
+                                help="Relative slowdown reported as a regression (default: 0.25, i.e. 25%%).")
+    args = parser.parse_args()
+
+    try:
+        if args.command == "compare":
+            sys.exit(report_comparison(load_results(args.baseline), load_results(args.current), args.threshold))
+
+        baseline = load_results(args.baseline) if args.baseline else None # Fail before the long run, not after
+        data = run_suite(args.sizes, args.targets, args.ops, args.list_repeat)
+    except (IOError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(2)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(data, f, indent=2)
+    print_results(data)
+    print(f"\nResults written to {args.output}")
+    if baseline is not None:
+        sys.exit(report_comparison(baseline, data, args.threshold))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,233 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
-from src.application.TodoService_adapter import TodoService
-from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
-from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
-from src.infrastructure.cli.handler import CLIHandler
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Importing the domain model is a noticeable part of start-up, which commands forwarded to the daemon skip
+    from src.domain.TaskRepository_port import TaskRepositoryPort
+    from src.domain.TodoService_port import TodoServicePort
+    from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+
+def create_metrics() -> Tuple[Optional["MetricsRegistry"], Optional[str]]:
+    """
+    Creates the metrics registry if TASK_TRACKER_METRICS names a file to keep them in.
+
+    Without it nothing is instrumented, so commands pay nothing for metrics.
+
+    Returns:
+        Tuple[Optional[MetricsRegistry], Optional[str]]: The registry and the metrics file, or (None, None).
+    """
+    metrics_path = os.environ.get("TASK_TRACKER_METRICS") or None
+    if metrics_path is None:
+        return None, None
+    from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+    return MetricsRegistry(), metrics_path
+
+def create_service(repository: "TaskRepositoryPort", metrics: Optional["MetricsRegistry"] = None) -> "TodoServicePort":
+    """
+    Creates the Application Core (Service) on top of a repository.
+
+    With a metrics registry both the repository and the service are wrapped
+    so that every call is counted and timed.
+    """
+    from src.application.TodoService_adapter import TodoService
+    if metrics is None:
+        return TodoService(repository=repository)
+    from src.application.InstrumentedTodoService_adapter import InstrumentedTodoService
+    from src.infrastructure.persistence.InstrumentedTaskRepository_adapter import InstrumentedTaskRepository
+    return InstrumentedTodoService(TodoService(repository=InstrumentedTaskRepository(repository, metrics)), metrics)
+
+def create_cache(repository: "TaskRepositoryPort",
+                 metrics: Optional["MetricsRegistry"] = None) -> "TaskRepositoryPort":
+    """
+    Puts a read-through cache in front of a repository if TASK_TRACKER_CACHE_SIZE is set.
+
+    TASK_TRACKER_CACHE_SIZE is the number of tasks cached for lookups by id,
+    and TASK_TRACKER_CACHE_TTL the number of seconds a cached result stays
+    valid. The cache only pays off in a long-running process such as the
+    daemon, as a single command starts with an empty one.
+
+    Cached reads never reach the repository, so they cannot notice changes
+    made by other processes. A store that other processes may write to (the
+    JSON backend runs in multiprocess mode) therefore needs a TTL to bound
+    how stale the cached results can get.
+
+    Raises:
+        ValueError: If a variable is not a number or out of range, or the TTL is
+                    missing for a store that other processes may write to.
+    """
+    size = os.environ.get("TASK_TRACKER_CACHE_SIZE") or None
+    if size is None:
+        return repository
+    ttl = os.environ.get("TASK_TRACKER_CACHE_TTL") or None
+    if ttl is None and getattr(repository, "multiprocess", False):
+        raise ValueError("Set TASK_TRACKER_CACHE_TTL as well when caching a store that other processes "
+                         "may write to, or the cache may serve their changes stale indefinitely.")
+    from src.infrastructure.persistence.CachingTaskRepository_adapter import CachingTaskRepository
+    try:
+        max_tasks, ttl_seconds = int(size), float(ttl) if ttl is not None else None
+    except ValueError:
+        raise ValueError("TASK_TRACKER_CACHE_SIZE must be an integer and TASK_TRACKER_CACHE_TTL a number of seconds.")
+    return CachingTaskRepository(repository, max_tasks=max_tasks, ttl=ttl_seconds, metrics=metrics)
+
+def create_repository(backend: str, file_path: Optional[str] = None,
+                      metrics: Optional["MetricsRegistry"] = None) -> "TaskRepositoryPort":
+    """
+    Creates the Driven Adapter (Persistence) for the given storage backend.
+
+    Only the module of the chosen backend is imported, which keeps the
+    start-up of a single CLI command short.
+
+    Args:
+        backend (str): One of "json" (default), "sharded", "sqlite", "binary" or "memory".
+        file_path (Optional[str]): The storage file to use instead of the backend's default.
+        metrics (Optional[MetricsRegistry]): Receives the load and save phases of the JSON backends.
+
+    Returns:
+        TaskRepositoryPort: The repository to use.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if backend == "json":
+        from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+        # Single-task commands only read up to the task they need, and add only appends to the journal.
+        # Several CLI processes may run at once, so every write locks the files and catches up first.
+        # The search index is saved next to the snapshot so that each search does not rebuild it.
+        return TaskJsonRepository(file_path, journal=True, lazy=True, multiprocess=True, persist_search_index=True,
+                                  metrics=metrics)
+    if backend == "sharded":
+        from src.infrastructure.persistence.TaskShardedJsonRepository_adapter import TaskShardedJsonRepository
+        return TaskShardedJsonRepository(file_path, metrics=metrics)
+    if backend == "sqlite":
+        from src.infrastructure.persistence.TaskSqliteRepository_adapter import TaskSqliteRepository
+        return TaskSqliteRepository(file_path)
+    if backend == "binary":
+        from src.infrastructure.persistence.TaskBinaryRepository_adapter import TaskBinaryRepository
+        return TaskBinaryRepository(file_path)
+    if backend == "memory":
+        from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+        return TaskMemoryRepository()
+    raise ValueError(f"Unknown storage backend '{backend}'. Use 'json', 'sharded', 'sqlite', 'binary' or 'memory'.")
+
+def run_daemon(args: List[str], backend: str, file_path: Optional[str], store: Dict[str, Any]):
+    """
+    Handles `main.py daemon [start|stop|status]`.
+
+    `start` runs the daemon in the foreground until it is stopped with
+    `daemon stop`, Ctrl+C or SIGTERM.
+
+    Args:
+        args (List[str]): The arguments after `daemon`.
+        backend (str): The storage backend to serve.
+        file_path (Optional[str]): The storage file to serve.
+        store (Dict[str, Any]): Identifies the backend and file being served.
+    """
+    import argparse
+    from src.infrastructure.daemon import client
+    from src.infrastructure.daemon.protocol import socket_path_from_env
+
+    parser = argparse.ArgumentParser(prog="task-tracker daemon", description="Run or control the task daemon.")
+    parser.add_argument("action", nargs="?", default="start", choices=["start", "stop", "status"])
+    parser.add_argument("--flush-interval", type=float, default=1.0,
+                        help="Seconds between background saves (default: 1.0).")
+    parsed_args = parser.parse_args(args)
+    socket_path = socket_path_from_env()
+
+    if parsed_args.action == "status":
+        try:
+            response = client.request(socket_path, {"op": "ping"})
+        except OSError as e: # ConnectionError included
+            print(f"Error: Could not reach the task daemon. Error: {e}")
+            sys.exit(1)
+        if response is None:
+            print("No task daemon is running.")
+            sys.exit(1)
+        print(f"Task daemon (pid {response['pid']}) is serving {response['store']} on {socket_path}.")
+        return
+    if parsed_args.action == "stop":
+        try:
+            response = client.request(socket_path, {"op": "shutdown"})
+        except OSError as e: # ConnectionError included
+            print(f"Error: Could not reach the task daemon. Error: {e}")
+            sys.exit(1)
+        if response is None:
+            print("No task daemon is running.")
+            sys.exit(1)
+        print("Task daemon stopped.")
+        return
+
+    import signal
+    import threading
+    from src.infrastructure.daemon.server import TaskDaemon
+
+    metrics, metrics_path = create_metrics()
+    try:
+        task_repository = create_repository(backend, file_path, metrics)
+        # The daemon keeps running, so a cache in front of the repository can answer repeated reads
+        service = create_service(create_cache(task_repository, metrics), metrics)
+        daemon = TaskDaemon(service, socket_path, store, parsed_args.flush_interval,
+                            metrics=metrics, metrics_path=metrics_path)
+    except (ValueError, RuntimeError, OSError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    # shutdown() waits for serve_forever() to return, so it cannot run in the signal handler's thread
+    signal.signal(signal.SIGTERM, lambda signum, frame: threading.Thread(target=daemon.shutdown).start())
+    print(f"Task daemon listening on {socket_path}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if hasattr(task_repository, "close"):
+            task_repository.close()
+        if metrics is not None:
+            metrics.merge_into_file(metrics_path)
 
 def main():
     """
     Main function to set up and run the To-Do CLI application.
     """
+    args = sys.argv[1:]
+    backend = os.environ.get("TASK_TRACKER_BACKEND", "json")
+    file_path = os.environ.get("TASK_TRACKER_FILE") or None
+    store = {"backend": backend, "file": os.path.abspath(file_path) if file_path else None}
+
+    if args[:1] == ["daemon"]:
+        run_daemon(args[1:], backend, file_path, store)
+        return
+
+    # 0. Hand the command to a running daemon, if there is one for this store
+    from src.infrastructure.daemon.client import forward
+    from src.infrastructure.daemon.protocol import socket_path_from_env
+    exit_code = forward(args, store, socket_path_from_env())
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from src.infrastructure.cli.handler import CLIHandler
+
     # 1. Choose and initialize the Driven Adapter (Persistence)
-    # task_repository = TaskMemoryRepository()
-    task_repository = TaskJsonRepository()
+    metrics, metrics_path = create_metrics()
+    try:
+        task_repository = create_repository(backend, file_path, metrics)
+    except ValueError as ve:
+        print(f"Error: {ve}")
+        sys.exit(1)
 
     # 2. Initialize the Application Core (Service)
-    todo_service = TodoService(repository=task_repository)
+    todo_service = create_service(task_repository, metrics)
 
     # 3. Initialize the Driving Adapter (CLI)
-    cli_handler = CLIHandler(service=todo_service)
+    cli_handler = CLIHandler(service=todo_service, metrics=metrics, metrics_path=metrics_path)
 
     # 4. Run the application by letting the CLI handler process command-line arguments
-    cli_handler.handle()
+    try:
+        cli_handler.handle(args)
+    finally:
+        # The handler exits the process on errors, whose calls are worth keeping too
+        if metrics is not None:
+            metrics.merge_into_file(metrics_path)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
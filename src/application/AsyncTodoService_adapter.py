@@ -0,0 +1,253 @@
+from typing import AsyncIterator, Callable, Optional, List
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.AsyncTodoService_port import AsyncTodoServicePort
+from src.domain.AsyncTaskRepository_port import AsyncTaskRepositoryPort
+import datetime
+
+class AsyncTodoService(AsyncTodoServicePort):
+    """
+    Adapter for the To-Do service in asyncio applications.
+
+    This class implements the AsyncTodoServicePort with the same rules as
+    TodoService, awaiting an AsyncTaskRepositoryPort for persistence.
+    """
+    def __init__(self, repository: AsyncTaskRepositoryPort):
+        """
+        Initializes the AsyncTodoService with an async task repository.
+
+        Args:
+            repository (AsyncTaskRepositoryPort): The repository to be used for task persistence.
+        """
+        self.repository = repository
+
+    async def add_task(self, description: str) -> Task:
+        """
+        Adds a new task.
+
+        Args:
+            description (str): The description of the task.
+
+        Returns:
+            Task: The newly created task.
+
+        Raises:
+            ValueError: If the description is empty or whitespace.
+        """
+        if not description or not description.strip():
+            raise ValueError("Task description cannot be empty.")
+
+        return await self.repository.add(description=description)
+
+    async def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Retrieves a specific task by its ID.
+
+        Args:
+            task_id (int): The ID of the task to retrieve.
+
+        Returns:
+            Optional[Task]: The task if found, otherwise None.
+        """
+        return await self.repository.get_by_id(task_id)
+
+    async def list_tasks(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                         offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """
+        Lists tasks in ID order, optionally filtered by status and paginated.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID.
+
+        Returns:
+            List[Task]: A list of tasks.
+
+        Raises:
+            ValueError: If limit or offset is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("The page limit cannot be negative.")
+        if offset < 0:
+            raise ValueError("The page offset cannot be negative.")
+        if limit is None and not offset and after_id is None:
+            return await self.repository.get_all(status=status) # Also works with repositories that predate pagination
+        return await self.repository.get_all(status=status, limit=limit, offset=offset, after_id=after_id)
+
+    async def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> AsyncIterator[Task]:
+        """
+        Iterates over tasks in ID order, optionally filtered by status.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+
+        Yields:
+            Task: The tasks, fetched from the repository one page at a time.
+        """
+        async for task in self.repository.iter_tasks(status=status, after_id=after_id):
+            yield task
+
+    async def search_tasks(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description contains every word of a query.
+
+        Args:
+            query (str): Space-separated words that must all occur in the description.
+                         A word ending in `*` matches any word starting with it.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+
+        Raises:
+            ValueError: If the query does not contain any word.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty.")
+        return await self.repository.search(query)
+
+    async def list_tasks_in_range(self, since: Optional[datetime.datetime] = None,
+                                  until: Optional[datetime.datetime] = None, field: str = "updatedAt",
+                                  status: Optional[TaskStatusEnum] = None) -> List[Task]:
+        """
+        Lists the tasks created or last updated within the half-open range [since, until).
+
+        Args:
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+            field (str): The timestamp to compare, "updatedAt" (default) or "createdAt".
+            status (Optional[TaskStatusEnum]): Only tasks with this status. If None, every status.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the timestamp and then by ID.
+
+        Raises:
+            ValueError: If field is not a timestamp field or since is after until.
+        """
+        if since is not None and until is not None and since > until:
+            raise ValueError("The start of the time range cannot be after its end.")
+        tasks = await self.repository.get_in_range(field=field, since=since, until=until)
+        return [task for task in tasks if task.status == status] if status else tasks
+
+    async def complete_task(self, task_id: int) -> Optional[Task]:
+        """
+        Marks a task as completed.
+
+        Args:
+            task_id (int): The ID of the task to complete.
+
+        Returns:
+            Optional[Task]: The updated task if found and completed, otherwise None.
+        """
+        task = await self.repository.get_by_id(task_id)
+        if task:
+            task.mark_as_done() # This will also update the updatedAt timestamp
+            return await self.repository.update(task)
+
+        return None
+
+    async def begin_task(self, task_id: int) -> Optional[Task]:
+        """
+        Marks a task as in progress.
+
+        Args:
+            task_id (int): The ID of the task to mark as in progress.
+
+        Returns:
+            Optional[Task]: The updated task if found and marked, otherwise None.
+        """
+        task = await self.repository.get_by_id(task_id)
+        if task:
+            task.mark_as_inprogress() # This will also update the updatedAt timestamp
+            return await self.repository.update(task)
+
+        return None
+
+    async def remove_task(self, task_id: int) -> bool:
+        """
+        Removes a task.
+
+        Args:
+            task_id (int): The ID of the task to remove.
+
+        Returns:
+            bool: True if the task was removed successfully, False otherwise.
+        """
+        return await self.repository.delete(task_id)
+
+    async def add_tasks(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks at once.
+
+        Every description is validated before any task is added, so an invalid
+        description leaves the repository untouched.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+
+        Raises:
+            ValueError: If any description is empty or whitespace.
+        """
+        for description in descriptions:
+            if not description or not description.strip():
+                raise ValueError("Task description cannot be empty.")
+
+        return await self.repository.add_many(descriptions)
+
+    async def complete_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as completed.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to complete.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        return await self._update_tasks(task_ids, Task.mark_as_done)
+
+    async def begin_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as in progress.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to mark as in progress.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        return await self._update_tasks(task_ids, Task.mark_as_inprogress)
+
+    async def remove_tasks(self, task_ids: List[int]) -> List[bool]:
+        """
+        Removes several tasks.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to remove.
+
+        Returns:
+            List[bool]: For each ID, True if the task was removed, False otherwise.
+        """
+        return await self.repository.delete_many(task_ids)
+
+    async def flush(self):
+        """
+        Persists any changes that are still buffered.
+        """
+        await self.repository.flush()
+
+    async def _update_tasks(self, task_ids: List[int], change: Callable[[Task], None]) -> List[Optional[Task]]:
+        """Applies `change` to every task that exists and stores them with one batch update."""
+        tasks = [await self.repository.get_by_id(task_id) for task_id in task_ids]
+        found = [task for task in tasks if task]
+        for task in found:
+            change(task) # This will also update the updatedAt timestamp
+        updated = iter(await self.repository.update_many(found) if found else [])
+        return [next(updated) if task else None for task in tasks]
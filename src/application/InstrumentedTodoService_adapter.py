@@ -0,0 +1,122 @@
+from contextlib import AbstractContextManager
+from time import perf_counter
+from typing import Any, Iterator, Optional, List
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TodoService_port import TodoServicePort
+from src.domain.TaskRepository_port import TaskRepositoryPort
+import datetime
+
+class InstrumentedTodoService(TodoServicePort):
+    """
+    A TodoServicePort that records the latency of every call to another service.
+
+    Each call is observed in the `service_call_seconds` histogram with a
+    `method` label, and calls that raise (including rejected input) also
+    increment `service_call_errors_total`. Together with an instrumented
+    repository underneath, the difference between the two histograms shows
+    the time spent in the service itself.
+
+    Attributes:
+        service (TodoServicePort): The wrapped service.
+        metrics (MetricsRecorderPort): Where the figures are recorded.
+    """
+    def __init__(self, service: TodoServicePort, metrics: MetricsRecorderPort):
+        """
+        Initializes the InstrumentedTodoService.
+
+        Args:
+            service (TodoServicePort): The service to measure.
+            metrics (MetricsRecorderPort): Where the figures are recorded.
+        """
+        self.service = service
+        self.metrics = metrics
+
+    @property
+    def repository(self) -> TaskRepositoryPort:
+        """The repository of the wrapped service."""
+        return self.service.repository
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Calls a method of the wrapped service and records its latency and failure."""
+        start = perf_counter()
+        try:
+            return getattr(self.service, method)(*args)
+        except Exception:
+            self.metrics.inc("service_call_errors_total", method=method)
+            raise
+        finally:
+            self.metrics.observe("service_call_seconds", perf_counter() - start, method=method)
+
+    def add_task(self, description: str) -> Task:
+        """Adds a new task."""
+        return self._call("add_task", description)
+
+    def get_task(self, task_id: int) -> Optional[Task]:
+        """Retrieves a specific task by its ID."""
+        return self._call("get_task", task_id)
+
+    def list_tasks(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                   offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Lists tasks, optionally filtered by status and paginated."""
+        return self._call("list_tasks", status, limit, offset, after_id)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over tasks, timing the whole iteration."""
+        start = perf_counter()
+        try:
+            yield from self.service.iter_tasks(status, after_id)
+        except Exception:
+            self.metrics.inc("service_call_errors_total", method="iter_tasks")
+            raise
+        finally:
+            self.metrics.observe("service_call_seconds", perf_counter() - start, method="iter_tasks")
+
+    def search_tasks(self, query: str) -> List[Task]:
+        """Finds the tasks whose description contains every word of a query."""
+        return self._call("search_tasks", query)
+
+    def list_tasks_in_range(self, since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                            field: str = "updatedAt", status: Optional[TaskStatusEnum] = None) -> List[Task]:
+        """Lists the tasks created or last updated within a time range."""
+        return self._call("list_tasks_in_range", since, until, field, status)
+
+    def complete_task(self, task_id: int) -> Optional[Task]:
+        """Marks a task as completed."""
+        return self._call("complete_task", task_id)
+
+    def begin_task(self, task_id: int) -> Optional[Task]:
+        """Marks a task as in progress."""
+        return self._call("begin_task", task_id)
+
+    def remove_task(self, task_id: int) -> bool:
+        """Removes a task."""
+        return self._call("remove_task", task_id)
+
+    def add_tasks(self, descriptions: List[str]) -> List[Task]:
+        """Adds several new tasks at once."""
+        return self._call("add_tasks", descriptions)
+
+    def complete_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """Marks several tasks as completed."""
+        return self._call("complete_tasks", task_ids)
+
+    def begin_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """Marks several tasks as in progress."""
+        return self._call("begin_tasks", task_ids)
+
+    def remove_tasks(self, task_ids: List[int]) -> List[bool]:
+        """Removes several tasks."""
+        return self._call("remove_tasks", task_ids)
+
+    def defer_writes(self) -> AbstractContextManager:
+        """Returns the wrapped service's context manager that batches persistence."""
+        return self.service.defer_writes()
+
+    def flush(self):
+        """Persists any changes buffered by defer_writes() so far."""
+        self._call("flush")
+
+    def transaction(self) -> AbstractContextManager:
+        """Returns the wrapped service's transaction; the calls inside it are still recorded."""
+        return self.service.transaction()
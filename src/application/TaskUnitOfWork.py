@@ -0,0 +1,161 @@
+import copy
+import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+class TaskUnitOfWork(TaskRepositoryPort):
+    """
+    A TaskRepositoryPort that stages every change in memory until commit().
+
+    TodoService.transaction() puts one in front of its repository for the
+    duration of the block. Nothing reaches the real repository before
+    commit(). commit() then checks that the tasks it changes still exist and
+    applies the staged changes with one update_many(), delete_many() and
+    add_many() inside the repository's defer_writes(), so they are persisted
+    with a single write on repositories that buffer writes. A transaction
+    that is abandoned is simply dropped, and the repository never sees it.
+
+    Reads inside the transaction see its own changes. The service changes
+    the tasks it reads in place before passing them to update(), so every
+    task handed out is a copy, and the stored task stays untouched until
+    commit. Tasks added inside the transaction get provisional negative ids.
+    They sort after the stored tasks, and commit() gives the returned Task
+    objects their real ids. Listing, search and time range queries inside
+    a transaction read every task of the repository to merge in the staged
+    changes.
+
+    Attributes:
+        repository (TaskRepositoryPort): The repository the changes are committed to.
+    """
+    def __init__(self, repository: TaskRepositoryPort):
+        """
+        Initializes the unit of work.
+
+        Args:
+            repository (TaskRepositoryPort): The repository the changes are committed to.
+        """
+        self.repository = repository
+        self._changed: Dict[int, Optional[Task]] = {} # Staged version of stored tasks by id; None once deleted
+        self._added: Dict[int, Task] = {} # Tasks added in this transaction by provisional id
+        self._next_provisional_id: int = -1
+
+    @staticmethod
+    def _order(task_id: int) -> Tuple[bool, int]:
+        """Sort key that puts provisional ids (-1, -2, ...) after the stored ids, in the order they were added."""
+        return task_id < 0, abs(task_id)
+
+    def add(self, description: str) -> Task:
+        """Stages a new task under a provisional id."""
+        current_time = datetime.datetime.now()
+        task = Task(
+            id=self._next_provisional_id,
+            description=description,
+            status=TaskStatusEnum.TODO,
+            createdAt=current_time,
+            updatedAt=current_time
+        )
+        self._added[task.id] = task
+        self._next_provisional_id -= 1
+        return task
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task as changed by this transaction, or a copy of the stored one."""
+        if task_id < 0:
+            return self._added.get(task_id)
+        if task_id in self._changed:
+            return self._changed[task_id]
+        task = self.repository.get_by_id(task_id)
+        return copy.copy(task) if task is not None else None
+
+    def _exists(self, task_id: int) -> bool:
+        """Returns True if the task exists as seen from inside this transaction."""
+        if task_id < 0:
+            return task_id in self._added
+        if task_id in self._changed:
+            return self._changed[task_id] is not None
+        return self.repository.get_by_id(task_id) is not None
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves the stored tasks merged with the staged changes, optionally filtered and paginated."""
+        return self._page(self.iter_tasks(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the stored tasks merged with the staged changes, in ID order, new tasks last."""
+        tasks = [copy.copy(task) for task in self.repository.get_all() if task.id not in self._changed]
+        tasks += [task for task in self._changed.values() if task is not None]
+        tasks += self._added.values()
+        tasks.sort(key=lambda task: self._order(task.id))
+        after = self._order(after_id) if after_id is not None else None
+        return iter([task for task in tasks if (status is None or task.status == status) and
+                     (after is None or self._order(task.id) > after)])
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Stages a changed task."""
+        if not self._exists(task.id):
+            return None
+        task.updatedAt = datetime.datetime.now() # Ensure updatedAt is current
+        if task.id < 0:
+            self._added[task.id] = task
+        else:
+            self._changed[task.id] = task
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Stages the removal of a task."""
+        if not self._exists(task_id):
+            return False
+        if task_id < 0:
+            del self._added[task_id]
+        else:
+            self._changed[task_id] = None
+        return True
+
+    def commit(self):
+        """
+        Applies the staged changes to the repository.
+
+        Every stored task that the transaction changed or deleted is checked
+        first, so a task that disappeared in the meantime fails the commit
+        before anything is applied. The changes are then applied in a few
+        batch calls inside the repository's defer_writes(), which persists
+        them with a single write on repositories that buffer writes.
+
+        The tasks added in the transaction are created in the order they were
+        added. A status they were given inside the transaction is stored with
+        them, and the returned Task objects are updated with their real ids
+        and timestamps.
+
+        The batch calls are not atomic as a whole: if the repository fails
+        partway (e.g. a database error), the steps already applied stay
+        applied and are persisted with the rest of the deferred writes.
+
+        Raises:
+            ValueError: If a task changed or deleted in the transaction no longer exists.
+        """
+        missing = [task_id for task_id in self._changed if self.repository.get_by_id(task_id) is None]
+        if missing:
+            self._changed, self._added = {}, {}
+            raise ValueError(f"Tasks {', '.join(map(str, missing))} no longer exist; the transaction was not applied.")
+        with self.repository.defer_writes():
+            updated = [task for task in self._changed.values() if task is not None]
+            if updated:
+                self.repository.update_many(updated)
+            deleted = [task_id for task_id, task in self._changed.items() if task is None]
+            if deleted:
+                self.repository.delete_many(deleted)
+            added = list(self._added.values())
+            if added:
+                created = self.repository.add_many([task.description for task in added])
+                changed_status = []
+                for provisional, task in zip(added, created):
+                    if provisional.status != task.status:
+                        task.status = provisional.status
+                        changed_status.append(task)
+                if changed_status:
+                    self.repository.update_many(changed_status)
+                for provisional, task in zip(added, created):
+                    provisional.id, provisional.createdAt, provisional.updatedAt = task.id, task.createdAt, task.updatedAt
+        self._changed, self._added = {}, {}
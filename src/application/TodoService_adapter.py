@@ -1,7 +1,10 @@
-from typing import Optional, List
+from contextlib import AbstractContextManager, contextmanager
+from typing import Callable, Iterator, Optional, List
+from src.application.TaskUnitOfWork import TaskUnitOfWork
 from src.domain.Task import Task, TaskStatusEnum
 from src.domain.TodoService_port import TodoServicePort
 from src.domain.TaskRepository_port import TaskRepositoryPort
+import datetime
 
 class TodoService(TodoServicePort):
     """
@@ -49,18 +52,89 @@ class TodoService(TodoServicePort):
         """
         return self.repository.get_by_id(task_id)
     
-    def list_tasks(self, status: Optional[TaskStatusEnum] = None) -> List[Task]:
+    def list_tasks(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                   offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
         """
-        Lists all tasks, optionally filtered by status.
+        Lists tasks in ID order, optionally filtered by status and paginated.
 
         Args:
             status (Optional[TaskStatusEnum]): The status to filter tasks by. 
                                               If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID.
 
         Returns:
             List[Task]: A list of tasks.
+
+        Raises:
+            ValueError: If limit or offset is negative.
+        """
+        if limit is not None and limit < 0:
+            raise ValueError("The page limit cannot be negative.")
+        if offset < 0:
+            raise ValueError("The page offset cannot be negative.")
+        if limit is None and not offset and after_id is None:
+            return self.repository.get_all(status=status) # Also works with repositories that predate pagination
+        return self.repository.get_all(status=status, limit=limit, offset=offset, after_id=after_id)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterates over tasks in ID order, optionally filtered by status.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+
+        Returns:
+            Iterator[Task]: The tasks, produced as the repository reads them.
         """
-        return self.repository.get_all(status=status)
+        return self.repository.iter_tasks(status=status, after_id=after_id)
+
+    def search_tasks(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description contains every word of a query.
+
+        Args:
+            query (str): Space-separated words that must all occur in the description.
+                         A word ending in `*` matches any word starting with it.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+
+        Raises:
+            ValueError: If the query does not contain any word.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty.")
+        return self.repository.search(query)
+
+    def list_tasks_in_range(self, since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                            field: str = "updatedAt", status: Optional[TaskStatusEnum] = None) -> List[Task]:
+        """
+        Lists the tasks created or last updated within the half-open range [since, until).
+
+        The repository finds the range through its timestamp index where it
+        has one; the status filter is applied to the tasks in the range.
+
+        Args:
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+            field (str): The timestamp to compare, "updatedAt" (default) or "createdAt".
+            status (Optional[TaskStatusEnum]): Only tasks with this status. If None, every status.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the timestamp and then by ID.
+
+        Raises:
+            ValueError: If field is not a timestamp field or since is after until.
+        """
+        if since is not None and until is not None and since > until:
+            raise ValueError("The start of the time range cannot be after its end.")
+        tasks = self.repository.get_in_range(field=field, since=since, until=until)
+        return [task for task in tasks if task.status == status] if status else tasks
 
     def complete_task(self, task_id: int) -> Optional[Task]:
         """
@@ -106,4 +180,119 @@ class TodoService(TodoServicePort):
         Returns:
             bool: True if the task was removed successfully, False otherwise.
         """
-        return self.repository.delete(task_id)
\ No newline at end of file
+        return self.repository.delete(task_id)
+
+    def add_tasks(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks at once.
+
+        Every description is validated before any task is added, so an invalid
+        description leaves the repository untouched.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+
+        Raises:
+            ValueError: If any description is empty or whitespace.
+        """
+        for description in descriptions:
+            if not description or not description.strip():
+                raise ValueError("Task description cannot be empty.")
+
+        return self.repository.add_many(descriptions)
+
+    def complete_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as completed.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to complete.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        return self._update_tasks(task_ids, Task.mark_as_done)
+
+    def begin_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as in progress.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to mark as in progress.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        return self._update_tasks(task_ids, Task.mark_as_inprogress)
+
+    def remove_tasks(self, task_ids: List[int]) -> List[bool]:
+        """
+        Removes several tasks.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to remove.
+
+        Returns:
+            List[bool]: For each ID, True if the task was removed, False otherwise.
+        """
+        return self.repository.delete_many(task_ids)
+
+    def defer_writes(self) -> AbstractContextManager:
+        """
+        Returns a context manager that batches the persistence of the enclosed operations.
+
+        Returns:
+            AbstractContextManager: Persists all buffered changes when it exits.
+        """
+        return self.repository.defer_writes()
+
+    def flush(self):
+        """
+        Persists any changes buffered by defer_writes() so far.
+        """
+        self.repository.flush()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Runs the enclosed operations as one unit of work.
+
+        For the duration of the block the service works on a TaskUnitOfWork
+        in front of its repository, which stages every change in memory. If
+        the block exits normally, the changes are applied with
+        TaskUnitOfWork.commit(); if it raises, they are dropped and the
+        repository is left as it was. A transaction opened inside another one
+        joins it.
+        The service should not be shared with other threads while a
+        transaction is open.
+
+        Example:
+            with service.transaction():
+                service.complete_tasks([1, 2, 3])
+                service.add_tasks(["Follow up with Ann", "Book the room"])
+
+        Raises:
+            ValueError: If a task changed in the block was deleted from the repository meanwhile.
+        """
+        if isinstance(self.repository, TaskUnitOfWork):
+            yield # Part of the enclosing transaction
+            return
+        unit_of_work = TaskUnitOfWork(self.repository)
+        self.repository = unit_of_work
+        try:
+            yield
+        finally:
+            self.repository = unit_of_work.repository
+        unit_of_work.commit()
+
+    def _update_tasks(self, task_ids: List[int], change: Callable[[Task], None]) -> List[Optional[Task]]:
+        """Applies `change` to every task that exists and stores them with one batch update."""
+        tasks = [self.repository.get_by_id(task_id) for task_id in task_ids]
+        found = [task for task in tasks if task]
+        for task in found:
+            change(task) # This will also update the updatedAt timestamp
+        updated = iter(self.repository.update_many(found) if found else [])
+        return [next(updated) if task else None for task in tasks]
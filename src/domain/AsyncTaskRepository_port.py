@@ -0,0 +1,198 @@
+from abc import ABC, abstractmethod
+from src.domain.SearchQuery import SearchQuery
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import ITER_PAGE_SIZE, TaskRepositoryPort
+from typing import AsyncIterator, Optional, List
+import datetime
+
+class AsyncTaskRepositoryPort(ABC):
+    """
+    Port (Interface) for task repository operations in asyncio applications.
+
+    This is the awaitable counterpart of TaskRepositoryPort. Adapters must not
+    block the event loop: blocking I/O belongs on an executor.
+    """
+    @abstractmethod
+    async def add(self, description: str) -> Task:
+        """
+        Adds a new task with the given description.
+
+        Args:
+            description (str): The description of the task.
+
+        Returns:
+            Task: The newly created task.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                      offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """
+        Retrieves tasks in ID order, optionally filtered by status and paginated.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID.
+
+        Returns:
+            List[Task]: A list of tasks.
+        """
+        pass
+
+    async def iter_tasks(self, status: Optional[TaskStatusEnum] = None,
+                         after_id: Optional[int] = None) -> AsyncIterator[Task]:
+        """
+        Yields tasks in ID order, optionally filtered by status.
+
+        Tasks are fetched in keyset pages of ITER_PAGE_SIZE through get_all(),
+        so the event loop gets control back between pages.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+        """
+        while True:
+            page = await self.get_all(status=status, limit=ITER_PAGE_SIZE, after_id=after_id)
+            for task in page:
+                yield task
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            after_id = page[-1].id
+
+    async def search(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description matches a full-text query.
+
+        The default implementation checks every task returned by get_all().
+
+        Args:
+            query (str): Space-separated words that must all occur; `word*` matches a prefix.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+
+        Raises:
+            ValueError: If the query does not contain any word.
+        """
+        parsed = SearchQuery.parse(query)
+        return [task for task in await self.get_all() if parsed.matches(task.description)]
+
+    async def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                           until: Optional[datetime.datetime] = None) -> List[Task]:
+        """
+        Retrieves the tasks whose createdAt or updatedAt lies in [since, until).
+
+        The default implementation checks every task returned by get_all().
+
+        Args:
+            field (str): "createdAt" or "updatedAt".
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the field and then by ID.
+
+        Raises:
+            ValueError: If field is not a timestamp field.
+        """
+        TaskRepositoryPort._check_time_field(field)
+        tasks = [task for task in await self.get_all()
+                 if (since is None or getattr(task, field) >= since) and (until is None or getattr(task, field) < until)]
+        tasks.sort(key=lambda task: (getattr(task, field), task.id))
+        return tasks
+
+    @abstractmethod
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Retrieves a task by its unique identifier.
+
+        Args:
+            task_id (int): The ID of the task to retrieve.
+
+        Returns:
+            Optional[Task]: The task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: int) -> bool:
+        """
+        Deletes a task by its unique identifier.
+
+        Args:
+            task_id (int): The ID of the task to delete.
+
+        Returns:
+            bool: True if the task was deleted successfully, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, task: Task) -> Optional[Task]:
+        """
+        Updates an existing task.
+
+        Args:
+            task (Task): The task object with updated information.
+
+        Returns:
+            Optional[Task]: The updated task if found and updated, otherwise None.
+        """
+        pass
+
+    async def add_many(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks.
+
+        The default implementation awaits add() for each description.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks, in order.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+        """
+        return [await self.add(description) for description in descriptions]
+
+    async def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """
+        Updates several existing tasks.
+
+        The default implementation awaits update() for each task.
+
+        Args:
+            tasks (List[Task]): The task objects with updated information.
+
+        Returns:
+            List[Optional[Task]]: For each task, the updated task if found, otherwise None.
+        """
+        return [await self.update(task) for task in tasks]
+
+    async def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """
+        Deletes several tasks by their unique identifiers.
+
+        The default implementation awaits delete() for each ID.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to delete.
+
+        Returns:
+            List[bool]: For each ID, True if the task was deleted, False otherwise.
+        """
+        return [await self.delete(task_id) for task_id in task_ids]
+
+    async def flush(self):
+        """
+        Persists any writes that are still buffered.
+
+        The default implementation does nothing, for adapters that persist
+        every mutation before returning.
+        """
+        pass
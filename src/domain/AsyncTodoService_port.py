@@ -0,0 +1,201 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional, List
+import datetime
+from src.domain.Task import Task, TaskStatusEnum
+
+class AsyncTodoServicePort(ABC):
+    """
+    Port (Interface) for the To-Do service operations in asyncio applications.
+
+    This is the awaitable counterpart of TodoServicePort.
+    """
+    @abstractmethod
+    async def add_task(self, description: str) -> Task:
+        """
+        Adds a new task.
+
+        Args:
+            description (str): The description of the task.
+
+        Returns:
+            Task: The newly created task.
+        """
+        pass
+
+    @abstractmethod
+    async def get_task(self, task_id: int) -> Optional[Task]:
+        """
+        Retrieves a specific task by its ID.
+
+        Args:
+            task_id (int): The ID of the task to retrieve.
+
+        Returns:
+            Optional[Task]: The task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def list_tasks(self, status: Optional[TaskStatusEnum], limit: Optional[int] = None,
+                   offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """
+        Lists tasks in ID order, optionally filtered by status and paginated.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID, to continue
+                                      after the last task of the previous page.
+
+        Returns:
+            List[Task]: A list of tasks.
+        """
+        pass
+
+    @abstractmethod
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> AsyncIterator[Task]:
+        """
+        Iterates over tasks in ID order, optionally filtered by status.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+
+        Returns:
+            AsyncIterator[Task]: The tasks, fetched from the repository one page at a time.
+        """
+        pass
+
+    @abstractmethod
+    async def search_tasks(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description contains every word of a query.
+
+        Args:
+            query (str): Space-separated words that must all occur in the description.
+                         A word ending in `*` matches any word starting with it.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+        """
+        pass
+
+    @abstractmethod
+    async def list_tasks_in_range(self, since: Optional[datetime.datetime] = None,
+                                  until: Optional[datetime.datetime] = None, field: str = "updatedAt",
+                                  status: Optional[TaskStatusEnum] = None) -> List[Task]:
+        """
+        Lists the tasks created or last updated within a time range.
+
+        Args:
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+            field (str): The timestamp to compare, "updatedAt" (default) or "createdAt".
+            status (Optional[TaskStatusEnum]): Only tasks with this status. If None, every status.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the timestamp and then by ID.
+        """
+        pass
+
+    @abstractmethod
+    async def complete_task(self, task_id: int) -> Optional[Task]:
+        """
+        Marks a task as completed.
+
+        Args:
+            task_id (int): The ID of the task to complete.
+
+        Returns:
+            Optional[Task]: The updated task if found and completed, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def begin_task(self, task_id: int) -> Optional[Task]:
+        """
+        Marks a task as in progress.
+
+        Args:
+            task_id (int): The ID of the task to mark as in progress.
+
+        Returns:
+            Optional[Task]: The updated task if found and marked, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_task(self, task_id: int) -> bool:
+        """
+        Removes a task.
+
+        Args:
+            task_id (int): The ID of the task to remove.
+
+        Returns:
+            bool: True if the task was removed successfully, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def add_tasks(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks at once.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+        """
+        pass
+
+    @abstractmethod
+    async def complete_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as completed.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to complete.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def begin_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as in progress.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to mark as in progress.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    async def remove_tasks(self, task_ids: List[int]) -> List[bool]:
+        """
+        Removes several tasks.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to remove.
+
+        Returns:
+            List[bool]: For each ID, True if the task was removed, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def flush(self):
+        """
+        Persists any changes that are still buffered.
+        """
+        pass
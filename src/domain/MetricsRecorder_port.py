@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator
+
+class MetricsRecorderPort(ABC):
+    """
+    Port (Interface) for recording operational metrics.
+
+    Instrumented adapters report how long each call or phase took and how
+    much it did (e.g. bytes written) through this interface, without knowing
+    where the figures end up. Metric names follow the Prometheus conventions:
+    durations are in seconds and end in `_seconds`, and counters end in
+    `_total`. Labels tell apart the series of one metric, e.g. the method.
+    """
+    @abstractmethod
+    def observe(self, name: str, seconds: float, **labels: str):
+        """
+        Records one duration in the latency histogram of a metric.
+
+        Args:
+            name (str): The metric name, e.g. "repository_call_seconds".
+            seconds (float): The duration to record.
+            **labels (str): The labels of the series, e.g. method="add".
+        """
+        pass
+
+    @abstractmethod
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The metric name, e.g. "json_bytes_written_total".
+            amount (float): The amount to add.
+            **labels (str): The labels of the series.
+        """
+        pass
+
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        """
+        Records the duration of the enclosed block with observe().
+
+        The duration is recorded even if the block raises, so failed calls
+        still show up in the latency histogram.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - start, **labels)
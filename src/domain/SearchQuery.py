@@ -0,0 +1,65 @@
+import re
+from typing import List, Tuple
+
+WORD = re.compile(r"\w+")
+
+def tokenize(text: str) -> List[str]:
+    """Splits text into lowercase word tokens, the unit that task descriptions are searched by."""
+    return WORD.findall(text.lower())
+
+class SearchQuery:
+    """
+    A parsed full-text search query over task descriptions.
+
+    A query is a list of words that must all occur in a description (AND).
+    Matching ignores case and punctuation, so "E-mail" is the two words "e"
+    and "mail". A word ending in `*` matches every word that starts with it,
+    e.g. `mil*` matches "milk" and "milestone".
+
+    Attributes:
+        terms (Tuple[str, ...]): Words that must occur exactly.
+        prefixes (Tuple[str, ...]): Prefixes that must start some word.
+    """
+    def __init__(self, terms: Tuple[str, ...], prefixes: Tuple[str, ...]):
+        """
+        Initializes the query; use SearchQuery.parse() to build one from text.
+
+        Args:
+            terms (Tuple[str, ...]): Lowercase words that must occur exactly.
+            prefixes (Tuple[str, ...]): Lowercase prefixes that must start some word.
+        """
+        self.terms = terms
+        self.prefixes = prefixes
+
+    @classmethod
+    def parse(cls, query: str) -> "SearchQuery":
+        """
+        Parses a query string.
+
+        Args:
+            query (str): Space-separated words, optionally ending in `*`.
+
+        Returns:
+            SearchQuery: The parsed query.
+
+        Raises:
+            ValueError: If the query does not contain any word.
+        """
+        terms, prefixes = [], []
+        for word in query.split():
+            tokens = tokenize(word)
+            if word.endswith("*") and tokens:
+                prefixes.append(tokens.pop())
+            terms.extend(tokens)
+        if not terms and not prefixes:
+            raise ValueError("Search query must contain at least one word.")
+        return cls(tuple(dict.fromkeys(terms)), tuple(dict.fromkeys(prefixes)))
+
+    def matches(self, description: str) -> bool:
+        """Returns True if the description contains every term and a word for every prefix."""
+        tokens = set(tokenize(description))
+        return all(term in tokens for term in self.terms) and \
+               all(any(token.startswith(prefix) for token in tokens) for prefix in self.prefixes)
+
+    def __str__(self) -> str:
+        return " ".join(self.terms + tuple(prefix + "*" for prefix in self.prefixes))
@@ -1,5 +1,5 @@
 from  dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional, Union
 from enum import Enum
 import datetime
 
@@ -11,6 +11,8 @@ class TaskStatusEnum(Enum):
     INPROGRESS = "in progress"
     TODO = "to do"
 
+TIMESTAMP_FIELDS = ("createdAt", "updatedAt") # Task attributes that tasks can be queried by time range on
+
 @dataclass
 class Task:
     """
@@ -49,3 +51,63 @@ class Task:
         status_icon = "✓" if self.status == TaskStatusEnum.DONE else ("⏳" if self.status == TaskStatusEnum.INPROGRESS else "✗")
         return f"[{status_icon}] ID: {self.id} - {self.description}"
 
+
+
+def _lazy_timestamp(name: str) -> property:
+    """
+    Builds a property that stores a timestamp as given and decodes ISO 8601 text on first access.
+
+    A missing timestamp (None) resolves to the time of first access, and the
+    decoded value replaces the text so it is only parsed once. Text that
+    cannot be decoded (such as month 13 in an edited file) is reported and
+    also resolves to the time of first access, rather than failing whatever
+    happened to read the timestamp.
+    """
+    key = "_" + name
+
+    def get(self) -> datetime.datetime:
+        value = self.__dict__[key]
+        if not isinstance(value, datetime.datetime):
+            try:
+                value = datetime.datetime.fromisoformat(value) if value is not None else datetime.datetime.now()
+            except ValueError:
+                print(f"Warning: Task {self.id} has an invalid {name} timestamp '{value}'. Using the current time.")
+                value = datetime.datetime.now()
+            self.__dict__[key] = value
+        return value
+
+    def set(self, value: Union[datetime.datetime, str, None]):
+        self.__dict__[key] = value
+
+    return property(get, set, doc=f"The {name} timestamp, decoded on first access.")
+
+class LazyTask(Task):
+    """
+    A Task loaded from storage whose timestamps are decoded on first access.
+
+    createdAt and updatedAt may be passed as ISO 8601 text (or None when the
+    stored record lacks them). Listing and printing tasks only needs the id,
+    status and description, so most loaded tasks never pay for parsing their
+    timestamps. Reading either attribute returns a datetime as with Task, and
+    a LazyTask compares equal to a Task with the same field values.
+    """
+    createdAt = _lazy_timestamp("createdAt")
+    updatedAt = _lazy_timestamp("updatedAt")
+
+    def timestamp_text(self, name: str) -> str:
+        """
+        Returns a timestamp as ISO 8601 text without decoding it if it is still undecoded.
+
+        Args:
+            name (str): "createdAt" or "updatedAt".
+        """
+        value = self.__dict__["_" + name]
+        if isinstance(value, str):
+            return value
+        return getattr(self, name).isoformat()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        return (self.id, self.description, self.status, self.createdAt, self.updatedAt) == \
+               (other.id, other.description, other.status, other.createdAt, other.updatedAt)
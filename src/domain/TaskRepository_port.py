@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
-from src.domain.Task import Task, TaskStatusEnum
-from typing import Optional, List
+from contextlib import contextmanager
+from src.domain.SearchQuery import SearchQuery
+from src.domain.Task import Task, TaskStatusEnum, TIMESTAMP_FIELDS
+from itertools import islice
+import datetime
+from typing import Iterable, Iterator, Optional, List
+
+ITER_PAGE_SIZE = 1000 # Tasks fetched per get_all() call by the default iter_tasks()
 
 class TaskRepositoryPort(ABC):
     """
@@ -23,19 +29,110 @@ class TaskRepositoryPort(ABC):
         pass
         
     @abstractmethod
-    def get_all(self, status: Optional[TaskStatusEnum] = None) -> List[Task]:
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
         """
-        Retrieves all tasks, optionally filtered by status.
+        Retrieves tasks in ID order, optionally filtered by status and paginated.
+
+        Pages can be taken by position (offset and limit) or by key: passing the
+        ID of the last task of the previous page as after_id lets adapters start
+        the next page where the previous one ended, without counting the tasks
+        that came before it.
 
         Args:
             status (Optional[TaskStatusEnum]): The status to filter tasks by. 
                                               If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID.
 
         Returns:
             List[Task]: A list of tasks.
         """
         pass
 
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """
+        Yields tasks in ID order, optionally filtered by status.
+
+        The default implementation fetches keyset pages of ITER_PAGE_SIZE tasks
+        through get_all(). Adapters override it to stream straight from their
+        storage. Adapters that iterate over their in-memory index must not be
+        changed until the iteration has finished.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+
+        Returns:
+            Iterator[Task]: The tasks, produced as they are read.
+        """
+        while True:
+            page = self.get_all(status=status, limit=ITER_PAGE_SIZE, after_id=after_id)
+            yield from page
+            if len(page) < ITER_PAGE_SIZE:
+                return
+            after_id = page[-1].id
+
+    def search(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description matches a full-text query.
+
+        See SearchQuery for the query syntax. The default implementation
+        checks every task from iter_tasks(); adapters with an inverted index
+        override it to only look at the tasks that contain the query's words.
+
+        Args:
+            query (str): Space-separated words that must all occur; `word*` matches a prefix.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+
+        Raises:
+            ValueError: If the query does not contain any word.
+        """
+        parsed = SearchQuery.parse(query)
+        return [task for task in self.iter_tasks() if parsed.matches(task.description)]
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """
+        Retrieves the tasks whose createdAt or updatedAt lies in a time range.
+
+        The default implementation checks every task from iter_tasks() and
+        sorts the matches; adapters with a sorted timestamp index override it
+        to find the range by binary search.
+
+        Args:
+            field (str): "createdAt" or "updatedAt".
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the field and then by ID.
+
+        Raises:
+            ValueError: If field is not a timestamp field.
+        """
+        self._check_time_field(field)
+        tasks = [task for task in self.iter_tasks()
+                 if (since is None or getattr(task, field) >= since) and (until is None or getattr(task, field) < until)]
+        tasks.sort(key=lambda task: (getattr(task, field), task.id))
+        return tasks
+
+    @staticmethod
+    def _check_time_field(field: str):
+        """Raises ValueError unless field is one of TIMESTAMP_FIELDS."""
+        if field not in TIMESTAMP_FIELDS:
+            raise ValueError(f"Unknown timestamp field '{field}'. Use 'createdAt' or 'updatedAt'.")
+
+    @staticmethod
+    def _page(tasks: Iterable[Task], limit: Optional[int], offset: int) -> List[Task]:
+        """Applies offset and limit to tasks that are already filtered and in ID order."""
+        return list(islice(tasks, offset, None if limit is None else offset + limit))
+
     @abstractmethod
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -74,3 +171,71 @@ class TaskRepositoryPort(ABC):
             Optional[Task]: The updated task if found and updated, otherwise None.
         """
         pass
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks.
+
+        The default implementation calls add() for each description. Adapters
+        override it to apply the whole batch with a single index update and a
+        single persistence write.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks, in order.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+        """
+        return [self.add(description) for description in descriptions]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """
+        Updates several existing tasks.
+
+        The default implementation calls update() for each task.
+
+        Args:
+            tasks (List[Task]): The task objects with updated information.
+
+        Returns:
+            List[Optional[Task]]: For each task, the updated task if found, otherwise None.
+        """
+        return [self.update(task) for task in tasks]
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """
+        Deletes several tasks by their unique identifiers.
+
+        The default implementation calls delete() for each ID.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to delete.
+
+        Returns:
+            List[bool]: For each ID, True if the task was deleted, False otherwise.
+        """
+        return [self.delete(task_id) for task_id in task_ids]
+
+    def flush(self):
+        """
+        Persists any writes that are still buffered.
+
+        The default implementation does nothing, for adapters that persist
+        every mutation immediately.
+        """
+        pass
+
+    @contextmanager
+    def defer_writes(self) -> Iterator[None]:
+        """
+        Lets an adapter buffer mutations and persist them together.
+
+        Inside the block, adapters may keep changes in memory instead of
+        persisting each one; everything is flushed when the block exits. Reads
+        inside the block always see the buffered changes. The default
+        implementation only calls flush() at the end.
+        """
+        try:
+            yield
+        finally:
+            self.flush()
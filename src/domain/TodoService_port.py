@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from contextlib import AbstractContextManager
+from typing import Iterator, Optional, List
+import datetime
 from src.domain.Task import Task, TaskStatusEnum
 
 class TodoServicePort(ABC):
@@ -36,19 +38,71 @@ class TodoServicePort(ABC):
         pass
     
     @abstractmethod
-    def list_tasks(self, status: Optional[TaskStatusEnum]) -> List[Task]:
+    def list_tasks(self, status: Optional[TaskStatusEnum], limit: Optional[int] = None,
+                   offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
         """
-        Lists all tasks, optionally filtered by status.
+        Lists tasks in ID order, optionally filtered by status and paginated.
 
         Args:
             status (Optional[TaskStatusEnum]): The status to filter tasks by. 
                                               If None, all tasks are returned.
+            limit (Optional[int]): The maximum number of tasks to return. If None,
+                                   every matching task is returned.
+            offset (int): The number of matching tasks to skip first.
+            after_id (Optional[int]): Only return tasks with a greater ID, to continue
+                                      after the last task of the previous page.
 
         Returns:
             List[Task]: A list of tasks.
         """
         pass
 
+    @abstractmethod
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterates over tasks in ID order, optionally filtered by status.
+
+        Args:
+            status (Optional[TaskStatusEnum]): The status to filter tasks by.
+                                              If None, all tasks are returned.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+
+        Returns:
+            Iterator[Task]: The tasks, produced as the repository reads them.
+        """
+        pass
+
+    @abstractmethod
+    def search_tasks(self, query: str) -> List[Task]:
+        """
+        Finds the tasks whose description contains every word of a query.
+
+        Args:
+            query (str): Space-separated words that must all occur in the description.
+                         A word ending in `*` matches any word starting with it.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by ID.
+        """
+        pass
+
+    @abstractmethod
+    def list_tasks_in_range(self, since: Optional[datetime.datetime] = None, until: Optional[datetime.datetime] = None,
+                            field: str = "updatedAt", status: Optional[TaskStatusEnum] = None) -> List[Task]:
+        """
+        Lists the tasks created or last updated within a time range.
+
+        Args:
+            since (Optional[datetime.datetime]): Only tasks at or after this time. If None, no lower bound.
+            until (Optional[datetime.datetime]): Only tasks before this time. If None, no upper bound.
+            field (str): The timestamp to compare, "updatedAt" (default) or "createdAt".
+            status (Optional[TaskStatusEnum]): Only tasks with this status. If None, every status.
+
+        Returns:
+            List[Task]: The matching tasks, ordered by the timestamp and then by ID.
+        """
+        pass
+
     @abstractmethod
     def complete_task(self, task_id: int) -> Optional[Task]:
         """
@@ -86,4 +140,89 @@ class TodoServicePort(ABC):
         Returns:
             bool: True if the task was removed successfully, False otherwise.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def add_tasks(self, descriptions: List[str]) -> List[Task]:
+        """
+        Adds several new tasks at once.
+
+        Args:
+            descriptions (List[str]): The descriptions of the tasks.
+
+        Returns:
+            List[Task]: The newly created tasks, in the same order.
+        """
+        pass
+
+    @abstractmethod
+    def complete_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as completed.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to complete.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    def begin_tasks(self, task_ids: List[int]) -> List[Optional[Task]]:
+        """
+        Marks several tasks as in progress.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to mark as in progress.
+
+        Returns:
+            List[Optional[Task]]: For each ID, the updated task if found, otherwise None.
+        """
+        pass
+
+    @abstractmethod
+    def remove_tasks(self, task_ids: List[int]) -> List[bool]:
+        """
+        Removes several tasks.
+
+        Args:
+            task_ids (List[int]): The IDs of the tasks to remove.
+
+        Returns:
+            List[bool]: For each ID, True if the task was removed, False otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def defer_writes(self) -> AbstractContextManager:
+        """
+        Returns a context manager that batches the persistence of the enclosed operations.
+
+        Returns:
+            AbstractContextManager: Persists all buffered changes when it exits.
+        """
+        pass
+
+    @abstractmethod
+    def flush(self):
+        """
+        Persists any changes buffered by defer_writes() so far.
+        """
+        pass
+
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager:
+        """
+        Returns a context manager that stages the enclosed operations and applies them together.
+
+        The changes made inside the block are applied when it exits normally,
+        with a single write where the repository buffers writes, and
+        discarded if it raises. Tasks the block changed are checked before
+        anything is applied, but a storage failure while applying can leave
+        part of the changes applied.
+
+        Returns:
+            AbstractContextManager: Commits the changes when it exits without an exception.
+        """
+        pass
@@ -1,7 +1,48 @@
 import argparse
-from src.application.TodoService_adapter import TodoService
-from src.domain.Task import TaskStatusEnum
+import datetime
+import os
+import re
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from src.infrastructure.cli.options import command_position
+from src.domain.Task import Task, TaskStatusEnum
 
+if TYPE_CHECKING:
+    # Annotations only: main.py builds the service, and decides whether metrics are enabled before importing the registry
+    from src.application.TodoService_adapter import TodoService
+    from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+
+COMMANDS = ("add", "list", "get", "remove", "mark-done", "mark-in-progress", "mark-todo", "search", "batch", "stats")
+OUTPUT_CHUNK_LINES = 1000 # Task lines written to stdout per write() call by list
+TIME_FIELDS = {"updated": "updatedAt", "created": "createdAt"} # list --by choices
+RELATIVE_TIME = re.compile(r"(\d+)([smhdw])")
+TIME_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+def parse_time(text: str) -> datetime.datetime:
+    """
+    Parses a --since/--until value into a local, naive datetime like the task timestamps.
+
+    Args:
+        text (str): An ISO 8601 date or date-time (e.g. "2024-05-01" or
+                    "2024-05-01T09:30"), or a duration before now such as
+                    "90m", "1h", "2d" or "1w".
+
+    Raises:
+        argparse.ArgumentTypeError: If the text is neither.
+    """
+    relative = RELATIVE_TIME.fullmatch(text.strip())
+    if relative:
+        amount, unit = relative.groups()
+        return datetime.datetime.now() - datetime.timedelta(**{TIME_UNITS[unit]: int(amount)})
+    try:
+        value = datetime.datetime.fromisoformat(text.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid time '{text}': use an ISO 8601 date such as 2024-05-01T09:30 or a duration such as 1h or 2d")
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None) # Task timestamps are local and naive
+    return value
 
 class CLIHandler:
     """
@@ -10,19 +51,37 @@ class CLIHandler:
     It uses argparse to define and parse command-line arguments and then
     delegates the operations to the TodoService.
     """
-    def __init__(self, service: TodoService):
+    def __init__(self, service: "TodoService", metrics: Optional["MetricsRegistry"] = None,
+                 metrics_path: Optional[str] = None):
         """
         Initializes the CLIHandler with a TodoService instance.
 
         Args:
             service (TodoService): The service layer to interact with.
+            metrics (Optional[MetricsRegistry]): The figures recorded by this process, if
+                                                 metrics are enabled; shown by `stats`.
+            metrics_path (Optional[str]): The file that the figures of earlier
+                                          commands were merged into.
         """
         self._service = service
-        self.parser = self._setup_parser()
+        self._metrics = metrics
+        self._metrics_path = metrics_path
+        self._parser: Optional[argparse.ArgumentParser] = None
+
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """The argument parser for every command, built on first use."""
+        if self._parser is None:
+            self._parser = self._setup_parser()
+        return self._parser
     
-    def _setup_parser(self) -> argparse.ArgumentParser:
+    def _setup_parser(self, commands: Optional[Iterable[str]] = None) -> argparse.ArgumentParser:
         """
-        Sets up the argparse.ArgumentParser with all the available commands and arguments.
+        Sets up the argparse.ArgumentParser with the available commands and arguments.
+
+        Args:
+            commands (Optional[Iterable[str]]): Only add the subparsers for these commands.
+                                                If None, every command is added.
 
         Returns:
             argparse.ArgumentParser: The configured argument parser.
@@ -32,48 +91,167 @@ class CLIHandler:
             description="A simple command-line task tracker application.",
             epilog="Example: python main.py add \"Buy milk\""
         )
+        profiling = parser.add_argument_group("Profiling (options go before the command)")
+        profiling.add_argument(
+            "--profile",
+            action="store_true",
+            help="Run the command under cProfile and report the slowest functions and the time per phase."
+        )
+        profiling.add_argument(
+            "--trace-memory",
+            action="store_true",
+            help="Run the command under tracemalloc and report peak memory and the top allocation sites."
+        )
+        profiling.add_argument(
+            "--profile-output",
+            type=str,
+            default=None,
+            metavar="FILE",
+            help="Write the profiling report to FILE instead of stderr."
+        )
+        profiling.add_argument(
+            "--profile-top",
+            type=int,
+            default=20,
+            metavar="N",
+            help="Number of functions and allocation sites to report (default: 20)."
+        )
         subparsers = parser.add_subparsers(
             title="Commands", 
             dest="command", 
             required=True, 
             help="Available actions"
         )
+        wanted = set(COMMANDS if commands is None else commands)
         
         # Add command: Adds a new task
-        parser_add = subparsers.add_parser("add", help="Add a new task to the list.")
-        parser_add.add_argument("description", type=str, help="The description of the task.")
-    
+        if "add" in wanted:
+            parser_add = subparsers.add_parser("add", help="Add a new task to the list.")
+            parser_add.add_argument("description", type=str, help="The description of the task.")
+
         # List command: Lists all tasks, optionally filtered by status
-        parser_list = subparsers.add_parser("list", help="List all tasks or filter by status.")
-        parser_list.add_argument(
-            "--status", 
-            type=str, 
-            choices=[status.value for status in TaskStatusEnum], 
-            help="Filter tasks by status (e.g., 'to do', 'in progress', 'done').", 
-            required=False, 
-            default=None
-        )
-        
+        if "list" in wanted:
+            parser_list = subparsers.add_parser("list", help="List all tasks or filter by status.")
+            parser_list.add_argument(
+                "--status", 
+                type=str, 
+                choices=[status.value for status in TaskStatusEnum], 
+                help="Filter tasks by status (e.g., 'to do', 'in progress', 'done').", 
+                required=False, 
+                default=None
+            )
+            parser_list.add_argument(
+                "--limit",
+                type=int,
+                default=None,
+                metavar="N",
+                help="Show at most N tasks (default: all)."
+            )
+            parser_list.add_argument(
+                "--after",
+                type=int,
+                default=None,
+                metavar="ID",
+                help="Only show tasks with an ID greater than ID, e.g. the last ID of the previous page."
+            )
+            parser_list.add_argument(
+                "--since",
+                type=parse_time,
+                default=None,
+                metavar="TIME",
+                help="Only show tasks updated (or created, with --by created) at or after TIME: "
+                     "an ISO 8601 date or date-time, or a duration ago such as 1h, 30m or 2d."
+            )
+            parser_list.add_argument(
+                "--until",
+                type=parse_time,
+                default=None,
+                metavar="TIME",
+                help="Only show tasks updated (or created, with --by created) before TIME."
+            )
+            parser_list.add_argument(
+                "--by",
+                type=str,
+                choices=list(TIME_FIELDS),
+                default="updated",
+                help="The timestamp --since and --until compare (default: updated)."
+            )
+
         # Get command: Retrieves a specific task by its ID
-        parser_get = subparsers.add_parser("get", help="Get a specific task by its ID.")
-        parser_get.add_argument("id", type=int, help="The ID of the task to retrieve.")
-        
+        if "get" in wanted:
+            parser_get = subparsers.add_parser("get", help="Get a specific task by its ID.")
+            parser_get.add_argument("id", type=int, help="The ID of the task to retrieve.")
+
         # Remove command: Deletes a task by its ID
-        parser_remove = subparsers.add_parser("remove", help="Remove a task by its ID.")
-        parser_remove.add_argument("id", type=int, help="The ID of the task to remove.")
-        
+        if "remove" in wanted:
+            parser_remove = subparsers.add_parser("remove", help="Remove a task by its ID.")
+            parser_remove.add_argument("id", type=int, help="The ID of the task to remove.")
+
         # Mark-done command: Marks a task as done
-        parser_done = subparsers.add_parser("mark-done", help="Mark a task as 'done'.")
-        parser_done.add_argument("id", type=int, help="The ID of the task to mark as done.")
-        
+        if "mark-done" in wanted:
+            parser_done = subparsers.add_parser("mark-done", help="Mark a task as 'done'.")
+            parser_done.add_argument("id", type=int, help="The ID of the task to mark as done.")
+
         # Mark-in-progress command: Marks a task as in progress
-        parser_in_progress = subparsers.add_parser("mark-in-progress", help="Mark a task as 'in progress'.")
-        parser_in_progress.add_argument("id", type=int, help="The ID of the task to mark as in progress.")
+        if "mark-in-progress" in wanted:
+            parser_in_progress = subparsers.add_parser("mark-in-progress", help="Mark a task as 'in progress'.")
+            parser_in_progress.add_argument("id", type=int, help="The ID of the task to mark as in progress.")
 
         # Mark-todo command: Marks a task as to do
-        parser_todo = subparsers.add_parser("mark-todo", help="Mark a task as 'to do'.")
-        parser_todo.add_argument("id", type=int, help="The ID of the task to mark as to do.")
-        
+        if "mark-todo" in wanted:
+            parser_todo = subparsers.add_parser("mark-todo", help="Mark a task as 'to do'.")
+            parser_todo.add_argument("id", type=int, help="The ID of the task to mark as to do.")
+
+        # Search command: Finds tasks by the words in their description
+        if "search" in wanted:
+            parser_search = subparsers.add_parser("search", help="Find tasks whose description contains every given word.")
+            parser_search.add_argument(
+                "query",
+                type=str,
+                nargs="+",
+                help="Words that must all occur; end a word with * to match words starting with it (e.g. 'mil*')."
+            )
+
+        # Stats command: Shows the recorded metrics
+        if "stats" in wanted:
+            parser_stats = subparsers.add_parser(
+                "stats",
+                help="Show call counts and latencies recorded while TASK_TRACKER_METRICS is set."
+            )
+            parser_stats.add_argument(
+                "--prometheus",
+                type=str,
+                default=None,
+                metavar="FILE",
+                help="Also write the metrics to FILE in the Prometheus text format (for the textfile collector)."
+            )
+            parser_stats.add_argument(
+                "--reset",
+                action="store_true",
+                help="Clear the recorded metrics after showing them."
+            )
+
+        # Batch command: Runs one command per line from a file or stdin
+        if "batch" in wanted:
+            parser_batch = subparsers.add_parser(
+                "batch",
+                help="Run one command per line from a file (or stdin) and save once at the end."
+            )
+            parser_batch.add_argument(
+                "file",
+                type=str,
+                nargs="?",
+                default="-",
+                help="The file to read commands from, or '-' for stdin (default)."
+            )
+            parser_batch.add_argument(
+                "--flush-every",
+                type=int,
+                default=0,
+                metavar="N",
+                help="Also save after every N commands (default: only at the end)."
+            )
+
         return parser
     
     def handle(self, args=None):
@@ -84,60 +262,287 @@ class CLIHandler:
             args (Optional[List[str]]): A list of command-line arguments. 
                                          If None, sys.argv[1:] is used.
         """
-        parsed_args = self.parser.parse_args(args)
-        
+        if args is None:
+            args = sys.argv[1:]
+        start = perf_counter()
+        command = command_position(args)
+        if command < len(args) and args[command] in COMMANDS:
+            # Only build the subparser the command needs; help and usage errors get the full parser
+            parsed_args = self._setup_parser([args[command]]).parse_args(args)
+        else:
+            parsed_args = self.parser.parse_args(args)
+
+        if not parsed_args.profile and not parsed_args.trace_memory:
+            self._dispatch(parsed_args)
+            return
+        from src.infrastructure.cli.profiling import CommandProfiler # Only profiled runs pay for the profilers
+        profiler = CommandProfiler(self._service, profile=parsed_args.profile, trace_memory=parsed_args.trace_memory,
+                                   top=parsed_args.profile_top, parse_seconds=perf_counter() - start)
+        with profiler:
+            self._dispatch(parsed_args)
         try:
-            if parsed_args.command == "add":
-                task = self._service.add_task(parsed_args.description)
-                print(f"Task Added: {task}")
-            elif parsed_args.command == "list":
-                # Convert string status to TaskStatusEnum if provided
-                status_enum = TaskStatusEnum(parsed_args.status) if parsed_args.status else None
-                tasks = self._service.list_tasks(status=status_enum)
-                if not tasks:
-                    status_message = f' with status "{parsed_args.status}"' if parsed_args.status else ""
-                    print(f"No tasks found{status_message}.")
-                else:
-                    print("To-Do List:")
-                    for task_item in tasks:
-                        print(f"- {task_item}")
-            elif parsed_args.command == "get":
-                task = self._service.get_task(parsed_args.id)
-                if not task:
-                    print(f"Error: Task with ID {parsed_args.id} not found.")
-                else:
-                    print(f"Task details: {task}")
-            elif parsed_args.command == "remove":
-                success = self._service.remove_task(parsed_args.id)
-                if not success:
-                    print(f"Error: Task with ID {parsed_args.id} not found or could not be removed.")
-                else:
-                    print(f"Task with ID {parsed_args.id} removed successfully.")
-            elif parsed_args.command == "mark-done":
-                task = self._service.complete_task(parsed_args.id)
-                if not task:
-                    print(f"Error: Task with ID {parsed_args.id} not found.")
-                else:
-                    print(f"Task marked as done: {task}")
-            elif parsed_args.command == "mark-in-progress":
-                task = self._service.begin_task(parsed_args.id)
-                if not task:
-                    print(f"Error: Task with ID {parsed_args.id} not found.")
-                else:
-                    print(f"Task marked as in progress: {task}")
-            elif parsed_args.command == "mark-todo":
-                task = self._service.get_task(parsed_args.id)
-                if not task:
-                    print(f"Error: Task with ID {parsed_args.id} not found.")
-                else:
-                    task.mark_as_todo()
-                    updated_task = self._service.repository.update(task)
-                    if updated_task:
-                        print(f"Task marked as to-do: {updated_task}")
-                    else:
-                        print(f"Error: Could not update task with ID {parsed_args.id}.")
+            profiler.write_report(parsed_args.profile_output)
+        except OSError as e:
+            print(f"Error: Could not write the profiling report to {parsed_args.profile_output}. Error: {e}")
 
+    def _dispatch(self, parsed_args: argparse.Namespace):
+        """Runs a parsed command, reporting errors instead of raising them."""
+        try:
+            if parsed_args.command == "batch":
+                self._run_batch(parsed_args.file, parsed_args.flush_every)
+            elif parsed_args.command == "stats":
+                self._stats(parsed_args.prometheus, parsed_args.reset)
+            else:
+                self._execute(parsed_args)
         except ValueError as ve:
             print(f"Input Error: {ve}")
         except Exception as e:
-            print(f"An unexpected error occurred: {e}. Please check your command and try again.")
\ No newline at end of file
+            print(f"An unexpected error occurred: {e}. Please check your command and try again.")
+
+    def _execute(self, parsed_args: argparse.Namespace):
+        """
+        Executes a single parsed command and prints its result.
+
+        Args:
+            parsed_args (argparse.Namespace): The parsed command-line arguments.
+
+        Raises:
+            ValueError: If the service rejects the input.
+        """
+        if parsed_args.command == "add":
+            task = self._service.add_task(parsed_args.description)
+            print(f"Task Added: {task}")
+        elif parsed_args.command == "list":
+            # Convert string status to TaskStatusEnum if provided
+            status_enum = TaskStatusEnum(parsed_args.status) if parsed_args.status else None
+            if parsed_args.since is not None or parsed_args.until is not None:
+                self._list_in_range(status_enum, parsed_args.limit, parsed_args.after,
+                                    parsed_args.since, parsed_args.until, TIME_FIELDS[parsed_args.by])
+            else:
+                self._list(status_enum, parsed_args.limit, parsed_args.after)
+        elif parsed_args.command == "search":
+            query = " ".join(parsed_args.query)
+            if self._write_tasks(f'Tasks matching "{query}":', iter(self._service.search_tasks(query))) is None:
+                print(f'No tasks match "{query}".')
+        elif parsed_args.command == "get":
+            task = self._service.get_task(parsed_args.id)
+            if not task:
+                print(f"Error: Task with ID {parsed_args.id} not found.")
+            else:
+                print(f"Task details: {task}")
+        elif parsed_args.command == "remove":
+            success = self._service.remove_task(parsed_args.id)
+            if not success:
+                print(f"Error: Task with ID {parsed_args.id} not found or could not be removed.")
+            else:
+                print(f"Task with ID {parsed_args.id} removed successfully.")
+        elif parsed_args.command == "mark-done":
+            task = self._service.complete_task(parsed_args.id)
+            if not task:
+                print(f"Error: Task with ID {parsed_args.id} not found.")
+            else:
+                print(f"Task marked as done: {task}")
+        elif parsed_args.command == "mark-in-progress":
+            task = self._service.begin_task(parsed_args.id)
+            if not task:
+                print(f"Error: Task with ID {parsed_args.id} not found.")
+            else:
+                print(f"Task marked as in progress: {task}")
+        elif parsed_args.command == "mark-todo":
+            task = self._service.get_task(parsed_args.id)
+            if not task:
+                print(f"Error: Task with ID {parsed_args.id} not found.")
+            else:
+                task.mark_as_todo()
+                updated_task = self._service.repository.update(task)
+                if updated_task:
+                    print(f"Task marked as to-do: {updated_task}")
+                else:
+                    print(f"Error: Could not update task with ID {parsed_args.id}.")
+
+    def _list(self, status: Optional[TaskStatusEnum], limit: Optional[int], after_id: Optional[int]):
+        """
+        Prints tasks as they are read, in chunks of OUTPUT_CHUNK_LINES lines.
+
+        Without a limit the tasks are streamed from the service, so the first
+        chunk appears as soon as it has been read and memory use does not grow
+        with the number of tasks. Each chunk is a single write to stdout instead
+        of one write per task. With a limit, one extra task is fetched to tell
+        whether another page follows.
+
+        Raises:
+            ValueError: If limit is below 1.
+        """
+        if limit is not None:
+            if limit < 1:
+                raise ValueError("--limit must be at least 1.")
+            page = self._service.list_tasks(status=status, limit=limit + 1, after_id=after_id)
+            tasks = iter(page[:limit])
+            has_more = len(page) > limit
+        else:
+            tasks = self._service.iter_tasks(status=status, after_id=after_id)
+            has_more = False
+
+        last_id = self._write_tasks("To-Do List:", tasks)
+        if last_id is None:
+            status_message = f' with status "{status.value}"' if status else ""
+            print(f"No tasks found{status_message}.")
+        elif has_more:
+            print(f"More tasks follow; continue with --after {last_id}.")
+
+    def _list_in_range(self, status: Optional[TaskStatusEnum], limit: Optional[int], after_id: Optional[int],
+                       since: Optional[datetime.datetime], until: Optional[datetime.datetime], field: str):
+        """
+        Prints the tasks in a time range, ordered by the compared timestamp.
+
+        Raises:
+            ValueError: If limit is below 1, after_id is given (pages by ID do not
+                        apply to time order) or the range is invalid.
+        """
+        if after_id is not None:
+            raise ValueError("--after cannot be combined with --since or --until.")
+        if limit is not None and limit < 1:
+            raise ValueError("--limit must be at least 1.")
+        tasks = self._service.list_tasks_in_range(since=since, until=until, field=field, status=status)
+        shown = tasks if limit is None else tasks[:limit]
+        if self._write_tasks("To-Do List:", iter(shown)) is None:
+            print("No tasks found in that time range.")
+        elif len(shown) < len(tasks):
+            print(f"{len(tasks) - len(shown)} more task(s) in that time range; narrow it or raise --limit.")
+
+    def _write_tasks(self, heading: str, tasks: Iterator[Task]) -> Optional[int]:
+        """
+        Writes a heading and one line per task to stdout, OUTPUT_CHUNK_LINES lines per write.
+
+        Returns:
+            Optional[int]: The ID of the last task written, or None if there were no
+                           tasks (in which case nothing is written).
+        """
+        task = next(tasks, None)
+        if task is None:
+            return None
+        out = sys.stdout
+        lines = [heading + "\n"]
+        while task is not None:
+            lines.append(f"- {task}\n")
+            if len(lines) >= OUTPUT_CHUNK_LINES:
+                out.write("".join(lines))
+                lines.clear()
+            last_id, task = task.id, next(tasks, None)
+        if lines:
+            out.write("".join(lines))
+        out.flush()
+        return last_id
+
+    def _stats(self, prometheus_path: Optional[str], reset: bool):
+        """
+        Prints the figures merged into the metrics file plus those of this process.
+
+        Latency percentiles are estimated from the histogram buckets, so they
+        are approximate.
+
+        Raises:
+            ValueError: If the metrics file cannot be read.
+        """
+        if self._metrics is None or self._metrics_path is None:
+            print("Metrics are disabled. Set TASK_TRACKER_METRICS to a file path to record them.")
+            return
+        registry = type(self._metrics).load(self._metrics_path)
+        registry.merge(self._metrics)
+
+        histograms, counters = registry.histograms(), registry.counters()
+        if not histograms and not counters:
+            print(f"No metrics recorded in {self._metrics_path} yet.")
+        if histograms:
+            lines = [f"{'call':<42}{'count':>9}{'total ms':>12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"]
+            for (name, labels), histogram in sorted(histograms.items()):
+                series = name[:-len("_seconds")] if name.endswith("_seconds") else name
+                series += "".join(f" {value}" for _, value in labels)
+                quantiles = "".join(f"{histogram.quantile(q) * 1000:>10.3f}" for q in (0.5, 0.95, 0.99))
+                lines.append(f"{series:<42}{histogram.count:>9}{histogram.sum * 1000:>12.3f}"
+                             f"{histogram.sum * 1000 / histogram.count:>10.3f}{quantiles}")
+            print("\n".join(lines))
+        if counters:
+            print("Counters:")
+            for (name, labels), value in sorted(counters.items()):
+                label_text = ",".join(f"{label}={label_value}" for label, label_value in labels)
+                print(f"  {name}{'{' + label_text + '}' if label_text else ''} {value:g}")
+
+        if prometheus_path:
+            registry.write_prometheus(prometheus_path)
+            print(f"Metrics written to {prometheus_path} in the Prometheus text format.")
+        if reset:
+            self._metrics.reset()
+            if os.path.exists(self._metrics_path):
+                os.remove(self._metrics_path)
+            print("Metrics reset.")
+
+    def _run_batch(self, source: str, flush_every: int = 0):
+        """
+        Runs one command per line against the already loaded service.
+
+        The tasks are loaded once and every change is buffered and saved when
+        the batch ends (and after every `flush_every` commands, if set), instead
+        of paying the start-up, load and save for every command. Blank lines and
+        lines starting with '#' are skipped. A failing line is reported with its
+        line number and does not stop the batch.
+
+        Args:
+            source (str): The file to read commands from, or '-' for stdin.
+            flush_every (int): Save after this many commands; 0 only saves at the end.
+        """
+        if flush_every < 0:
+            raise ValueError("--flush-every cannot be negative.")
+        if source == "-":
+            self._run_lines(sys.stdin, flush_every)
+        else:
+            with open(source, "r") as f:
+                self._run_lines(f, flush_every)
+
+    def _run_lines(self, lines: Iterable[str], flush_every: int):
+        """Executes the commands of a batch inside a single deferred-write block."""
+        import shlex # Only the batch command needs it; keeps single-command start-up lean
+
+        executed = failed = 0
+        with self._service.defer_writes():
+            for line_number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                try:
+                    args = shlex.split(line)
+                except ValueError as ve:
+                    print(f"Line {line_number}: Input Error: {ve}")
+                    failed += 1
+                    continue
+                if args[0] == "batch":
+                    print(f"Line {line_number}: Input Error: batch commands cannot be nested.")
+                    failed += 1
+                    continue
+                if args[0] == "stats":
+                    print(f"Line {line_number}: Input Error: stats cannot be run inside a batch.")
+                    failed += 1
+                    continue
+                try:
+                    parsed_args = self.parser.parse_args(args)
+                except SystemExit:
+                    # argparse has already printed the usage error
+                    print(f"Line {line_number}: Invalid command: {line}")
+                    failed += 1
+                    continue
+
+                try:
+                    self._execute(parsed_args)
+                except ValueError as ve:
+                    print(f"Line {line_number}: Input Error: {ve}")
+                    failed += 1
+                    continue
+                except Exception as e:
+                    print(f"Line {line_number}: An unexpected error occurred: {e}.")
+                    failed += 1
+                    continue
+
+                executed += 1
+                if flush_every and executed % flush_every == 0:
+                    self._service.flush()
+        print(f"Batch finished: {executed} command(s) executed, {failed} failed.")
@@ -0,0 +1,15 @@
+from typing import List
+
+# Global options that take a value; they go before the command
+PROFILE_OPTIONS_WITH_VALUE = ("--profile-output", "--profile-top")
+
+def command_position(args: List[str]) -> int:
+    """
+    Returns the index of the command in the CLI arguments, skipping the global options before it.
+
+    Kept free of imports so that the daemon client can use it without the start-up cost of the handler.
+    """
+    position = 0
+    while position < len(args) and args[position].startswith("-"):
+        position += 2 if args[position] in PROFILE_OPTIONS_WITH_VALUE else 1
+    return position
@@ -0,0 +1,188 @@
+import io
+import sys
+from time import perf_counter
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+from src.domain.TodoService_port import TodoServicePort
+from src.infrastructure.persistence.InstrumentedTaskRepository_adapter import InstrumentedTaskRepository
+
+LOAD_PHASES = ("load_snapshot", "load_journal", "load_shard")
+SAVE_PHASES = ("save_build", "save_write", "journal_append", "save_shard")
+
+class PhaseRecorder(MetricsRecorderPort):
+    """
+    Sums the durations recorded during a profiled command by phase.
+
+    JSON phases are summed by their `phase` label and repository calls under
+    "repository". Everything is passed on to the recorder it stands in for,
+    so enabled metrics still see the command.
+
+    Attributes:
+        inner (Optional[MetricsRecorderPort]): The recorder that was replaced, if any.
+        seconds (Dict[str, float]): Total seconds per phase.
+    """
+    def __init__(self, inner: Optional[MetricsRecorderPort] = None):
+        """
+        Initializes the PhaseRecorder.
+
+        Args:
+            inner (Optional[MetricsRecorderPort]): The recorder to pass the figures on to.
+        """
+        self.inner = inner
+        self.seconds: Dict[str, float] = {}
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        """Adds a duration to its phase and passes it on."""
+        phase = labels.get("phase") if name == "json_phase_seconds" else "repository"
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        if self.inner is not None:
+            self.inner.observe(name, seconds, **labels)
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        """Passes a counter on."""
+        if self.inner is not None:
+            self.inner.inc(name, amount, **labels)
+
+class CommandProfiler:
+    """
+    Runs one CLI command under cProfile and/or tracemalloc and reports where it went.
+
+    The report starts with the wall-clock time of each part of the command:
+    argparse setup, loading the repository, saving it, other repository work
+    and what is left for the service logic and output. To tell them apart,
+    the service's repository is wrapped in an InstrumentedTaskRepository for
+    the duration of the command, and a storage that records its load and
+    save phases (the JSON repositories) gets a PhaseRecorder. Both are put back
+    afterwards. The profilers slow Python code down, so the figures are
+    inflated compared to an unprofiled run, the phase shares much less so.
+
+    cProfile is reported as the top functions by cumulative time, and
+    tracemalloc as the peak traced memory and the top allocation sites of
+    the memory still held when the command ended.
+    """
+    def __init__(self, service: TodoServicePort, profile: bool = True, trace_memory: bool = False,
+                 top: int = 20, parse_seconds: float = 0.0):
+        """
+        Initializes the CommandProfiler.
+
+        Args:
+            service (TodoServicePort): The service the command runs against.
+            profile (bool): Whether to run cProfile.
+            trace_memory (bool): Whether to run tracemalloc.
+            top (int): How many functions and allocation sites to report.
+            parse_seconds (float): The time argparse took before profiling started.
+        """
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.top = top
+        self.parse_seconds = parse_seconds
+        self._core = service
+        while hasattr(self._core, "service"): # Wrappers such as InstrumentedTodoService
+            self._core = self._core.service
+        self._calls = PhaseRecorder()
+        self._phases: Optional[PhaseRecorder] = None
+        self._repository: Any = None
+        self._storage: Any = None
+        self._profiler = None
+        self._snapshot = None
+        self._peak_bytes = 0
+        self._total_seconds = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> "CommandProfiler":
+        self._repository = self._core.repository
+        self._core.repository = InstrumentedTaskRepository(self._repository, self._calls)
+        storage = self._repository
+        while hasattr(storage, "repository"): # Wrappers such as ThreadSafeTaskRepository
+            storage = storage.repository
+        if hasattr(storage, "metrics"):
+            self._storage = storage
+            self._phases = PhaseRecorder(storage.metrics)
+            storage.metrics = self._phases
+
+        if self.trace_memory:
+            import tracemalloc
+            tracemalloc.start()
+        if self.profile:
+            import cProfile
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._total_seconds = perf_counter() - self._start
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self.trace_memory:
+            import tracemalloc
+            self._peak_bytes = tracemalloc.get_traced_memory()[1]
+            self._snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+        self._core.repository = self._repository
+        if self._storage is not None:
+            self._storage.metrics = self._phases.inner
+        return False
+
+    def phase_seconds(self) -> List[Tuple[str, float]]:
+        """
+        Returns the wall-clock time of each part of the command.
+
+        Returns:
+            List[Tuple[str, float]]: (phase, seconds) pairs; load and save are only
+                                     separated for storages that record their phases.
+        """
+        repository = self._calls.seconds.get("repository", 0.0)
+        rows = [("argparse setup", self.parse_seconds)]
+        if self._phases is not None:
+            load = sum(self._phases.seconds.get(phase, 0.0) for phase in LOAD_PHASES)
+            save = sum(self._phases.seconds.get(phase, 0.0) for phase in SAVE_PHASES)
+            rows += [("repository load", load), ("save", save),
+                     ("other repository work", max(repository - load - save, 0.0))]
+        else:
+            rows.append(("repository calls (load and save included)", repository))
+        rows.append(("service logic and output", max(self._total_seconds - repository, 0.0)))
+        rows.append(("total", self.parse_seconds + self._total_seconds))
+        return rows
+
+    def report(self) -> str:
+        """Renders the phase times and the requested profiles as text."""
+        out = io.StringIO()
+        out.write("Phases (wall-clock ms, measured while profiling):\n")
+        for phase, seconds in self.phase_seconds():
+            out.write(f"  {phase:<44}{seconds * 1000:>10.3f}\n")
+
+        if self._profiler is not None:
+            import pstats
+            out.write(f"\nTop {self.top} functions by cumulative time:\n")
+            pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(self.top)
+
+        if self._snapshot is not None:
+            import tracemalloc
+            snapshot = self._snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ])
+            statistics = snapshot.statistics("lineno")
+            out.write(f"\nPeak traced memory: {self._peak_bytes / 1024:.1f} KiB\n")
+            out.write(f"Top {self.top} allocation sites still held at the end:\n")
+            for stat in statistics[:self.top]:
+                frame = stat.traceback[0]
+                out.write(f"  {stat.size / 1024:>10.1f} KiB {stat.count:>8} blocks  {frame.filename}:{frame.lineno}\n")
+        return out.getvalue()
+
+    def write_report(self, path: Optional[str] = None, stream: Optional[TextIO] = None):
+        """
+        Writes the report to a file, or to a stream (stderr by default).
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        text = self.report()
+        if path:
+            with open(path, "w") as f:
+                f.write(text)
+        else:
+            (stream or sys.stderr).write(text)
@@ -0,0 +1,124 @@
+import os
+import socket
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.cli.options import command_position
+from src.infrastructure.daemon.protocol import send_message, recv_message
+
+def _connect(socket_path: str) -> Optional[socket.socket]:
+    """Connects to the daemon socket, or returns None if no daemon is listening."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None # Stale socket file
+    return sock
+
+def request(socket_path: str, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Sends one request to the daemon and waits for the response.
+
+    Args:
+        socket_path (str): The path of the daemon socket.
+        message (Dict[str, Any]): The request message.
+
+    Returns:
+        Optional[Dict[str, Any]]: The response, or None if no daemon is listening.
+
+    Raises:
+        ConnectionError: If the daemon closes the connection before responding.
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    with sock:
+        send_message(sock, message)
+        response = recv_message(sock)
+    if response is None:
+        raise ConnectionError("The task daemon closed the connection without responding.")
+    return response
+
+def _batch_input(args: List[str]) -> Optional[Tuple[List[str], str]]:
+    """
+    Rewrites `batch [file]` so that the commands are sent along with the request.
+
+    The daemon does not share the client's working directory or standard
+    input, so the client reads the commands itself and the daemon runs
+    `batch -` on them.
+
+    Returns:
+        Optional[Tuple[List[str], str]]: The rewritten arguments and the commands text,
+                                         or None if the file cannot be read.
+    """
+    rewritten, source, rest = [args[0]], None, iter(args[1:])
+    for arg in rest:
+        if arg == "--flush-every":
+            rewritten += [arg, next(rest, "")]
+        elif arg.startswith("-") and arg != "-":
+            rewritten.append(arg)
+        elif source is None:
+            source = arg
+        else:
+            rewritten.append(arg) # Let the daemon's parser report the extra argument
+    if source is None or source == "-":
+        return rewritten + ["-"], sys.stdin.read()
+    try:
+        with open(source, "r") as f:
+            return rewritten + ["-"], f.read()
+    except OSError:
+        return None
+
+def forward(args: List[str], store: Dict[str, Any], socket_path: str) -> Optional[int]:
+    """
+    Runs a CLI command on the daemon and prints its output.
+
+    Args:
+        args (List[str]): The command-line arguments.
+        store (Dict[str, Any]): Identifies the backend and file the command is meant for.
+        socket_path (str): The path of the daemon socket.
+
+    Returns:
+        Optional[int]: The command's exit code, or None if no daemon serves this store
+                       and the command should run in-process instead.
+    """
+    sock = _connect(socket_path)
+    if sock is None:
+        return None
+    # Global options come first; a profiling report file is resolved here, as the daemon has its own directory
+    position = command_position(args)
+    options, command = args[:position], args[position:]
+    options = [os.path.abspath(option) if previous == "--profile-output" else option
+               for previous, option in zip([None] + options, options)]
+    message = {"op": "command", "args": options + command, "store": store}
+    if command and command[0] == "batch" and "-h" not in command and "--help" not in command:
+        batch = _batch_input(command)
+        if batch is None:
+            sock.close()
+            return None # Let the in-process handler report the unreadable file
+        message["args"], message["stdin"] = options + batch[0], batch[1]
+
+    with sock:
+        try:
+            send_message(sock, message)
+            response = recv_message(sock)
+        except (ConnectionError, ValueError) as e:
+            response = None
+            error = e
+        else:
+            error = "The daemon closed the connection without responding."
+    if response is None:
+        # The command may or may not have run, so it is not retried in-process
+        print(f"Error: Lost connection to the task daemon. {error}")
+        return 1
+    if response.get("status") == "wrong-store":
+        return None
+    if response.get("status") != "ok":
+        print(f"Error: {response.get('error', 'The task daemon rejected the request.')}")
+        return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["exit_code"]
@@ -0,0 +1,63 @@
+import json
+import os
+import socket
+import struct
+from typing import Any, Dict, Optional
+
+# Every message is a 4-byte big-endian length followed by that many bytes of UTF-8 JSON.
+FRAME_HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 64 * 1024 * 1024
+
+DEFAULT_SOCKET_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data/task-tracker.sock'))
+
+def socket_path_from_env() -> str:
+    """Returns the daemon socket path, taken from TASK_TRACKER_SOCKET if it is set."""
+    return os.environ.get("TASK_TRACKER_SOCKET") or DEFAULT_SOCKET_PATH
+
+def send_message(sock: socket.socket, message: Dict[str, Any]):
+    """
+    Sends one framed message.
+
+    Args:
+        sock (socket.socket): A connected stream socket.
+        message (Dict[str, Any]): A JSON-serializable message.
+    """
+    data = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    sock.sendall(FRAME_HEADER.pack(len(data)) + data)
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """
+    Receives one framed message.
+
+    Args:
+        sock (socket.socket): A connected stream socket.
+
+    Returns:
+        Optional[Dict[str, Any]]: The message, or None if the peer closed the
+                                  connection before sending another one.
+
+    Raises:
+        ConnectionError: If the connection closes in the middle of a message.
+        ValueError: If the message is too large or is not valid JSON.
+    """
+    header = _recv_exactly(sock, FRAME_HEADER.size, allow_eof=True)
+    if header is None:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    if length > MAX_MESSAGE_SIZE:
+        raise ValueError(f"Message of {length} bytes exceeds the {MAX_MESSAGE_SIZE} byte limit.")
+    return json.loads(_recv_exactly(sock, length).decode('utf-8'))
+
+def _recv_exactly(sock: socket.socket, size: int, allow_eof: bool = False) -> Optional[bytes]:
+    """Reads exactly `size` bytes, or returns None on a clean EOF before the first byte if allowed."""
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(remaining)
+        if not chunk:
+            if allow_eof and remaining == size:
+                return None
+            raise ConnectionError("Connection closed in the middle of a message.")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,227 @@
+import contextlib
+import io
+import os
+import socket
+import socketserver
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, TextIO
+
+from src.domain.TodoService_port import TodoServicePort
+from src.infrastructure.cli.handler import CLIHandler
+from src.infrastructure.daemon.protocol import send_message, recv_message
+
+if TYPE_CHECKING:
+    from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """Serves the framed requests of one client connection until it disconnects."""
+    def handle(self):
+        daemon: "TaskDaemon" = self.server.task_daemon
+        while True:
+            try:
+                request = recv_message(self.request)
+            except (ConnectionError, ValueError):
+                return # Drop clients that break the protocol
+            if request is None:
+                return
+            send_message(self.request, daemon.dispatch(request))
+            if request.get("op") == "shutdown":
+                # Only stop once the response is sent, or the process may exit before the client hears back
+                threading.Thread(target=daemon.shutdown, name="task-daemon-shutdown").start()
+                return
+
+
+class _ThreadRoutedStream:
+    """
+    Stands in for sys.stdout or sys.stderr while a command runs.
+
+    Only the thread running the command writes to the capture buffer; every
+    other thread (the background flusher, a background compaction) keeps
+    writing to the stream that was in place before, so their warnings end
+    up in the daemon's own output instead of some client's response.
+    """
+    def __init__(self, default: TextIO, owner: threading.Thread, capture: TextIO):
+        self._default = default
+        self._owner = owner
+        self._capture = capture
+
+    def _target(self) -> TextIO:
+        return self._capture if threading.current_thread() is self._owner else self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+@contextlib.contextmanager
+def _capture_output(stdout: TextIO, stderr: TextIO) -> Iterator[None]:
+    """Sends what the current thread prints to stdout and stderr to the given buffers, until exit."""
+    saved_stdout, saved_stderr = sys.stdout, sys.stderr
+    current = threading.current_thread()
+    sys.stdout = _ThreadRoutedStream(saved_stdout, current, stdout)
+    sys.stderr = _ThreadRoutedStream(saved_stderr, current, stderr)
+    try:
+        yield
+    finally:
+        sys.stdout, sys.stderr = saved_stdout, saved_stderr
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class TaskDaemon:
+    """
+    Long-running server that keeps one TodoService and its repository in memory.
+
+    CLI commands arrive on a Unix domain socket as framed JSON messages (see
+    protocol.py) and are run by a CLIHandler against the already loaded
+    service, so a command costs a socket round-trip instead of an interpreter
+    start-up and a full load of the dataset. Commands run one at a time, and
+    their stdout, stderr and exit code are sent back to the client.
+
+    The dataset is loaded once when the daemon starts, so lazy repositories do
+    not re-read the file on every lookup. The repository then stays inside
+    defer_writes() for the lifetime of the daemon: changes are persisted by a
+    background thread every `flush_interval` seconds and once more on shutdown.
+
+    Attributes:
+        socket_path (str): The path of the Unix domain socket.
+        store (Dict[str, Any]): Identifies the backend and file being served; requests
+                                for a different store are refused.
+        flush_interval (float): Seconds between background flushes.
+    """
+    def __init__(self, service: TodoServicePort, socket_path: str,
+                 store: Optional[Dict[str, Any]] = None, flush_interval: float = 1.0,
+                 metrics: Optional["MetricsRegistry"] = None, metrics_path: Optional[str] = None):
+        """
+        Initializes the TaskDaemon and binds its socket.
+
+        Args:
+            service (TodoServicePort): The service to run commands against.
+            socket_path (str): The path of the Unix domain socket to listen on.
+            store (Optional[Dict[str, Any]]): Identifies the store being served.
+            flush_interval (float): Seconds between background flushes.
+            metrics (Optional[MetricsRegistry]): The daemon's recorded metrics, shown by `stats`.
+            metrics_path (Optional[str]): The metrics file that `stats` combines them with.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket.
+        """
+        self.socket_path = socket_path
+        self.store = store or {}
+        self.flush_interval = flush_interval
+        self._service = service
+        self._handler = CLIHandler(service, metrics=metrics, metrics_path=metrics_path)
+        self._lock = threading.Lock() # Commands and flushes run one at a time
+        self._stopped = threading.Event()
+
+        self._remove_stale_socket()
+        self._server = _Server(socket_path, _RequestHandler)
+        self._server.task_daemon = self
+
+    def _remove_stale_socket(self):
+        """Removes a socket file left behind by a daemon that did not shut down cleanly."""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"A task daemon is already listening on {self.socket_path}.")
+
+    def serve_forever(self):
+        """Serves requests until shutdown() is called, then flushes and removes the socket."""
+        self._service.list_tasks(None) # Loads every task of a lazy repository up front
+        with self._service.defer_writes():
+            flusher = threading.Thread(target=self._flush_periodically, name="task-daemon-flush", daemon=True)
+            flusher.start()
+            try:
+                self._server.serve_forever()
+            finally:
+                self._stopped.set()
+                flusher.join()
+                self._server.server_close()
+                if os.path.exists(self.socket_path):
+                    os.unlink(self.socket_path)
+                with self._lock:
+                    pass # Let a command that is still running finish before the final flush
+
+    def shutdown(self):
+        """Stops serve_forever(). Must not be called from the thread running it."""
+        self._server.shutdown()
+
+    def _flush_periodically(self):
+        """Persists buffered changes every flush_interval seconds until the daemon stops."""
+        while not self._stopped.wait(self.flush_interval):
+            with self._lock:
+                try:
+                    self._service.flush()
+                except Exception as e:
+                    print(f"Warning: Background flush failed. Error: {e}")
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handles one request and builds its response.
+
+        Args:
+            request (Dict[str, Any]): The decoded request message.
+
+        Returns:
+            Dict[str, Any]: The response message.
+        """
+        op = request.get("op")
+        if op == "ping":
+            return {"status": "ok", "store": self.store, "pid": os.getpid()}
+        if op == "shutdown":
+            return {"status": "ok"} # The request handler stops the daemon after sending this
+        if op != "command":
+            return {"status": "error", "error": f"Unknown operation '{op}'."}
+        if request.get("store", self.store) != self.store:
+            return {"status": "wrong-store", "store": self.store}
+        args = request.get("args")
+        if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+            return {"status": "error", "error": "'args' must be a list of strings."}
+        return dict(status="ok", **self.execute(args, request.get("stdin")))
+
+    def execute(self, args: List[str], stdin: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Runs one CLI command and captures what it prints.
+
+        Only output of the calling thread is captured; other daemon threads
+        keep printing to the daemon's own stdout and stderr.
+
+        Args:
+            args (List[str]): The command-line arguments, as for CLIHandler.handle().
+            stdin (Optional[str]): Text to provide as standard input (used by `batch -`).
+
+        Returns:
+            Dict[str, Any]: The captured "stdout" and "stderr" and the "exit_code".
+        """
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+        with self._lock:
+            if self._stopped.is_set():
+                return {"stdout": "", "stderr": "Error: The task daemon is shutting down.\n", "exit_code": 1}
+            saved_stdin = sys.stdin
+            sys.stdin = io.StringIO(stdin or "")
+            try:
+                with _capture_output(stdout, stderr):
+                    self._handler.handle(args)
+            except SystemExit as e:
+                # argparse exits on usage errors and after printing help
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            finally:
+                sys.stdin = saved_stdin
+        return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "exit_code": exit_code}
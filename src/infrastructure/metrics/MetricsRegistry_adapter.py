@@ -0,0 +1,305 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from bisect import bisect_left
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError: # Not available on Windows; merges are then not protected against other processes
+    fcntl = None
+
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+
+# Upper bounds of the latency histogram buckets in seconds, from 5 µs to 10 s
+BUCKETS = (0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+           0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = "task_tracker_" # Prefix of every exported metric name
+FORMAT_VERSION = 1 # Bumped when the layout of the saved file changes
+
+Labels = Tuple[Tuple[str, str], ...]
+SeriesKey = Tuple[str, Labels]
+
+class Histogram:
+    """
+    Latency histogram with the fixed BUCKETS, as Prometheus histograms are.
+
+    Attributes:
+        counts (List[int]): Observations per bucket; the last entry counts those above BUCKETS[-1].
+        sum (float): The sum of all observed durations in seconds.
+        count (int): The number of observations.
+    """
+    def __init__(self):
+        """Initializes an empty histogram."""
+        self.counts: List[int] = [0] * (len(BUCKETS) + 1)
+        self.sum: float = 0.0
+        self.count: int = 0
+
+    def observe(self, seconds: float):
+        """Records one duration."""
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+    def merge(self, other: "Histogram"):
+        """Adds the observations of another histogram to this one."""
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile the way Prometheus' histogram_quantile() does.
+
+        The rank is located in its bucket and interpolated linearly between the
+        bucket bounds, so the estimate is only as fine as the buckets. Ranks in
+        the overflow bucket are reported as the largest finite bound.
+
+        Returns:
+            Optional[float]: The estimated duration in seconds, or None without observations.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(BUCKETS):
+                    return BUCKETS[-1]
+                lower = BUCKETS[index - 1] if index else 0.0
+                return lower + (BUCKETS[index] - lower) * (rank - seen) / count
+            seen += count
+        return BUCKETS[-1]
+
+class MetricsRegistry(MetricsRecorderPort):
+    """
+    In-memory MetricsRecorderPort that keeps counters and latency histograms.
+
+    Every series is keyed by the metric name and its labels. Recording takes
+    a lock, so the registry can be shared by the threads of a daemon or of
+    an asyncio executor.
+
+    A CLI command runs in its own short-lived process, so its figures are
+    merged into a JSON file when it exits (merge_into_file()); the file lock
+    keeps concurrent commands from losing each other's counts. The `stats`
+    command reads that file back, and to_prometheus() renders any registry in
+    the Prometheus text exposition format for the node exporter's textfile
+    collector.
+    """
+    def __init__(self):
+        """Initializes an empty registry."""
+        self._lock = threading.Lock()
+        self._counters: Dict[SeriesKey, float] = {}
+        self._histograms: Dict[SeriesKey, Histogram] = {}
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> SeriesKey:
+        # Instrumented calls pass a single label, whose order needs no sorting
+        return name, tuple(labels.items()) if len(labels) < 2 else tuple(sorted(labels.items()))
+
+    def observe(self, name: str, seconds: float, **labels: str):
+        """Records one duration in the histogram of the series."""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def inc(self, name: str, amount: float = 1, **labels: str):
+        """Adds to the counter of the series."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def counters(self) -> Dict[SeriesKey, float]:
+        """Returns a copy of the counters by (name, labels)."""
+        with self._lock:
+            return dict(self._counters)
+
+    def histograms(self) -> Dict[SeriesKey, Histogram]:
+        """Returns copies of the histograms by (name, labels)."""
+        with self._lock:
+            copies = {}
+            for key, histogram in self._histograms.items():
+                copies[key] = Histogram()
+                copies[key].merge(histogram)
+            return copies
+
+    def is_empty(self) -> bool:
+        """Returns True if nothing has been recorded."""
+        with self._lock:
+            return not self._counters and not self._histograms
+
+    def merge(self, other: "MetricsRegistry"):
+        """Adds every series of another registry to this one."""
+        counters, histograms = other.counters(), other.histograms()
+        with self._lock:
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, histogram in histograms.items():
+                self._histograms.setdefault(key, Histogram()).merge(histogram)
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the registry as a JSON-serializable document."""
+        return {
+            "format": FORMAT_VERSION,
+            "counters": [{"name": name, "labels": dict(labels), "value": value}
+                         for (name, labels), value in self.counters().items()],
+            "histograms": [{"name": name, "labels": dict(labels), "counts": histogram.counts,
+                            "sum": histogram.sum, "count": histogram.count}
+                           for (name, labels), histogram in self.histograms().items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricsRegistry":
+        """
+        Rebuilds a registry from to_dict() output.
+
+        Raises:
+            ValueError: If the document is not in this format.
+        """
+        if not isinstance(data, dict) or data.get("format") != FORMAT_VERSION:
+            raise ValueError("Not a metrics file of this version.")
+        registry = cls()
+        try:
+            for entry in data["counters"]:
+                registry._counters[cls._key(entry["name"], entry["labels"])] = entry["value"]
+            for entry in data["histograms"]:
+                histogram = Histogram()
+                if len(entry["counts"]) != len(histogram.counts):
+                    raise ValueError("The histogram buckets differ from this version's.")
+                histogram.counts, histogram.sum, histogram.count = list(entry["counts"]), entry["sum"], entry["count"]
+                registry._histograms[cls._key(entry["name"], entry["labels"])] = histogram
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Malformed metrics file: {e}")
+        return registry
+
+    @classmethod
+    def load(cls, path: str) -> "MetricsRegistry":
+        """
+        Reads a registry saved by merge_into_file(); a missing file gives an empty registry.
+
+        Raises:
+            ValueError: If the file exists but cannot be read as a metrics file.
+        """
+        try:
+            with open(path) as f:
+                return cls.from_dict(json.load(f))
+        except FileNotFoundError:
+            return cls()
+        except (IOError, json.JSONDecodeError) as e:
+            raise ValueError(f"Could not read metrics from {path}: {e}")
+
+    def merge_into_file(self, path: str):
+        """
+        Adds this registry's figures to the file and resets the registry.
+
+        The file is locked for the read-merge-write, so the figures of
+        processes that exit at the same time are all kept. The registry is
+        reset afterwards so that a later merge does not count them twice. An
+        unreadable file is replaced, with a warning, rather than blocking
+        every later command.
+        """
+        if self.is_empty():
+            return
+        try:
+            with self._file_lock(path):
+                try:
+                    stored = self.load(path)
+                except ValueError as e:
+                    print(f"Warning: {e}. Starting the metrics file afresh.")
+                    stored = MetricsRegistry()
+                stored.merge(self)
+                self._write(path, json.dumps(stored.to_dict()))
+        except OSError as e:
+            print(f"Warning: Could not save metrics to {path}. Error: {e}")
+            return
+        self.reset()
+
+    @staticmethod
+    @contextmanager
+    def _file_lock(path: str) -> Iterator[None]:
+        """Holds the advisory lock on `path + '.lock'`, creating the directory if needed."""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path + '.lock', 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _write(path: str, text: str):
+        """
+        Writes a file through a uniquely named temporary file and a rename, so readers never see a partial file.
+
+        Raises:
+            OSError: If the file cannot be written; the temporary file is removed.
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                        prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            os.chmod(tmp_path, 0o644) # mkstemp creates owner-only files; collectors may run as another user
+            with os.fdopen(fd, 'w') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def to_prometheus(self) -> str:
+        """
+        Renders the registry in the Prometheus text exposition format.
+
+        Every metric name gets the PREFIX; histograms produce the cumulative
+        `_bucket` series plus `_sum` and `_count`.
+        """
+        def series(name: str, labels: Labels, extra: Labels = ()) -> str:
+            pairs = labels + extra
+            if not pairs:
+                return name
+            escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+            return name + "{" + ",".join(f'{label}="{value}"' for (label, _), value in zip(pairs, escaped)) + "}"
+
+        lines = []
+        counters, histograms = self.counters(), self.histograms()
+        for metric in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {PREFIX}{metric} counter")
+            for (name, labels), value in sorted(counters.items()):
+                if name == metric:
+                    lines.append(f"{series(PREFIX + name, labels)} {value:g}")
+        for metric in sorted({name for name, _ in histograms}):
+            lines.append(f"# TYPE {PREFIX}{metric} histogram")
+            for (name, labels), histogram in sorted(histograms.items(), key=lambda item: item[0]):
+                if name != metric:
+                    continue
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{series(PREFIX + name + '_bucket', labels, (('le', le),))} {cumulative}")
+                lines.append(f"{series(PREFIX + name + '_sum', labels)} {histogram.sum:.9g}")
+                lines.append(f"{series(PREFIX + name + '_count', labels)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_prometheus(self, path: str):
+        """
+        Writes to_prometheus() to a file, replacing it atomically as the textfile collector expects.
+
+        The write holds the file's lock, as merge_into_file() does, so that
+        processes exporting at the same time do not interfere.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        text = self.to_prometheus()
+        with self._file_lock(path):
+            self._write(path, text)
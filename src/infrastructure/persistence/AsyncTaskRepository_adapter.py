@@ -0,0 +1,117 @@
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.domain.AsyncTaskRepository_port import AsyncTaskRepositoryPort
+
+from typing import Any, Callable, Optional, List
+import datetime
+
+class AsyncTaskRepository(AsyncTaskRepositoryPort):
+    """
+    An asyncio implementation of the AsyncTaskRepositoryPort on top of a synchronous repository.
+
+    Every call into the wrapped repository runs on a single worker thread, so
+    the event loop never waits for file I/O and the repository never sees two
+    calls at once. The wrapped repository is kept inside defer_writes():
+    mutations only change its in-memory state, and concurrent mutations are
+    persisted together by one flush (a group commit) before any of them
+    returns. With the JSON repository, a burst of N concurrent updates
+    therefore costs one snapshot save instead of N. Wrap it in lazy mode so that
+    the initial load also happens on the worker thread.
+
+    Attributes:
+        repository (TaskRepositoryPort): The wrapped synchronous repository.
+        commit_delay (float): Seconds to wait for more mutations before flushing.
+    """
+    def __init__(self, repository: TaskRepositoryPort, commit_delay: float = 0.0):
+        """
+        Initializes the AsyncTaskRepository.
+
+        Args:
+            repository (TaskRepositoryPort): The synchronous repository to wrap. It must
+                                             not be used directly while it is wrapped.
+            commit_delay (float): Seconds to wait for more mutations before flushing.
+                                  0 still coalesces the mutations that are already queued.
+        """
+        self.repository = repository
+        self.commit_delay = commit_delay
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-repository")
+        self._deferred = contextlib.ExitStack()
+        self._deferred.enter_context(repository.defer_writes())
+        self._commit: Optional[asyncio.Future] = None # Flush that the current group of mutations waits for
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs a blocking call on the repository's worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _mutate(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Runs a mutation and returns its result once it has been persisted."""
+        result = await self._run(func, *args)
+        if self._commit is None:
+            self._commit = asyncio.ensure_future(self._group_commit())
+        # Shielded so that a cancelled caller does not cancel the flush the others wait for
+        await asyncio.shield(self._commit)
+        return result
+
+    async def _group_commit(self):
+        """Flushes every mutation that finished before the flush reaches the worker thread."""
+        await asyncio.sleep(self.commit_delay)
+        self._commit = None # Mutations finishing from now on join the next group
+        await self._run(self.repository.flush)
+
+    async def add(self, description: str) -> Task:
+        """Adds a new task."""
+        return await self._mutate(self.repository.add, description)
+
+    async def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks."""
+        return await self._mutate(self.repository.add_many, descriptions)
+
+    async def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                      offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks, optionally filtered by status and paginated."""
+        return await self._run(self.repository.get_all, status, limit, offset, after_id)
+
+    async def search(self, query: str) -> List[Task]:
+        """Finds the tasks whose description matches a full-text query."""
+        return await self._run(self.repository.search, query)
+
+    async def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                           until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Retrieves the tasks whose createdAt or updatedAt lies in a time range."""
+        return await self._run(self.repository.get_in_range, field, since, until)
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID."""
+        return await self._run(self.repository.get_by_id, task_id)
+
+    async def delete(self, task_id: int) -> bool:
+        """Deletes a task by its ID."""
+        return await self._mutate(self.repository.delete, task_id)
+
+    async def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks."""
+        return await self._mutate(self.repository.delete_many, task_ids)
+
+    async def update(self, task: Task) -> Optional[Task]:
+        """Updates an existing task."""
+        return await self._mutate(self.repository.update, task)
+
+    async def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks."""
+        return await self._mutate(self.repository.update_many, tasks)
+
+    async def flush(self):
+        """Persists any buffered writes, including those of a group commit that is still pending."""
+        if self._commit is not None:
+            await asyncio.shield(self._commit)
+        await self._run(self.repository.flush)
+
+    async def close(self):
+        """Persists buffered writes, leaves defer_writes() and stops the worker thread."""
+        await self.flush()
+        await self._run(self._deferred.close)
+        self._executor.shutdown(wait=False)
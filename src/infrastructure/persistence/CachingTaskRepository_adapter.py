@@ -0,0 +1,253 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+import datetime
+
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+DEFAULT_MAX_TASKS = 10000 # Tasks kept by get_by_id caching
+DEFAULT_MAX_LISTS = 32 # get_all() results kept
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry, with an optional time to live.
+
+    Attributes:
+        max_entries (int): The number of entries kept before evicting.
+        ttl (Optional[float]): Seconds an entry stays valid; None keeps it until evicted.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that found no valid entry, including expired ones.
+        evictions (int): Entries dropped to stay within max_entries.
+        expirations (int): Entries found expired on lookup.
+    """
+    def __init__(self, max_entries: int, ttl: Optional[float] = None):
+        """
+        Initializes the cache.
+
+        Raises:
+            ValueError: If max_entries is below 1 or ttl is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("A cache must hold at least one entry.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The cache time to live must be positive.")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict() # Value and expiry time
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns (True, value) for a valid entry, marking it as recently used, otherwise (False, None)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires = entry
+            if self.ttl is None or time.monotonic() < expires:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, value
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return False, None
+
+    def put(self, key: Hashable, value: Any):
+        """Stores an entry as the most recently used one, evicting the least recently used if full."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (value, expires)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, key: Hashable):
+        """Removes an entry, if present."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Removes every entry; the counters are kept."""
+        self._entries.clear()
+
+class CachingTaskRepository(TaskRepositoryPort):
+    """
+    A TaskRepositoryPort that caches the reads of a slower repository in memory.
+
+    get_by_id() results are kept in one LRU cache of up to `max_tasks` tasks,
+    and get_all() results in another of up to `max_lists` lists, keyed by the
+    status filter and the pagination arguments. With a `ttl`, entries also
+    expire after that many seconds, which bounds how stale a cache can get
+    when other processes write to the same store.
+
+    Writes go straight through to the wrapped repository. add() and update()
+    then store the tasks they return in the task cache, and delete() drops
+    them. Every write clears the list cache, since any change can move a
+    task into or out of a listing. iter_tasks(), search() and get_in_range()
+    are not cached.
+
+    Cached tasks are handed out as they are, without copying, as the memory
+    and JSON repositories do. A caller that changes a task in place must
+    pass it to update(), or the cache holds the change without it being
+    stored. The caches are guarded by a lock, but the wrapped repository is
+    not. Share this wrapper between threads only on top of a
+    ThreadSafeTaskRepository.
+
+    Hits and misses are counted per cache (stats()). With a metrics
+    recorder, they are also recorded as
+    `cache_requests_total{cache, result}`, so that `stats` shows them.
+
+    Attributes:
+        repository (TaskRepositoryPort): The wrapped repository.
+        metrics (Optional[MetricsRecorderPort]): Where hits and misses are recorded, if anywhere.
+    """
+    def __init__(self, repository: TaskRepositoryPort, max_tasks: int = DEFAULT_MAX_TASKS,
+                 max_lists: int = DEFAULT_MAX_LISTS, ttl: Optional[float] = None,
+                 metrics: Optional[MetricsRecorderPort] = None):
+        """
+        Initializes the CachingTaskRepository.
+
+        Args:
+            repository (TaskRepositoryPort): The repository to cache.
+            max_tasks (int): The number of tasks kept for get_by_id().
+            max_lists (int): The number of get_all() results kept.
+            ttl (Optional[float]): Seconds a cached result stays valid; None keeps it until evicted.
+            metrics (Optional[MetricsRecorderPort]): Records the hits and misses.
+
+        Raises:
+            ValueError: If a cache size is below 1 or ttl is not positive.
+        """
+        self.repository = repository
+        self.metrics = metrics
+        self._tasks = LRUCache(max_tasks, ttl)
+        self._lists = LRUCache(max_lists, ttl)
+        self._lock = threading.Lock()
+
+    def _record(self, cache: str, hit: bool):
+        """Records a lookup if metrics are enabled."""
+        if self.metrics is not None:
+            self.metrics.inc("cache_requests_total", cache=cache, result="hit" if hit else "miss")
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns the counters and sizes of both caches, e.g. to size them.
+
+        Returns:
+            Dict[str, Dict[str, int]]: For "tasks" and "lists": hits, misses,
+                                       evictions, expirations and size.
+        """
+        with self._lock:
+            return {name: {"hits": cache.hits, "misses": cache.misses, "evictions": cache.evictions,
+                           "expirations": cache.expirations, "size": len(cache)}
+                    for name, cache in (("tasks", self._tasks), ("lists", self._lists))}
+
+    def clear(self):
+        """Drops every cached result, e.g. after the store was changed by someone else."""
+        with self._lock:
+            self._tasks.clear()
+            self._lists.clear()
+
+    def _cache_written(self, tasks: List[Optional[Task]]):
+        """Stores tasks returned by a write and forgets every cached listing."""
+        with self._lock:
+            for task in tasks:
+                if task is not None:
+                    self._tasks.put(task.id, task)
+            self._lists.clear()
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task from the cache, or from the wrapped repository on a miss."""
+        with self._lock:
+            hit, task = self._tasks.get(task_id)
+        self._record("tasks", hit)
+        if hit:
+            return task
+        task = self.repository.get_by_id(task_id)
+        if task is not None: # Missing ids are not cached, as add() could create them
+            with self._lock:
+                self._tasks.put(task_id, task)
+        return task
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks from the cache, or from the wrapped repository on a miss; returns a new list."""
+        key = (status, limit, offset, after_id)
+        with self._lock:
+            hit, tasks = self._lists.get(key)
+        self._record("lists", hit)
+        if not hit:
+            tasks = self.repository.get_all(status=status, limit=limit, offset=offset, after_id=after_id)
+            with self._lock:
+                self._lists.put(key, tasks)
+        return list(tasks)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the wrapped repository without caching."""
+        return self.repository.iter_tasks(status, after_id)
+
+    def search(self, query: str) -> List[Task]:
+        """Finds tasks in the wrapped repository without caching."""
+        return self.repository.search(query)
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Finds tasks by timestamp in the wrapped repository without caching."""
+        return self.repository.get_in_range(field, since, until)
+
+    def add(self, description: str) -> Task:
+        """Adds a task through the wrapped repository and caches it."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks through the wrapped repository and caches them."""
+        tasks = self.repository.add_many(descriptions)
+        self._cache_written(tasks)
+        return tasks
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Updates a task through the wrapped repository and caches the result."""
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several tasks through the wrapped repository and caches the results."""
+        try:
+            updated = self.repository.update_many(tasks)
+        except Exception:
+            self.clear() # The tasks may have been changed in place before the write failed
+            raise
+        with self._lock:
+            for task, result in zip(tasks, updated):
+                if result is None:
+                    self._tasks.discard(task.id) # Not stored; a cached copy may hold the caller's change
+        self._cache_written(updated)
+        return updated
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task through the wrapped repository and forgets it."""
+        return self.delete_many([task_id])[0]
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks through the wrapped repository and forgets them."""
+        deleted = self.repository.delete_many(task_ids)
+        with self._lock:
+            for task_id in task_ids:
+                self._tasks.discard(task_id)
+            self._lists.clear()
+        return deleted
+
+    def flush(self):
+        """Persists buffered writes of the wrapped repository."""
+        self.repository.flush()
+
+    def defer_writes(self) -> AbstractContextManager:
+        """Lets the wrapped repository buffer writes; the caches stay current meanwhile."""
+        return self.repository.defer_writes()
+
+    def close(self):
+        """Closes the wrapped repository, if it has anything to close."""
+        if hasattr(self.repository, "close"):
+            self.repository.close()
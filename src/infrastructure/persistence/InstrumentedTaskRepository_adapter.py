@@ -0,0 +1,114 @@
+from contextlib import AbstractContextManager
+from time import perf_counter
+
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+from typing import Any, Iterator, Optional, List
+import datetime
+
+class InstrumentedTaskRepository(TaskRepositoryPort):
+    """
+    A TaskRepositoryPort that records the latency of every call to another repository.
+
+    Each call is observed in the `repository_call_seconds` histogram with a
+    `method` label, and calls that raise also increment
+    `repository_call_errors_total`. iter_tasks() is timed from the first task
+    requested until the iteration ends, so the figure covers reading every
+    task it yields.
+
+    The wrapper adds two clock reads and one histogram update per call; when
+    metrics are disabled it is simply not installed.
+
+    Attributes:
+        repository (TaskRepositoryPort): The wrapped repository.
+        metrics (MetricsRecorderPort): Where the figures are recorded.
+    """
+    def __init__(self, repository: TaskRepositoryPort, metrics: MetricsRecorderPort):
+        """
+        Initializes the InstrumentedTaskRepository.
+
+        Args:
+            repository (TaskRepositoryPort): The repository to measure.
+            metrics (MetricsRecorderPort): Where the figures are recorded.
+        """
+        self.repository = repository
+        self.metrics = metrics
+
+    def _call(self, method: str, *args: Any) -> Any:
+        """Calls a method of the wrapped repository and records its latency and failure."""
+        start = perf_counter()
+        try:
+            return getattr(self.repository, method)(*args)
+        except Exception:
+            self.metrics.inc("repository_call_errors_total", method=method)
+            raise
+        finally:
+            self.metrics.observe("repository_call_seconds", perf_counter() - start, method=method)
+
+    def add(self, description: str) -> Task:
+        """Adds a new task."""
+        return self._call("add", description)
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks."""
+        return self._call("add_many", descriptions)
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks, optionally filtered by status and paginated."""
+        return self._call("get_all", status, limit, offset, after_id)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the tasks, timing the whole iteration."""
+        start = perf_counter()
+        try:
+            yield from self.repository.iter_tasks(status, after_id)
+        except Exception:
+            self.metrics.inc("repository_call_errors_total", method="iter_tasks")
+            raise
+        finally:
+            self.metrics.observe("repository_call_seconds", perf_counter() - start, method="iter_tasks")
+
+    def search(self, query: str) -> List[Task]:
+        """Finds the tasks whose description matches a full-text query."""
+        return self._call("search", query)
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Retrieves the tasks whose createdAt or updatedAt lies in a time range."""
+        return self._call("get_in_range", field, since, until)
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID."""
+        return self._call("get_by_id", task_id)
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task by its ID."""
+        return self._call("delete", task_id)
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks."""
+        return self._call("delete_many", task_ids)
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Updates an existing task."""
+        return self._call("update", task)
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks."""
+        return self._call("update_many", tasks)
+
+    def flush(self):
+        """Persists buffered writes of the wrapped repository."""
+        self._call("flush")
+
+    def defer_writes(self) -> AbstractContextManager:
+        """Lets the wrapped repository buffer writes; the final flush is timed inside the wrapped repository only."""
+        return self.repository.defer_writes()
+
+    def close(self):
+        """Closes the wrapped repository, if it has anything to close."""
+        if hasattr(self.repository, "close"):
+            self.repository.close()
@@ -0,0 +1,99 @@
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+class ReadWriteLock:
+    """
+    A lock that admits many readers at once or a single writer.
+
+    Writers are preferred: once a writer is waiting, new readers wait behind
+    it, so a steady stream of reads cannot starve mutations. Both sides are
+    reentrant, and a thread holding the write lock may also take the read
+    lock. Upgrading a read lock to a write lock is not supported, because two
+    readers upgrading at once would deadlock.
+    """
+    def __init__(self):
+        """Initializes an unlocked ReadWriteLock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0 # Threads holding the read lock
+        self._writer: Optional[int] = None # Ident of the thread holding the write lock
+        self._write_depth: int = 0
+        self._waiting_writers: int = 0
+        self._local = threading.local() # Per-thread read lock depth
+
+    def acquire_read(self):
+        """Blocks until the read lock is held by the calling thread."""
+        depth = getattr(self._local, "read_depth", 0)
+        if depth or self._writer == threading.get_ident():
+            self._local.read_depth = depth + 1 # Already reading, or writing, which excludes everyone else
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        self._local.read_depth = 1
+
+    def release_read(self):
+        """Releases one level of the calling thread's read lock."""
+        depth = getattr(self._local, "read_depth", 0)
+        if not depth:
+            raise RuntimeError("Cannot release a read lock that is not held.")
+        self._local.read_depth = depth - 1
+        if depth > 1 or self._writer == threading.get_ident():
+            return
+        with self._condition:
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self):
+        """
+        Blocks until the write lock is held by the calling thread.
+
+        Raises:
+            RuntimeError: If the calling thread holds only the read lock.
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "read_depth", 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock.")
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        """Releases one level of the calling thread's write lock."""
+        if self._writer != threading.get_ident():
+            raise RuntimeError("Cannot release a write lock that is not held.")
+        self._write_depth -= 1
+        if self._write_depth:
+            return
+        with self._condition:
+            self._writer = None
+            self._condition.notify_all()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Holds the read lock for the duration of the block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Holds the write lock for the duration of the block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
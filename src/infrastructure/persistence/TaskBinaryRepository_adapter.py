@@ -0,0 +1,243 @@
+import mmap
+import os
+import struct
+
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+from typing import Iterator, Optional, List
+import datetime
+
+MAGIC = b"TTSK"
+VERSION = 1
+# magic, format version, record size, number of records, next task id
+HEADER = struct.Struct("<4sHHQQ")
+HEADER_SIZE = 32
+# id, status code, createdAt, updatedAt (seconds since the epoch), description offset and length in the heap
+RECORD = struct.Struct("<qBddQI")
+STATUS_OFFSET = 8 # Offset of the status byte inside a record
+
+DELETED = 0
+STATUS_CODES = {TaskStatusEnum.TODO: 1, TaskStatusEnum.INPROGRESS: 2, TaskStatusEnum.DONE: 3}
+STATUSES = {code: status for status, code in STATUS_CODES.items()}
+
+EPOCH = datetime.datetime(1970, 1, 1)
+
+def to_timestamp(value: datetime.datetime) -> float:
+    """Converts a naive datetime to seconds since the epoch without going through the local timezone."""
+    return (value - EPOCH).total_seconds()
+
+def from_timestamp(value: float) -> datetime.datetime:
+    """Converts seconds since the epoch back to the naive datetime it was created from."""
+    return EPOCH + datetime.timedelta(seconds=value)
+
+class TaskBinaryRepository(TaskRepositoryPort):
+    """
+    A binary file-based implementation of the TaskRepositoryPort.
+
+    Tasks are stored as fixed-width records behind a small header, with the
+    descriptions kept in a separate heap file that records point into. Both
+    files are memory-mapped, so reads go straight to the mapped pages instead
+    of parsing the whole dataset.
+
+    Task ids are handed out sequentially and every add appends one record, so
+    the record of task N always sits at slot N - 1. A lookup by id is a single
+    record read whose cost does not depend on the file size. Deleted tasks keep
+    their slot and are marked with a status code of 0.
+
+    Attributes:
+        file_path (str): The path to the record file.
+        heap_path (str): The path to the description heap file.
+    """
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        Initializes the TaskBinaryRepository.
+
+        Args:
+            file_path (Optional[str]): The path to the record file.
+                                       If None, a default path ('data/tasks.bin') is used.
+
+        Raises:
+            ValueError: If the file exists but is not a task file of a supported version,
+                        or is truncated.
+        """
+        self.file_path: str = file_path or os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data/tasks.bin'))
+        self.heap_path: str = self.file_path + '.heap'
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        if not os.path.exists(self.file_path):
+            with open(self.file_path, 'wb') as f:
+                f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 1).ljust(HEADER_SIZE, b"\0"))
+        if not os.path.exists(self.heap_path):
+            open(self.heap_path, 'wb').close()
+
+        size = os.path.getsize(self.file_path)
+        if size < HEADER_SIZE:
+            # An empty or truncated file cannot be mapped or hold a header
+            raise ValueError(f"{self.file_path} is not a version {VERSION} task file: it is truncated.")
+
+        self._records_file = open(self.file_path, 'r+b')
+        self._heap_file = open(self.heap_path, 'r+b')
+        self._records = mmap.mmap(self._records_file.fileno(), 0)
+        self._heap: Optional[mmap.mmap] = None # Mapped on first read; an empty file cannot be mapped
+
+        magic, version, record_size, self._count, self._next_id = HEADER.unpack_from(self._records, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"{self.file_path} is not a version {VERSION} task file.")
+        if size < HEADER_SIZE + self._count * RECORD.size:
+            self.close()
+            raise ValueError(f"{self.file_path} is truncated: its header lists {self._count} records.")
+
+    def close(self):
+        """Flushes and unmaps the files."""
+        for mapping in (self._records, self._heap):
+            if mapping is not None and not mapping.closed:
+                mapping.flush()
+                mapping.close()
+        self._records_file.close()
+        self._heap_file.close()
+
+    def flush(self):
+        """Flushes the mapped records to the file."""
+        self._records.flush()
+
+    def _write_header(self):
+        """Writes the record count and next id to the header."""
+        HEADER.pack_into(self._records, 0, MAGIC, VERSION, RECORD.size, self._count, self._next_id)
+
+    def _offset(self, task_id: int) -> Optional[int]:
+        """Returns the file offset of the record for task_id, or None if no such slot exists."""
+        if not isinstance(task_id, int) or not 1 <= task_id <= self._count:
+            return None
+        offset = HEADER_SIZE + (task_id - 1) * RECORD.size
+        if len(self._records) < offset + RECORD.size:
+            # The file grew through appends since it was mapped
+            self._records.close()
+            self._records = mmap.mmap(self._records_file.fileno(), 0)
+        return offset
+
+    def _read_description(self, offset: int, length: int) -> str:
+        """Reads a description from the heap."""
+        if length == 0:
+            return ""
+        if self._heap is None or len(self._heap) < offset + length:
+            if self._heap is not None:
+                self._heap.close()
+            self._heap = mmap.mmap(self._heap_file.fileno(), 0)
+        return self._heap[offset:offset + length].decode('utf-8')
+
+    def _append_description(self, description: str):
+        """Appends a description to the heap and returns its (offset, length)."""
+        data = description.encode('utf-8')
+        self._heap_file.seek(0, os.SEEK_END)
+        offset = self._heap_file.tell()
+        self._heap_file.write(data)
+        self._heap_file.flush()
+        return offset, len(data)
+
+    def _read_task(self, offset: int) -> Optional[Task]:
+        """Materializes the Task stored at the given record offset, or None if it was deleted."""
+        task_id, code, created_at, updated_at, desc_offset, desc_length = RECORD.unpack_from(self._records, offset)
+        if code == DELETED:
+            return None
+        return Task(
+            id=task_id,
+            description=self._read_description(desc_offset, desc_length),
+            status=STATUSES[code],
+            createdAt=from_timestamp(created_at),
+            updatedAt=from_timestamp(updated_at)
+        )
+
+    def add(self, description: str) -> Task:
+        """Adds a new task by appending a record to the file."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks with one append to the heap and one append to the record file."""
+        current_time = datetime.datetime.now()
+        timestamp = to_timestamp(current_time)
+        self._heap_file.seek(0, os.SEEK_END)
+        desc_offset = self._heap_file.tell()
+        tasks, heap, records = [], [], []
+        for description in descriptions:
+            task = Task(
+                id=self._next_id + len(tasks),
+                description=description,
+                status=TaskStatusEnum.TODO,
+                createdAt=current_time,
+                updatedAt=current_time
+            )
+            data = description.encode('utf-8')
+            heap.append(data)
+            records.append(RECORD.pack(task.id, STATUS_CODES[task.status], timestamp, timestamp, desc_offset, len(data)))
+            desc_offset += len(data)
+            tasks.append(task)
+
+        self._heap_file.write(b"".join(heap))
+        self._heap_file.flush()
+        self._records_file.seek(HEADER_SIZE + self._count * RECORD.size)
+        self._records_file.write(b"".join(records))
+        self._records_file.flush()
+        self._count += len(tasks)
+        self._next_id += len(tasks)
+        self._write_header()
+        return tasks
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks from the file, optionally filtered by status and paginated."""
+        return self._page(self.iter_tasks(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Reads the records in slot order, starting at the slot after after_id."""
+        start = max(after_id, 0) if after_id is not None else 0 # Task N lives in slot N - 1
+        if start >= self._count:
+            return
+        first_offset = HEADER_SIZE + start * RECORD.size
+        last_offset = self._offset(self._count)
+        if status:
+            # Pull every record's status byte out of the mapping in one strided slice and
+            # only materialize the matches.
+            codes = self._records[first_offset + STATUS_OFFSET:last_offset + RECORD.size:RECORD.size]
+            code = STATUS_CODES[status]
+            index = codes.find(code)
+            while index != -1:
+                yield self._read_task(first_offset + index * RECORD.size)
+                index = codes.find(code, index + 1)
+            return
+        for offset in range(first_offset, last_offset + 1, RECORD.size):
+            task = self._read_task(offset)
+            if task is not None:
+                yield task
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID with a single record read."""
+        offset = self._offset(task_id)
+        return self._read_task(offset) if offset is not None else None
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task by marking its record as deleted."""
+        offset = self._offset(task_id)
+        if offset is None or self._records[offset + STATUS_OFFSET] == DELETED:
+            return False
+        self._records[offset + STATUS_OFFSET] = DELETED
+        return True
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Updates an existing task's record in place."""
+        offset = self._offset(task.id)
+        if offset is None:
+            return None
+        _, code, _, _, desc_offset, desc_length = RECORD.unpack_from(self._records, offset)
+        if code == DELETED:
+            return None
+        if self._read_description(desc_offset, desc_length) != task.description:
+            desc_offset, desc_length = self._append_description(task.description)
+
+        task.updatedAt = datetime.datetime.now() # Ensure updatedAt is current
+        RECORD.pack_into(
+            self._records, offset, task.id, STATUS_CODES[task.status],
+            to_timestamp(task.createdAt), to_timestamp(task.updatedAt), desc_offset, desc_length
+        )
+        return task
@@ -0,0 +1,132 @@
+from array import array
+
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskBinaryRepository_adapter import (
+    DELETED, STATUS_CODES, STATUSES, to_timestamp, from_timestamp
+)
+
+from typing import Iterator, Optional, List
+import datetime
+
+class TaskColumnarRepository(TaskRepositoryPort):
+    """
+    A columnar in-memory implementation of the TaskRepositoryPort.
+
+    Instead of one Task object per task, every field lives in its own typed
+    array: ids as 64-bit integers, statuses as one-byte codes, timestamps as
+    doubles (seconds since the epoch) and descriptions as UTF-8 bytes in a
+    single string table addressed by offset and length. This avoids the
+    per-object overhead of millions of Task, datetime and str instances. Task
+    objects are only materialized when they cross the repository boundary.
+
+    Rows are never reused: task N lives in row N - 1 and deleted tasks keep
+    their row with a status code of 0. Because callers receive materialized
+    copies, changes to a task only take effect once it is passed to update().
+    """
+    def __init__(self):
+        """Initializes the TaskColumnarRepository with empty columns."""
+        self._ids = array('q')
+        self._status = array('B')
+        self._created = array('d')
+        self._updated = array('d')
+        self._desc_offsets = array('Q')
+        self._desc_lengths = array('I')
+        self._strings = bytearray() # Description string table
+        self._next_id: int = 1
+
+    def _row(self, task_id: int) -> Optional[int]:
+        """Returns the row holding task_id, or None if the task does not exist."""
+        if not isinstance(task_id, int) or not 1 <= task_id <= len(self._ids):
+            return None
+        row = task_id - 1
+        return row if self._status[row] != DELETED else None
+
+    def _store_description(self, description: str):
+        """Appends a description to the string table and returns its (offset, length)."""
+        data = description.encode('utf-8')
+        offset = len(self._strings)
+        self._strings += data
+        return offset, len(data)
+
+    def _description(self, row: int) -> str:
+        """Reads the description of a row from the string table."""
+        offset = self._desc_offsets[row]
+        return self._strings[offset:offset + self._desc_lengths[row]].decode('utf-8')
+
+    def _materialize(self, row: int) -> Task:
+        """Builds a Task object from a row."""
+        return Task(
+            id=self._ids[row],
+            description=self._description(row),
+            status=STATUSES[self._status[row]],
+            createdAt=from_timestamp(self._created[row]),
+            updatedAt=from_timestamp(self._updated[row])
+        )
+
+    def add(self, description: str) -> Task:
+        """Adds a new task as a new row in every column."""
+        current_time = datetime.datetime.now()
+        task = Task(
+            id=self._next_id,
+            description=description,
+            status=TaskStatusEnum.TODO,
+            createdAt=current_time,
+            updatedAt=current_time
+        )
+        offset, length = self._store_description(description)
+        timestamp = to_timestamp(current_time)
+        self._ids.append(task.id)
+        self._status.append(STATUS_CODES[task.status])
+        self._created.append(timestamp)
+        self._updated.append(timestamp)
+        self._desc_offsets.append(offset)
+        self._desc_lengths.append(length)
+        self._next_id += 1
+        return task
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks, optionally filtered by status and paginated."""
+        return self._page(self.iter_tasks(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Materializes the rows in order, starting at the row after after_id."""
+        start = max(after_id, 0) if after_id is not None else 0 # Task N lives in row N - 1
+        codes = self._status.tobytes()
+        if status:
+            code = STATUS_CODES[status]
+            row = codes.find(code, start)
+            while row != -1:
+                yield self._materialize(row)
+                row = codes.find(code, row + 1)
+            return
+        for row in range(start, len(codes)):
+            if codes[row] != DELETED:
+                yield self._materialize(row)
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID."""
+        row = self._row(task_id)
+        return self._materialize(row) if row is not None else None
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Writes an existing task's fields back into its row."""
+        row = self._row(task.id)
+        if row is None:
+            return None
+        if self._description(row) != task.description:
+            self._desc_offsets[row], self._desc_lengths[row] = self._store_description(task.description)
+        task.updatedAt = datetime.datetime.now() # Ensure updatedAt is current
+        self._status[row] = STATUS_CODES[task.status]
+        self._created[row] = to_timestamp(task.createdAt)
+        self._updated[row] = to_timestamp(task.updatedAt)
+        return task
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task by marking its row as deleted."""
+        row = self._row(task_id)
+        if row is None:
+            return False
+        self._status[row] = DELETED
+        return True
@@ -0,0 +1,155 @@
+import datetime
+from itertools import dropwhile
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from src.domain.SearchQuery import SearchQuery
+from src.domain.Task import Task, TaskStatusEnum
+from src.infrastructure.persistence.TaskSearchIndex import TaskSearchIndex
+from src.infrastructure.persistence.TaskTimeIndex import TaskTimeIndex
+
+class TaskIndex:
+    """
+    In-memory index of tasks shared by the repository adapters.
+
+    Tasks are kept in a dict keyed by id. Dicts preserve insertion order, so
+    iterating the index yields tasks in the order they were added, just like
+    the plain list the adapters used to scan, while lookups, replacements and
+    removals by id are O(1). Ids are handed out in increasing order, so the
+    insertion order is also id order.
+
+    Tasks are also bucketed by status so that filtering by status costs time
+    proportional to the number of matches. Tasks are mutated in place by the
+    service (e.g. `Task.mark_as_done`), so the buckets are only refreshed when
+    the task is passed back through `put`, which the repositories do on update.
+
+    Full-text search uses a TaskSearchIndex over the descriptions. It is built
+    by the first search (or attached by the owner, e.g. loaded from disk) and
+    from then on kept up to date by `put` and `remove`, so loads that are never
+    followed by a search do not pay for tokenizing every description.
+
+    Time range queries use a TaskTimeIndex that is likewise built by the first
+    query, so only processes that ask for ranges decode every timestamp.
+
+    Attributes:
+        search_index (Optional[TaskSearchIndex]): The full-text index, once built or attached.
+        time_index (Optional[TaskTimeIndex]): The createdAt/updatedAt index, once built.
+    """
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initializes the index.
+
+        Args:
+            tasks (Iterable[Task]): Tasks to index, in iteration order.
+        """
+        self._by_id: Dict[int, Task] = {}
+        self._by_status: Dict[TaskStatusEnum, Dict[int, Task]] = {status: {} for status in TaskStatusEnum}
+        self._unsorted_statuses: Set[TaskStatusEnum] = set() # Buckets whose ids are out of order
+        self.search_index: Optional[TaskSearchIndex] = None
+        self.time_index: Optional[TaskTimeIndex] = None
+        for task in tasks:
+            self.put(task)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._by_id
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._by_id.values())
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """Returns the task with the given ID, or None if it is not indexed."""
+        return self._by_id.get(task_id)
+
+    def put(self, task: Task):
+        """Adds a task, or replaces the task with the same ID while keeping its position."""
+        is_new = task.id not in self._by_id
+        self._by_id[task.id] = task
+        if not is_new:
+            for status, bucket in self._by_status.items():
+                if status != task.status:
+                    bucket.pop(task.id, None)
+
+        bucket = self._by_status[task.status]
+        if task.id not in bucket and bucket and task.id < next(reversed(bucket)):
+            # Moving an older task into this bucket; restore id order lazily on the next read
+            self._unsorted_statuses.add(task.status)
+        bucket[task.id] = task
+        if self.search_index is not None:
+            self.search_index.put(task)
+        if self.time_index is not None:
+            self.time_index.put(task)
+
+    def put_many(self, tasks: Iterable[Task]):
+        """Adds or replaces several tasks in one pass."""
+        for task in tasks:
+            self.put(task)
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Removes and returns the task with the given ID, or None if it is not indexed."""
+        task = self._by_id.pop(task_id, None)
+        if task is not None:
+            for bucket in self._by_status.values():
+                bucket.pop(task_id, None)
+            if self.search_index is not None:
+                self.search_index.remove(task_id)
+            if self.time_index is not None:
+                self.time_index.remove(task_id)
+        return task
+
+    def remove_many(self, task_ids: Iterable[int]) -> List[bool]:
+        """Removes several tasks in one pass and reports, for each ID, whether it was indexed."""
+        return [self.remove(task_id) is not None for task_id in task_ids]
+
+    def all(self) -> List[Task]:
+        """Returns all tasks in insertion order as a new list."""
+        return list(self._by_id.values())
+
+    def with_status(self, status: TaskStatusEnum) -> List[Task]:
+        """Returns the tasks with the given status, ordered by ID, as a new list."""
+        return list(self._bucket(status).values())
+
+    def iter_from(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterates over the tasks (with the given status) in ID order without copying them.
+
+        Producing the first task takes constant time unless after_id is given, in
+        which case the ids up to after_id are skipped at C speed. Like any dict
+        iterator, it must not be advanced after the index has been changed.
+
+        Args:
+            status (Optional[TaskStatusEnum]): Only yield tasks with this status.
+            after_id (Optional[int]): Only yield tasks with a greater ID.
+        """
+        tasks = self._bucket(status) if status else self._by_id
+        if after_id is None:
+            return iter(tasks.values())
+        return map(tasks.__getitem__, dropwhile(after_id.__ge__, tasks))
+
+    def search(self, query: SearchQuery) -> List[Task]:
+        """Returns the tasks whose description matches the query, ordered by ID."""
+        if self.search_index is None:
+            self.search_index = TaskSearchIndex(self._by_id.values())
+        tasks = (self._by_id.get(task_id) for task_id in sorted(self.search_index.search(query)))
+        # Checked against the description as well, in case a task was changed in place since it was indexed
+        return [task for task in tasks if task is not None and query.matches(task.description)]
+
+    def between(self, field: str, since: Optional[datetime.datetime] = None,
+                until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Returns the tasks whose field lies in [since, until), ordered by that field and then by ID."""
+        if self.time_index is None:
+            self.time_index = TaskTimeIndex(self._by_id.values())
+        tasks = (self._by_id[task_id] for task_id in self.time_index.between(field, since, until))
+        # Checked against the task as well, in case its timestamp was changed in place since it was indexed
+        return [task for task in tasks if (since is None or getattr(task, field) >= since) and
+                                          (until is None or getattr(task, field) < until)]
+
+    def _bucket(self, status: TaskStatusEnum) -> Dict[int, Task]:
+        """Returns the bucket of a status, restoring its id order first if needed."""
+        bucket = self._by_status[status]
+        if status in self._unsorted_statuses:
+            bucket = {task_id: bucket[task_id] for task_id in sorted(bucket)}
+            self._by_status[status] = bucket
+            self._unsorted_statuses.discard(status)
+        return bucket
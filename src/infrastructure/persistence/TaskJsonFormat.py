@@ -0,0 +1,105 @@
+import datetime
+import os
+from contextlib import nullcontext
+from enum import Enum
+from typing import Any, Dict, Union
+
+from src.domain.Task import Task, LazyTask, TaskStatusEnum
+
+# The task record format and file durability shared by TaskJsonRepository and TaskShardedJsonRepository
+
+NO_PHASE = nullcontext() # Stands in for a phase timer when metrics are disabled
+
+# Looking a status up by value here is cheaper than calling TaskStatusEnum(value) for every record
+STATUSES_BY_VALUE: Dict[Any, TaskStatusEnum] = {status.value: status for status in TaskStatusEnum}
+
+class DurabilityLevel(Enum):
+    """
+    How hard the repository tries to get a write onto stable storage before returning.
+
+    Every level writes snapshots to a temporary file and atomically renames it
+    over the target, so a crashed process never leaves a truncated file behind.
+    The levels differ in what survives a power loss or kernel crash, and in
+    what each write costs: DATASYNC and FSYNC wait for the disk on every
+    snapshot save and journal append, which typically adds milliseconds per
+    write (see benchmarks/bench_durability.py).
+    """
+    NONE = "none"         # Leave writing back to the operating system
+    DATASYNC = "datasync" # fdatasync the file contents before the rename
+    FSYNC = "fsync"       # fsync the file and its directory so the rename itself is durable
+
+def _checked_timestamp(value: Any) -> Union[str, datetime.datetime, None]:
+    """
+    Returns a stored timestamp ready for LazyTask, checking that it can be decoded later.
+
+    Text with the length and separators of what isoformat() writes
+    (`YYYY-MM-DDTHH:MM:SS`, optionally with microseconds) is kept as text
+    for LazyTask to decode on first access. The check is a few character
+    comparisons, cheaper than parsing. Anything else is parsed right away,
+    so a truncated, empty or otherwise malformed timestamp fails while
+    loading, where the record is skipped with a warning, instead of on
+    first use. Wrong digits in the right places (such as month 13) get
+    past the check; LazyTask reports those on first access and uses the
+    current time instead.
+
+    Raises:
+        ValueError: If the timestamp is not valid ISO 8601 text.
+        TypeError: If the timestamp is not text.
+    """
+    if value is None or (value.__class__ is str and len(value) in (19, 26) and value[4] == '-' and value[7] == '-'
+                         and value[10] == 'T' and value[13] == ':' and value[16] == ':'):
+        return value
+    return datetime.datetime.fromisoformat(value)
+
+def sync_data(fd: int):
+    """Flushes file contents to stable storage, skipping metadata where the platform allows it."""
+    if hasattr(os, 'fdatasync'):
+        os.fdatasync(fd)
+    else:
+        os.fsync(fd)
+
+def sync_directory(path: str):
+    """Flushes a directory entry (e.g. a rename) to stable storage where the platform supports it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return # Directories cannot be opened on every platform (e.g. Windows)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def serialize_task(task: Task) -> Dict[str, Any]:
+    """Converts a Task object to a dictionary for JSON serialization."""
+    if isinstance(task, LazyTask):
+        # Timestamps that were never read are written back as the text they were loaded from
+        created_at, updated_at = task.timestamp_text("createdAt"), task.timestamp_text("updatedAt")
+    else:
+        created_at, updated_at = task.createdAt.isoformat(), task.updatedAt.isoformat()
+    return {
+        "id": task.id,
+        "description": task.description,
+        "status": task.status.value,
+        "createdAt": created_at,
+        "updatedAt": updated_at
+    }
+
+def deserialize_task(task_data: Dict[str, Any]) -> Task:
+    """
+    Builds a Task object from its dictionary form, filling in defaults for missing fields.
+
+    The timestamps are kept as text and only parsed when first read (see
+    LazyTask); a missing timestamp becomes the time it is first read.
+
+    Raises:
+        ValueError: If the status or a timestamp is malformed.
+        TypeError: If a timestamp is not text.
+    """
+    status = task_data.get('status', TaskStatusEnum.TODO.value) # Default status
+    return LazyTask(
+        id=task_data.get('id'),
+        description=task_data.get('description', 'No description'), # Default description
+        status=STATUSES_BY_VALUE.get(status) or TaskStatusEnum(status),
+        createdAt=_checked_timestamp(task_data.get('createdAt')),
+        updatedAt=_checked_timestamp(task_data.get('updatedAt'))
+    )
@@ -1,12 +1,28 @@
 import json
 import os
+import re
+import threading
+from contextlib import AbstractContextManager, contextmanager
 
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
 from src.domain.Task import Task, TaskStatusEnum
 from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.domain.SearchQuery import SearchQuery
+from src.infrastructure.persistence.TaskIndex import TaskIndex
+from src.infrastructure.persistence.TaskSearchIndex import TaskSearchIndex
+from src.infrastructure.persistence.TaskJsonStream import TaskJsonStream
+from src.infrastructure.persistence.TaskJsonFormat import (
+    DurabilityLevel, NO_PHASE, deserialize_task, serialize_task, sync_data, sync_directory
+)
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 import datetime
 
+try:
+    import fcntl
+except ImportError: # Not available on Windows, where multiprocess mode only detects conflicts
+    fcntl = None
+
 class TaskJsonRepository(TaskRepositoryPort):
     """
     A JSON file-based implementation of the TaskRepositoryPort.
@@ -14,133 +30,860 @@ class TaskJsonRepository(TaskRepositoryPort):
     This repository stores tasks in a JSON file, providing persistence
     across application sessions.
 
+    In journal mode every mutation appends one small record to a journal file
+    next to the snapshot instead of rewriting the whole snapshot. The journal
+    is folded into a fresh snapshot (compacted) once it passes a record or
+    size threshold.
+
+    In lazy mode nothing is read until it is needed: a single-task lookup
+    checks the journal and then streams the file until the matching record,
+    and the full load only happens on the first operation that needs every
+    task. In lazy journal mode add() only reads the snapshot header and the
+    end of the journal and appends its record, without loading any task.
+
+    In multiprocess mode several processes can share the files. Every
+    operation on loaded tasks holds an advisory lock on a lock file next to
+    the snapshot, and first catches up with what other processes wrote: the
+    snapshot carries a version counter that every snapshot write increments,
+    so a process whose copy is stale reloads it (or only replays the journal
+    records it has not seen) and then applies its change on top, instead of
+    overwriting the other process's work.
+
+    search() uses an inverted index over the descriptions that is built on the
+    first search and then maintained with every change. With
+    persist_search_index it is also saved next to the snapshot, tagged with
+    the snapshot version, so a later process loads it instead of tokenizing
+    every description again and only re-indexes the tasks changed since.
+    get_in_range() likewise answers time range queries from sorted createdAt
+    and updatedAt indexes that the first range query builds.
+
+    With a metrics recorder, the load and save phases are timed in the
+    `json_phase_seconds` histogram (phase: load_snapshot, load_journal,
+    save_build, save_write, journal_append) and the bytes read and written
+    are counted in `json_bytes_read_total` and `json_bytes_written_total`
+    (file: snapshot or journal). Reading the snapshot decodes and indexes
+    one record at a time, so parsing and building the tasks are timed
+    together as load_snapshot. Without a recorder each phase costs one
+    attribute check.
+
     Attributes:
         file_path (str): The path to the JSON file used for storage.
+        journal_path (str): The path to the append-only journal file.
+        journal (bool): Whether mutations are appended to the journal.
+        compact_records (int): Number of journal records that triggers a compaction.
+        compact_bytes (int): Journal size in bytes that triggers a compaction.
+        background_compaction (bool): Whether compaction runs on a background thread.
+        durability (DurabilityLevel): How writes are synced to stable storage.
+        lazy (bool): Whether loading is deferred until tasks are first needed.
+        multiprocess (bool): Whether the files are locked against other processes.
+        persist_search_index (bool): Whether the full-text search index is saved next to the snapshot.
+        search_path (str): The path to the saved search index.
+        lock_path (str): The path to the lock file used in multiprocess mode.
+        metrics (Optional[MetricsRecorderPort]): Where load and save figures are recorded, if anywhere.
     """
-    def __init__(self, file_path: Optional[str] = None):
+    def __init__(self, file_path: Optional[str] = None, journal: bool = False,
+                 compact_records: int = 1000, compact_bytes: int = 1024 * 1024,
+                 background_compaction: bool = True,
+                 durability: DurabilityLevel = DurabilityLevel.NONE,
+                 lazy: bool = False, multiprocess: bool = False, persist_search_index: bool = False,
+                 metrics: Optional[MetricsRecorderPort] = None):
         """
         Initializes the TaskJsonRepository.
 
         Args:
-            file_path (Optional[str]): The path to the JSON file. 
+            file_path (Optional[str]): The path to the JSON file.
                                        If None, a default path ('data/tasks.json') is used.
+            journal (bool): If True, mutations are appended to a journal file
+                            instead of rewriting the whole JSON file.
+            compact_records (int): Number of journal records after which the
+                                   journal is compacted into the snapshot.
+            compact_bytes (int): Journal size in bytes after which the journal
+                                 is compacted into the snapshot.
+            background_compaction (bool): If True, compaction runs on a background
+                                          thread instead of blocking the mutation.
+            durability (DurabilityLevel): How snapshot writes and journal appends are
+                                          synced to stable storage. Defaults to NONE, which
+                                          does not wait for the disk; DATASYNC and FSYNC
+                                          survive a power loss at the cost of a sync per write.
+            lazy (bool): If True, the file is not loaded up front; see the class docstring.
+            multiprocess (bool): If True, other processes may use the same files
+                                 at the same time; see the class docstring.
+            persist_search_index (bool): If True, the search index is saved next to the
+                                         snapshot; see the class docstring.
+            metrics (Optional[MetricsRecorderPort]): Records the load and save phases;
+                                                     see the class docstring.
         """
-        self._tasks: List[Task] = []
+        self._tasks: TaskIndex = TaskIndex()
         self._next_id: int = 1
         # Default file path if not provided
         self.file_path: str = file_path or os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data/tasks.json'))
-        
+        self.journal_path: str = self.file_path + '.journal'
+        self.journal = journal
+        self.compact_records = compact_records
+        self.compact_bytes = compact_bytes
+        self.background_compaction = background_compaction
+        self.durability = durability
+        self.lazy = lazy
+        self.multiprocess = multiprocess
+        self.lock_path: str = self.file_path + '.lock'
+        self.persist_search_index = persist_search_index
+        self.search_path: str = self.file_path + '.search'
+        self.metrics = metrics
+
+        self._loaded: bool = False
+        self._header_loaded: bool = False # next_id and journal_seq are known without a full load
+        self._journal_seq: int = 0 # Sequence number of the last journal record written or replayed
+        self._journal_records: int = 0 # Records in the journal not yet folded into the snapshot
+        self._journal_bytes: int = 0
+        self._lock = threading.RLock() # Guards in-memory state and journal appends
+        self._compaction_lock = threading.Lock() # Serializes snapshot writes during compaction
+        self._compaction_thread: Optional[threading.Thread] = None
+        self._deferred: int = 0 # Depth of nested defer_writes() blocks
+        self._pending: Dict[int, Dict[str, Any]] = {} # Latest buffered record per task id
+        self._dirty: bool = False # Buffered changes not yet written to the snapshot
+        self._version: int = 0 # Version of the snapshot the in-memory state is based on
+        self._lock_file = None # Open lock file while the file lock is held
+        self._lock_depth: int = 0
+        self._holding_lock: bool = False # Lock kept until buffered changes are flushed
+
         # Ensure the directory for the JSON file exists
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-        
-        self._load()
-    
+
+        if not lazy:
+            self._ensure_loaded()
+
+    # Kept as methods so that subclasses and tests can hook the conversion
+    _serialize_task = staticmethod(serialize_task)
+    _deserialize_task = staticmethod(deserialize_task)
+
+    def _phase(self, name: str) -> AbstractContextManager:
+        """Times a load or save phase if metrics are enabled."""
+        if self.metrics is None:
+            return NO_PHASE
+        return self.metrics.timer("json_phase_seconds", phase=name)
+
+    def _count_bytes(self, direction: str, file: str, amount: int):
+        """Counts bytes read or written if metrics are enabled."""
+        if self.metrics is not None:
+            self.metrics.inc(f"json_bytes_{direction}_total", amount, file=file)
+
     def _load(self):
+        """Loads tasks from the JSON snapshot, then replays the journal on top of it."""
+        self._load_snapshot()
+        self._replay_journal()
+        self._loaded = True
+
+    def _ensure_loaded(self):
+        """Performs the full load on first use in lazy mode."""
+        if not self._loaded:
+            with self._synchronized():
+                if not self._loaded:
+                    self._load()
+
+    def _load_snapshot(self):
         """Loads tasks from the JSON file if it exists, otherwise creates an empty file."""
+        self._journal_seq = 0
         if not os.path.exists(self.file_path):
             # Create an empty file with an empty list and next_id if it doesn't exist
-            with open(self.file_path, 'w') as f:
-                json.dump({"tasks": [], "next_id": 1}, f, indent=4)
-            self._tasks = []
+            self._tasks = TaskIndex()
             self._next_id = 1
+            self._write_snapshot(self._snapshot_data())
             return
 
         try:
-            with open(self.file_path, 'r') as f:
-                # Handle empty file case
-                content = f.read()
-                if not content:
-                    data = {"tasks": [], "next_id": 1}
-                else:
-                    data = json.loads(content)
-                
-                loaded_tasks = []
-                for task_data in data.get("tasks", []):
+            # Records are decoded and hydrated one at a time, so the raw text and the
+            # parsed dictionaries are never held in memory alongside all the Task objects
+            stream = TaskJsonStream(self.file_path)
+            loaded_tasks = TaskIndex()
+            with self._phase("load_snapshot"):
+                for task_data in stream.iter_records():
                     # Ensure all necessary fields are present and handle potential errors
                     try:
-                        task = Task(
-                            id=task_data.get('id'),
-                            description=task_data.get('description', 'No description'), # Default description
-                            status=TaskStatusEnum(task_data.get('status', TaskStatusEnum.TODO.value)), # Default status
-                            createdAt=datetime.datetime.fromisoformat(task_data.get('createdAt', datetime.datetime.now().isoformat())),
-                            updatedAt=datetime.datetime.fromisoformat(task_data.get('updatedAt', datetime.datetime.now().isoformat()))
-                        )
-                        loaded_tasks.append(task)
+                        loaded_tasks.put(self._deserialize_task(task_data))
                     except (ValueError, TypeError) as e:
                         print(f"Warning: Skipping malformed task data: {task_data}. Error: {e}")
-                self._tasks = loaded_tasks
-                self._next_id = data.get("next_id", 1)
+            self._count_bytes("read", "snapshot", os.path.getsize(self.file_path))
+            self._tasks = loaded_tasks
+            self._next_id = stream.header.get("next_id", 1)
+            self._journal_seq = stream.header.get("journal_seq", 0)
+            self._version = stream.header.get("version", 0)
         except (IOError, json.JSONDecodeError) as e:
-            # If file is corrupted or other IO error, start fresh
-            print(f"Warning: Could not load tasks from {self.file_path}. Error: {e}. Starting fresh.")
-            self._tasks = []
+            # If file is corrupted or other IO error, keep it aside for recovery and start fresh
+            backup_path = f"{self.file_path}.corrupt-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+            try:
+                os.replace(self.file_path, backup_path)
+                print(f"Warning: Could not load tasks from {self.file_path}. Error: {e}. "
+                      f"The unreadable file was moved to {backup_path}. Starting fresh.")
+            except OSError:
+                print(f"Warning: Could not load tasks from {self.file_path}. Error: {e}. Starting fresh.")
+            self._tasks = TaskIndex()
             self._next_id = 1
             # Attempt to create a fresh file if loading failed badly
-            with open(self.file_path, 'w') as f:
-                json.dump({"tasks": [], "next_id": 1}, f, indent=4)
+            self._write_snapshot(self._snapshot_data())
+
+    def _load_header(self) -> bool:
+        """
+        Reads next_id and journal_seq without loading any task.
+
+        The snapshot keeps these keys before the tasks array, so only the start
+        of the file is read; the journal (bounded by the compaction thresholds)
+        is read to find its last record.
+
+        Returns:
+            bool: False if the files need the full load instead, e.g. because
+                  the snapshot is missing, unreadable or written by an older
+                  version, or the journal ends with an incomplete record.
+        """
+        header = self._read_header()
+        if header is None or not isinstance(header.get("next_id"), int):
+            return False
+        next_id = header["next_id"]
+        journal_seq = header.get("journal_seq", 0)
+
+        data = b""
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+        lines = data.splitlines()
+        if lines:
+            try:
+                if not data.endswith(b"\n"):
+                    raise ValueError("incomplete record")
+                last = json.loads(lines[-1])
+                journal_seq = max(journal_seq, last["seq"])
+                next_id = max(next_id, last.get("next_id", 1))
+            except (ValueError, KeyError, TypeError):
+                return False # Let the full load report and truncate the corrupt tail
+
+        self._next_id = next_id
+        self._journal_seq = journal_seq
+        self._journal_records = len(lines) # Approximate: a batch line counts once
+        self._journal_bytes = len(data)
+        self._header_loaded = True
+        return True
+
+    def _read_header(self) -> Optional[Dict[str, Any]]:
+        """
+        Reads the top-level keys stored before the tasks array of the snapshot.
+
+        Returns:
+            Optional[Dict[str, Any]]: The header, or None if the snapshot is missing or unreadable.
+        """
+        if not os.path.exists(self.file_path):
+            return None
+        stream = TaskJsonStream(self.file_path)
+        records = stream.iter_records()
+        try:
+            next(records, None) # Header keys stored before the tasks array are known by now
+        except (IOError, json.JSONDecodeError):
+            return None
+        finally:
+            records.close()
+        return stream.header
+
+    def _replay_journal(self, start: int = 0):
+        """
+        Applies journal records newer than the snapshot to the loaded tasks.
+
+        Args:
+            start (int): Byte offset to resume from; records before it have already
+                         been applied (used to catch up with other processes).
+        """
+        if not start:
+            self._journal_records = 0
+            self._journal_bytes = 0
+        if not os.path.exists(self.journal_path):
+            return
+
+        valid_bytes = start
+        truncated = False
+        with self._phase("load_journal"), open(self.journal_path, 'rb') as f:
+            f.seek(start)
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete record")
+                    record = json.loads(line)
+                    if record["seq"] <= self._journal_seq:
+                        valid_bytes += len(line)
+                        continue # Already folded into the snapshot
+                    applied = self._apply_record(record)
+                except (ValueError, KeyError, TypeError) as e:
+                    # A crash mid-append leaves a partial last record; drop it and everything after it
+                    print(f"Warning: Ignoring corrupt journal record in {self.journal_path}. Error: {e}")
+                    truncated = True
+                    break
+                self._journal_seq = record["seq"]
+                self._next_id = max(self._next_id, record.get("next_id", 1))
+                self._journal_records += applied
+                valid_bytes += len(line)
+
+        if truncated:
+            with open(self.journal_path, 'r+b') as f:
+                f.truncate(valid_bytes)
+        self._count_bytes("read", "journal", valid_bytes - start)
+        self._journal_bytes = valid_bytes
+
+    def _apply_record(self, record: Dict[str, Any]) -> int:
+        """Applies a journal record to the loaded tasks and returns the number of mutations it held."""
+        if record["op"] == "batch":
+            return sum(self._apply_record(inner) for inner in record["records"])
+        if record["op"] == "put":
+            self._tasks.put(self._deserialize_task(record["task"]))
+        elif record["op"] == "delete":
+            self._tasks.remove(record["id"])
+        return 1
+
+    def _snapshot_data(self) -> Dict[str, Any]:
+        """Builds the JSON document describing the current state of the repository."""
+        # The header keys come first so that they can be read without parsing the tasks
+        with self._phase("save_build"):
+            return {
+                "version": self._version + 1,
+                "next_id": self._next_id,
+                "journal_seq": self._journal_seq,
+                "tasks": [self._serialize_task(task) for task in self._tasks]
+            }
+
+    def _write_snapshot(self, data: Dict[str, Any], postings: Optional[Dict[str, List[int]]] = None):
+        """
+        Writes a snapshot document to the JSON file.
+
+        The document is written to a temporary file in the same directory and
+        atomically renamed over the target, so readers and crashes only ever see
+        the old or the new snapshot, never a partially written one.
+
+        Args:
+            data (Dict[str, Any]): The snapshot document.
+            postings (Optional[Dict[str, List[int]]]): Search index postings captured with
+                                                       the snapshot, saved once it is in place.
+        """
+        import tempfile # Deferred: only needed for writes, and slow to import on the CLI start-up path
+
+        directory = os.path.dirname(self.file_path)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.file_path) + '.', suffix='.tmp')
+            try:
+                mode = os.stat(self.file_path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644 # mkstemp creates owner-only files; match what open() would have produced
+            os.chmod(tmp_path, mode)
+            with self._phase("save_write"):
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=4)
+                    f.flush()
+                    written = f.tell()
+                    if self.durability != DurabilityLevel.NONE:
+                        sync_data(f.fileno())
+                os.replace(tmp_path, self.file_path)
+            tmp_path = None
+            self._count_bytes("written", "snapshot", written)
+            self._version = data.get("version", self._version)
+            if self.durability == DurabilityLevel.FSYNC:
+                sync_directory(directory)
+            if postings is not None:
+                TaskSearchIndex.save(self.search_path, self._version, postings)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            print(f"Error: Could not save tasks to {self.file_path}. Error: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @contextmanager
+    def _synchronized(self, write: bool = True) -> Iterator[None]:
+        """
+        Holds the in-process lock and, in multiprocess mode, the file lock.
+
+        When the file lock is first acquired, the in-memory state catches up
+        with whatever other processes wrote since it was read. Reads only need
+        this in multiprocess mode; otherwise they run without locking.
+
+        Args:
+            write (bool): Whether the block mutates the repository.
+        """
+        if not write and not self.multiprocess:
+            yield
+            return
+        with self._lock:
+            if self.multiprocess:
+                self._acquire_file_lock()
+            try:
+                yield
+            finally:
+                if self.multiprocess:
+                    if self._deferred and self._dirty and not self._holding_lock:
+                        # Buffered changes are based on what this process has read, so other
+                        # processes stay locked out until they are flushed
+                        self._holding_lock = True
+                    else:
+                        self._release_file_lock()
+
+    def _acquire_file_lock(self):
+        """Takes the advisory file lock (reentrantly) and refreshes stale in-memory state."""
+        if self._lock_depth == 0:
+            self._lock_file = open(self.lock_path, 'a')
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+            self._refresh()
+        self._lock_depth += 1
+
+    def _release_file_lock(self):
+        """Releases one level of the file lock."""
+        self._lock_depth -= 1
+        if self._lock_depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _refresh(self):
+        """Catches up with changes other processes made since the files were last read."""
+        if not self._loaded:
+            self._header_loaded = False # The append-only add path must re-read the header
+            return
+        header = self._read_header()
+        if header is None or header.get("version", 0) != self._version:
+            self._load() # Someone wrote a new snapshot
+            return
+        if self.journal:
+            size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+            if size < self._journal_bytes:
+                self._load() # The journal was compacted
+            elif size > self._journal_bytes:
+                self._replay_journal(start=self._journal_bytes) # Only the records appended since
 
     def _save(self):
         """Saves the current state of tasks to the JSON file."""
+        self._write_snapshot(self._snapshot_data(), self._search_postings())
+
+    def _append_journal(self, records: List[Dict[str, Any]]):
+        """
+        Appends mutation records to the journal as a single line, compacting it if it grew too large.
+
+        Several records are wrapped in one "batch" record so that a crash mid-write
+        drops the whole batch instead of applying part of it.
+        """
+        record = records[0] if len(records) == 1 else {"op": "batch", "records": records}
+        self._journal_seq += 1
+        record["seq"] = self._journal_seq
+        record["next_id"] = self._next_id
+        line = (json.dumps(record, separators=(',', ':')) + "\n").encode('utf-8')
         try:
-            # Convert Task objects to dictionaries for JSON serialization
-            serializable_tasks = []
-            for task in self._tasks:
-                serializable_tasks.append({
-                    "id": task.id,
-                    "description": task.description,
-                    "status": task.status.value,
-                    "createdAt": task.createdAt.isoformat(),
-                    "updatedAt": task.updatedAt.isoformat()
-                })
-        
-            with open(self.file_path, 'w') as f:
-                json.dump({"tasks": serializable_tasks, "next_id": self._next_id}, f, indent=4)
+            with self._phase("journal_append"), open(self.journal_path, 'ab') as f:
+                f.write(line)
+                if self.durability != DurabilityLevel.NONE:
+                    f.flush()
+                    if self.durability == DurabilityLevel.FSYNC:
+                        os.fsync(f.fileno())
+                    else:
+                        sync_data(f.fileno())
         except IOError as e:
-            print(f"Error: Could not save tasks to {self.file_path}. Error: {e}")
-    
+            print(f"Error: Could not append to journal {self.journal_path}. Error: {e}")
+            return
+        self._count_bytes("written", "journal", len(line))
+        self._journal_records += len(records)
+        self._journal_bytes += len(line)
+        if self._journal_records >= self.compact_records or self._journal_bytes >= self.compact_bytes:
+            self._schedule_compaction()
+
+    @classmethod
+    def _put_record(cls, task: Task) -> Dict[str, Any]:
+        """Builds the journal record for an added or updated task."""
+        return {"op": "put", "task": cls._serialize_task(task)}
+
+    @staticmethod
+    def _delete_record(task_id: int) -> Dict[str, Any]:
+        """Builds the journal record for a removed task."""
+        return {"op": "delete", "id": task_id}
+
+    def _persist(self, records: List[Dict[str, Any]]):
+        """Persists a batch of mutations with a single write, or buffers it inside defer_writes()."""
+        if not records:
+            return
+        if self._deferred:
+            if self.journal:
+                for record in records:
+                    # Every record carries the full task, so only the latest one per task matters
+                    task_id = record["task"]["id"] if record["op"] == "put" else record["id"]
+                    self._pending.pop(task_id, None)
+                    self._pending[task_id] = record
+            self._dirty = True
+            return
+        if self.journal:
+            self._append_journal(records)
+        else:
+            self._save()
+
+    def flush(self):
+        """Writes the changes buffered by defer_writes() as one journal record or one snapshot save."""
+        with self._lock:
+            if not self._dirty:
+                return
+            with self._synchronized():
+                if self.journal:
+                    records = list(self._pending.values())
+                    if records:
+                        self._append_journal(records)
+                else:
+                    self._save()
+                self._pending = {}
+                self._dirty = False
+            if self._holding_lock:
+                self._holding_lock = False
+                self._release_file_lock()
+
+    @contextmanager
+    def defer_writes(self) -> Iterator[None]:
+        """
+        Buffers mutations in memory and persists them together when the block exits.
+
+        Blocks can be nested; the buffer is flushed when the outermost one exits
+        or whenever flush() is called. Changes still buffered when the process
+        dies are lost.
+        """
+        with self._lock:
+            self._deferred += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._deferred -= 1
+                if not self._deferred:
+                    self.flush()
+
+    def _schedule_compaction(self):
+        """Starts a compaction, on a background thread unless configured otherwise."""
+        if not self.background_compaction:
+            self.compact()
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return # A compaction is already running and will pick up most of the backlog
+        # Non-daemon so that a short-lived CLI process waits for the snapshot to be written
+        self._compaction_thread = threading.Thread(target=self.compact, name="task-journal-compaction")
+        self._compaction_thread.start()
+
+    def compact(self):
+        """
+        Folds the journal into a fresh snapshot.
+
+        The snapshot is captured under the lock but written outside of it, so
+        mutations can keep appending to the journal while the (large) snapshot
+        write is in progress. Only the records covered by the snapshot are then
+        trimmed from the journal.
+
+        In multiprocess mode the whole compaction holds the file lock, because
+        a snapshot written by another process in between would be overwritten.
+        """
+        self._ensure_loaded()
+        if self.multiprocess:
+            with self._synchronized():
+                self._write_snapshot(self._snapshot_data(), self._search_postings())
+                self._trim_journal(self._journal_seq)
+            return
+        with self._compaction_lock:
+            with self._lock:
+                data = self._snapshot_data()
+                postings = self._search_postings()
+                seq = self._journal_seq
+            self._write_snapshot(data, postings)
+            with self._lock:
+                self._trim_journal(seq)
+
+    def _trim_journal(self, seq: int):
+        """Removes journal records with a sequence number up to and including seq."""
+        if not os.path.exists(self.journal_path):
+            return
+        if seq >= self._journal_seq:
+            # Nothing was appended while the snapshot was written
+            open(self.journal_path, 'wb').close()
+            self._journal_records = 0
+            self._journal_bytes = 0
+            return
+
+        import tempfile # Deferred, as in _write_snapshot()
+
+        with open(self.journal_path, 'rb') as f:
+            remaining = [line for line in f if json.loads(line)["seq"] > seq]
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.journal_path),
+                                        prefix=os.path.basename(self.journal_path) + '.', suffix='.tmp')
+        try:
+            os.chmod(tmp_path, os.stat(self.journal_path).st_mode & 0o777)
+            with os.fdopen(fd, 'wb') as f:
+                f.writelines(remaining)
+            os.replace(tmp_path, self.journal_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._journal_records = len(remaining)
+        self._journal_bytes = sum(len(line) for line in remaining)
+
+    def close(self):
+        """Waits for any running background compaction to finish."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+            self._compaction_thread = None
+        with self._lock:
+            if self._holding_lock:
+                self._holding_lock = False
+                self._release_file_lock()
+
     def add(self, description: str) -> Task:
         """Adds a new task to the JSON file."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks to the JSON file with a single write."""
         current_time = datetime.datetime.now()
-        task = Task(
-            id= self._next_id,
-            description=description,
-            createdAt=current_time,
-            updatedAt=current_time,
-            status=TaskStatusEnum.TODO
-        )
-        self._tasks.append(task)
-        self._next_id += 1
-        self._save()
-        return task
-        
-    def get_all(self, status: Optional[TaskStatusEnum] = None) -> List[Task]:
-        """Retrieves all tasks from the JSON file, optionally filtered by status."""
-        if status:
-            return [task for task in self._tasks if task.status == status] # Direct enum comparison
-        return self._tasks
+        with self._synchronized():
+            append_only = (not self._loaded and self.journal and not self._deferred
+                           and (self._header_loaded or self._load_header()))
+            if not append_only:
+                self._ensure_loaded()
+            tasks = []
+            for description in descriptions:
+                tasks.append(Task(
+                    id= self._next_id,
+                    description=description,
+                    createdAt=current_time,
+                    updatedAt=current_time,
+                    status=TaskStatusEnum.TODO
+                ))
+                self._next_id += 1
+            self._tasks.put_many(tasks)
+            self._persist([self._put_record(task) for task in tasks])
+        return tasks
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """
+        Retrieves tasks from the JSON file, optionally filtered by status and paginated.
+
+        In lazy mode a page (limit given) is streamed from the files without
+        loading every task, so the first page costs the same for any file size.
+        """
+        if limit is not None and not self._loaded:
+            return self._page(self._stream_tasks(status, after_id), limit, offset)
+        self._ensure_loaded()
+        with self._synchronized(write=False):
+            if limit is None and not offset and after_id is None:
+                return self._tasks.with_status(status) if status else self._tasks.all()
+            return self._page(self._tasks.iter_from(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the tasks, streaming them from the files in lazy mode until they are loaded."""
+        if not self._loaded:
+            return self._stream_tasks(status, after_id)
+        with self._synchronized(write=False):
+            return self._tasks.iter_from(status, after_id)
+
+    def _stream_tasks(self, status: Optional[TaskStatusEnum], after_id: Optional[int]) -> Iterator[Task]:
+        """
+        Yields tasks in ID order straight from the files, reading the snapshot only as far as needed.
+
+        The journal (kept small by compaction) is read first and its latest
+        record per task takes the place of the snapshot record. Tasks added since
+        the last compaction have higher ids than every snapshot task, so they
+        come last. Reading the journal before opening the snapshot keeps the
+        result consistent with a compaction that runs in between.
+        """
+        changes = self._journal_changes()
+        replaced = set()
+        last_id = after_id
+        try:
+            records = TaskJsonStream(self.file_path).iter_records() if os.path.exists(self.file_path) else ()
+            for task_data in records:
+                task_id = task_data.get('id') if isinstance(task_data, dict) else None
+                if task_id in changes:
+                    task_data = changes[task_id]
+                    replaced.add(task_id)
+                if task_data is None or not isinstance(task_id, int) or (after_id is not None and task_id <= after_id):
+                    continue
+                try:
+                    task = self._deserialize_task(task_data)
+                except (ValueError, TypeError):
+                    continue # Malformed record, skipped by the full load as well
+                if status is None or task.status == status:
+                    last_id = task_id
+                    yield task
+        except (IOError, json.JSONDecodeError):
+            # Let the full load deal with (and report) an unreadable file, then carry on from there
+            self._ensure_loaded()
+            yield from self._tasks.iter_from(status, last_id)
+            return
+
+        for task_id in sorted(changes.keys() - replaced):
+            task_data = changes[task_id]
+            if task_data is None or (after_id is not None and task_id <= after_id):
+                continue
+            try:
+                task = self._deserialize_task(task_data)
+            except (ValueError, TypeError):
+                continue
+            if status is None or task.status == status:
+                yield task
+
+    def _journal_changes(self) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Returns the latest journaled task data per id, with None for deleted tasks."""
+        changes: Dict[int, Optional[Dict[str, Any]]] = {}
+        if not os.path.exists(self.journal_path):
+            return changes
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break # Incomplete last record
+                try:
+                    record = json.loads(line)
+                    for inner in record["records"] if record["op"] == "batch" else [record]:
+                        if inner["op"] == "put" and isinstance(inner["task"].get("id"), int):
+                            changes[inner["task"]["id"]] = inner["task"]
+                        elif inner["op"] == "delete" and isinstance(inner["id"], int):
+                            changes[inner["id"]] = None
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    break # Corrupt record; the full load ignores it and everything after it
+        return changes
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """Retrieves a task by its ID from the JSON file."""
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None # Explicitly return None if not found
+        with self._synchronized(write=False):
+            if not self._loaded:
+                found, task = self._find_in_journal(task_id)
+                if found:
+                    return task
+                return self._find_in_file(task_id)
+            return self._tasks.get(task_id)
+
+    def search(self, query: str) -> List[Task]:
+        """Finds tasks by description through the inverted index, loading or building it on the first search."""
+        parsed = SearchQuery.parse(query)
+        self._ensure_loaded()
+        with self._synchronized(write=False), self._lock:
+            if self._tasks.search_index is None:
+                self._tasks.search_index = self._open_search_index()
+            return self._tasks.search(parsed)
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Finds tasks by timestamp through the sorted time index, built on the first range query."""
+        self._check_time_field(field)
+        self._ensure_loaded()
+        with self._synchronized(write=False), self._lock:
+            return self._tasks.between(field, since, until)
+
+    def _open_search_index(self) -> TaskSearchIndex:
+        """
+        Loads the saved search index, or builds it from the loaded tasks.
+
+        A saved index describes the snapshot version it was written with. Every
+        change since that snapshot is still in the journal (or buffered), so
+        re-indexing the tasks those records touch brings it up to date.
+        """
+        index = None
+        if self.persist_search_index and self._version and not (self._dirty and not self.journal):
+            index = TaskSearchIndex.load(self.search_path, self._version)
+        if index is not None:
+            for task_id in self._journal_changes().keys() | self._pending.keys():
+                task = self._tasks.get(task_id)
+                if task is not None:
+                    index.put(task)
+                else:
+                    index.remove(task_id)
+            return index
+
+        index = TaskSearchIndex(self._tasks)
+        if self.persist_search_index and self._version and not self._dirty:
+            TaskSearchIndex.save(self.search_path, self._version, index.postings())
+        return index
+
+    def _search_postings(self) -> Optional[Dict[str, List[int]]]:
+        """Captures the search index for saving with a snapshot, if it is built and saved at all."""
+        index = self._tasks.search_index
+        return index.postings() if self.persist_search_index and index is not None else None
+
+    def _find_in_journal(self, task_id: int) -> Tuple[bool, Optional[Task]]:
+        """
+        Looks for the latest journal record that touches a task.
+
+        The journal is in write order and every record holds the full task, so
+        the last matching record is the current state of the task, whether or
+        not it has been folded into the snapshot yet.
+
+        Returns:
+            Tuple[bool, Optional[Task]]: Whether the journal mentions the task, and
+                                         the task (None if its last record deletes it).
+        """
+        if not isinstance(task_id, int) or not os.path.exists(self.journal_path):
+            return False, None
+        found, task_data = False, None
+        # Records are written without whitespace, so this skips lines about other tasks cheaply
+        mentions_task = re.compile(rb'"id":%d[,}]' % task_id)
+        with open(self.journal_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break # Incomplete last record
+                if not mentions_task.search(line):
+                    continue
+                try:
+                    record = json.loads(line)
+                    for inner in record["records"] if record["op"] == "batch" else [record]:
+                        if inner["op"] == "put" and inner["task"].get("id") == task_id:
+                            found, task_data = True, inner["task"]
+                        elif inner["op"] == "delete" and inner["id"] == task_id:
+                            found, task_data = True, None
+                except (ValueError, KeyError, TypeError):
+                    break # Corrupt record; the full load ignores it and everything after it
+        if task_data is None:
+            return found, None
+        try:
+            return True, self._deserialize_task(task_data)
+        except (ValueError, TypeError):
+            return True, None
+
+    def _find_in_file(self, task_id: int) -> Optional[Task]:
+        """Streams the snapshot until the task is found, hydrating only the matching record."""
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            for task_data in TaskJsonStream(self.file_path).iter_records():
+                if isinstance(task_data, dict) and task_data.get('id') == task_id:
+                    try:
+                        return self._deserialize_task(task_data)
+                    except (ValueError, TypeError) as e:
+                        print(f"Warning: Skipping malformed task data: {task_data}. Error: {e}")
+                        return None
+        except (IOError, json.JSONDecodeError):
+            # Let the full load deal with (and report) an unreadable file
+            self._ensure_loaded()
+            return self._tasks.get(task_id)
+        except (ValueError, TypeError):
+            return None # Malformed record, skipped by the full load as well
+        return None
 
     def delete(self, task_id: int) -> bool:
         """Deletes a task by its ID from the JSON file."""
-        task_to_delete = self.get_by_id(task_id)
-        if task_to_delete:
-            self._tasks.remove(task_to_delete)
-            self._save()
-            return True
-        return False
-        
+        return self.delete_many([task_id])[0]
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks from the JSON file with a single write."""
+        with self._synchronized():
+            self._ensure_loaded()
+            deleted = self._tasks.remove_many(task_ids)
+            self._persist([self._delete_record(task_id) for task_id, found in zip(task_ids, deleted) if found])
+            return deleted
+
     def update(self, task: Task) -> Optional[Task]:
         """Updates an existing task in the JSON file."""
-        for i, existing_task in enumerate(self._tasks):
-            if existing_task.id == task.id:
-                task.updatedAt = datetime.datetime.now() # Ensure updatedAt is current
-                self._tasks[i] = task
-                self._save()
-                return task
-        return None
\ No newline at end of file
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks in the JSON file with a single write."""
+        current_time = datetime.datetime.now()
+        with self._synchronized():
+            self._ensure_loaded()
+            existing = [task for task in tasks if task.id in self._tasks]
+            for task in existing:
+                task.updatedAt = current_time # Ensure updatedAt is current
+            self._tasks.put_many(existing)
+            self._persist([self._put_record(task) for task in existing])
+            return [task if task.id in self._tasks else None for task in tasks]
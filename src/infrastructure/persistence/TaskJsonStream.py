@@ -0,0 +1,120 @@
+import json
+import re
+from typing import Any, Dict, Iterator, Optional
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+class TaskJsonStream:
+    """
+    Incremental reader for the tasks.json document.
+
+    The file is read in fixed-size chunks and the records of the "tasks" array
+    are decoded one at a time, so only the current chunk and the record being
+    decoded are held in memory. Callers can stop iterating as soon as they have
+    found what they need.
+
+    Attributes:
+        file_path (str): The path to the JSON file being read.
+        header (Dict[str, Any]): The top-level keys other than "tasks" (e.g. "next_id")
+                                 that have been read so far. Keys stored after the
+                                 tasks array are only available once iteration finishes.
+    """
+    def __init__(self, file_path: str, chunk_size: int = 64 * 1024):
+        """
+        Initializes the stream.
+
+        Args:
+            file_path (str): The path to the JSON file.
+            chunk_size (int): Number of characters read from the file at a time.
+        """
+        self.file_path = file_path
+        self.header: Dict[str, Any] = {}
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of the "tasks" array in file order.
+
+        Raises:
+            json.JSONDecodeError: If the document is malformed.
+        """
+        with open(self.file_path, 'r') as self._file:
+            self._buffer, self._pos, self._eof = "", 0, False
+            if self._peek() is None:
+                return # Empty file
+            self._expect('{')
+            if self._peek() == '}':
+                return
+            while True:
+                key = self._decode_value()
+                self._expect(':')
+                if key == "tasks":
+                    yield from self._iter_array()
+                else:
+                    self.header[key] = self._decode_value()
+                if self._peek() == ',':
+                    self._pos += 1
+                    continue
+                self._expect('}')
+                return
+
+    def _iter_array(self) -> Iterator[Any]:
+        """Yields the elements of the array starting at the current position."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._peek() == ',':
+                self._pos += 1
+                continue
+            self._expect(']')
+            return
+
+    def _fill(self) -> bool:
+        """Reads the next chunk into the buffer, dropping what has been consumed. Returns False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> Optional[str]:
+        """Skips whitespace and returns the next character without consuming it, or None at EOF."""
+        while True:
+            self._pos = WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return None
+
+    def _expect(self, char: str):
+        """Consumes the next non-whitespace character, which must be `char`."""
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decodes the JSON value at the current position, reading more chunks until it is complete."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            if end == len(self._buffer) and self._fill():
+                continue # A number at the end of the buffer may continue in the next chunk
+            self._pos = end
+            return value
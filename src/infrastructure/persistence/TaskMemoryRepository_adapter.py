@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+from src.domain.SearchQuery import SearchQuery
 from src.domain.Task import Task, TaskStatusEnum
 from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskIndex import TaskIndex
 import datetime
 
 class TaskMemoryRepository(TaskRepositoryPort):
@@ -12,50 +14,72 @@ class TaskMemoryRepository(TaskRepositoryPort):
     across sessions is not required.
     """
     def __init__(self):
-        """Initializes the TaskMemoryRepository with an empty list of tasks."""
-        self._tasks: List[Task] = []
+        """Initializes the TaskMemoryRepository with an empty task index."""
+        self._tasks: TaskIndex = TaskIndex()
         self._next_id: int = 1 # Simple counter for unique IDs
 
     def add(self, description: str) -> Task:
         """Adds a new task to the in-memory store."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks to the in-memory store."""
         current_time = datetime.datetime.now()
-        task = Task(
-            id=self._next_id, 
-            description=description,
-            status=TaskStatusEnum.TODO,
-            createdAt=current_time,
-            updatedAt=current_time
-        )
-        self._tasks.append(task)
-        self._next_id += 1
-        return task
+        tasks = []
+        for description in descriptions:
+            tasks.append(Task(
+                id=self._next_id,
+                description=description,
+                status=TaskStatusEnum.TODO,
+                createdAt=current_time,
+                updatedAt=current_time
+            ))
+            self._next_id += 1
+        self._tasks.put_many(tasks)
+        return tasks
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """Retrieves a task by its ID from the in-memory store."""
-        for task in self._tasks:
-            if task.id == task_id:
-                return task
-        return None # Explicitly return None if not found
+        return self._tasks.get(task_id)
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks from the in-memory store, optionally filtered by status and paginated."""
+        if limit is None and not offset and after_id is None:
+            return self._tasks.with_status(status) if status else self._tasks.all()
+        return self._page(self._tasks.iter_from(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the in-memory store without copying it; it must not be changed meanwhile."""
+        return self._tasks.iter_from(status, after_id)
 
-    def get_all(self, status: Optional[TaskStatusEnum] = None) -> List[Task]:
-        """Retrieves all tasks from the in-memory store, optionally filtered by status."""
-        if status:
-            return [task for task in self._tasks if task.status == status] # Direct enum comparison
-        return self._tasks
+    def search(self, query: str) -> List[Task]:
+        """Finds tasks by description through the inverted index, built on the first search."""
+        return self._tasks.search(SearchQuery.parse(query))
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Finds tasks by timestamp through the sorted time index, built on the first range query."""
+        self._check_time_field(field)
+        return self._tasks.between(field, since, until)
 
     def update(self, task: Task) -> Optional[Task]: # Changed parameter name to 'task'
         """Updates an existing task in the in-memory store."""
-        for i, existing_task in enumerate(self._tasks):
-            if existing_task.id == task.id:
-                task.updatedAt = datetime.datetime.now() # Ensure updatedAt is current
-                self._tasks[i] = task
-                return task
-        return None # Return None if task to update is not found
-    
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks in the in-memory store."""
+        current_time = datetime.datetime.now()
+        existing = [task for task in tasks if task.id in self._tasks]
+        for task in existing:
+            task.updatedAt = current_time # Ensure updatedAt is current
+        self._tasks.put_many(existing)
+        return [task if task.id in self._tasks else None for task in tasks] # None if task to update is not found
+
     def delete(self, task_id: int) -> bool:
         """Deletes a task by its ID from the in-memory store."""
-        task_to_delete = self.get_by_id(task_id)
-        if task_to_delete:
-            self._tasks.remove(task_to_delete)
-            return True
-        return False
\ No newline at end of file
+        return self.delete_many([task_id])[0]
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks by their IDs from the in-memory store."""
+        return self._tasks.remove_many(task_ids)
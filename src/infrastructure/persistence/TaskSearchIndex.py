@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+from bisect import bisect_left
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from src.domain.SearchQuery import SearchQuery, tokenize
+from src.domain.Task import Task
+
+class TaskSearchIndex:
+    """
+    Inverted index from description words to task ids.
+
+    Every word maps to the set of ids of the tasks whose description contains
+    it, so a query only touches the postings of its own words instead of
+    every description. The index also remembers the words of each task so
+    that an update or delete removes exactly the postings the task had; an
+    index loaded from disk only derives that map from the postings once it
+    is first changed. Prefix terms are matched against a sorted copy of the
+    vocabulary, which is rebuilt only after words are added or dropped.
+    """
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initializes the index.
+
+        Args:
+            tasks (Iterable[Task]): Tasks to index.
+        """
+        self._postings: Dict[str, Set[int]] = {}
+        self._words: Optional[Dict[int, FrozenSet[str]]] = {} # Words indexed for each task id
+        self._vocabulary: Optional[List[str]] = None # Sorted words, rebuilt on demand
+        postings, words = self._postings, self._words
+        for task in tasks:
+            # Same as put() for tasks that are not indexed yet, without the bookkeeping for replacements
+            task_words = words[task.id] = frozenset(tokenize(task.description))
+            for word in task_words:
+                ids = postings.get(word)
+                if ids is None:
+                    ids = postings[word] = set()
+                ids.add(task.id)
+
+    def __len__(self) -> int:
+        return len(self._task_words())
+
+    def _task_words(self) -> Dict[int, FrozenSet[str]]:
+        """Returns the words indexed for each task id, deriving them from the postings if needed."""
+        if self._words is None:
+            words: Dict[int, List[str]] = {}
+            for word, ids in self._postings.items():
+                for task_id in ids:
+                    words.setdefault(task_id, []).append(word)
+            self._words = {task_id: frozenset(task_words) for task_id, task_words in words.items()}
+        return self._words
+
+    def put(self, task: Task):
+        """Indexes a task, replacing what was indexed for its id before."""
+        words = frozenset(tokenize(task.description))
+        old_words = self._task_words().get(task.id, frozenset())
+        if words == old_words:
+            return
+        self._unlink(task.id, old_words - words)
+        for word in words - old_words:
+            ids = self._postings.get(word)
+            if ids is None:
+                ids = self._postings[word] = set()
+                self._vocabulary = None
+            ids.add(task.id)
+        self._words[task.id] = words
+
+    def remove(self, task_id: int):
+        """Removes a task from the index, if it is indexed."""
+        self._unlink(task_id, self._task_words().pop(task_id, frozenset()))
+
+    def _unlink(self, task_id: int, words: Iterable[str]):
+        """Removes a task id from the postings of the given words, dropping postings that become empty."""
+        for word in words:
+            ids = self._postings[word]
+            ids.discard(task_id)
+            if not ids:
+                del self._postings[word]
+                self._vocabulary = None
+
+    def search(self, query: SearchQuery) -> Set[int]:
+        """
+        Returns the ids of the tasks that match every term and prefix of the query.
+
+        The postings are intersected smallest first, so the cost is bounded by
+        the rarest word of the query.
+        """
+        candidates = [self._postings.get(term, set()) for term in query.terms]
+        candidates += [self._prefix_ids(prefix) for prefix in query.prefixes]
+        candidates.sort(key=len)
+        result = set(candidates[0])
+        for ids in candidates[1:]:
+            if not result:
+                break
+            result &= ids
+        return result
+
+    def _prefix_ids(self, prefix: str) -> Set[int]:
+        """Returns the union of the postings of every word starting with prefix."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        ids: Set[int] = set()
+        position = bisect_left(self._vocabulary, prefix)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(prefix):
+            ids |= self._postings[self._vocabulary[position]]
+            position += 1
+        return ids
+
+    def postings(self) -> Dict[str, List[int]]:
+        """Returns a copy of the postings, detached from later changes, e.g. to save it."""
+        return {word: list(ids) for word, ids in self._postings.items()}
+
+    @staticmethod
+    def save(path: str, version: int, postings: Dict[str, List[int]]):
+        """
+        Writes postings to a file, tagged with the version of the data they describe.
+
+        The file is written to a uniquely named temporary file next to it and
+        renamed over it, so a reader never sees a partial index and processes
+        rebuilding the index at the same time do not write into each other's
+        temporary file.
+        """
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix=os.path.basename(path) + '.',
+                                            suffix='.tmp')
+            os.chmod(tmp_path, 0o644) # mkstemp creates owner-only files; match what open() would have produced
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"version": version, "postings": postings}, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except (IOError, OSError) as e:
+            print(f"Warning: Could not save the search index to {path}. Error: {e}")
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @classmethod
+    def load(cls, path: str, version: int) -> Optional["TaskSearchIndex"]:
+        """
+        Reads an index saved by save().
+
+        Returns:
+            Optional[TaskSearchIndex]: The index, or None if the file is missing,
+                                       unreadable or describes another version.
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") != version:
+                return None
+            index = cls()
+            index._postings = {word: set(ids) for word, ids in data["postings"].items()}
+        except (IOError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+        index._words = None # Derived from the postings once the index is first changed
+        return index
@@ -0,0 +1,326 @@
+import datetime
+import json
+import os
+import tempfile
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from src.domain.MetricsRecorder_port import MetricsRecorderPort
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.TaskIndex import TaskIndex
+from src.infrastructure.persistence.TaskJsonFormat import (
+    DurabilityLevel, NO_PHASE, deserialize_task, serialize_task, sync_data, sync_directory
+)
+
+MANIFEST_NAME = "manifest.json"
+DEFAULT_SHARD_SIZE = 1000 # Task ids per shard file
+
+class TaskShardedJsonRepository(TaskRepositoryPort):
+    """
+    A JSON TaskRepositoryPort that splits the tasks across shard files by id range.
+
+    The store is a directory holding a small `manifest.json` with `next_id`
+    and the shard size, and one `shard-NNNNNN.json` per range of `shard_size`
+    ids: shard 0 holds ids 1 to shard_size, shard 1 the next shard_size ids,
+    and so on. Tasks are stored in the same format as in tasks.json, so a
+    shard can be read (and fixed) by hand.
+
+    A shard is only read when a task in its range is first needed, so a
+    lookup or a change by id loads one shard rather than the whole dataset.
+    Each change rewrites only the shards holding the changed tasks, plus the
+    manifest when tasks are added, so the cost of a write is bounded by the
+    shard size instead of the number of tasks. Listing, search and time range
+    queries read every shard once.
+
+    The manifest is written before the shards on add, so a crash in between
+    can only skip ids, never hand out an id that a shard already holds. Each
+    file is replaced atomically through a temporary file. Shards that end up
+    empty are removed. There is no cross-process locking: use one process at
+    a time, or the daemon, as with the SQLite and binary backends.
+
+    Attributes:
+        directory (str): The directory holding the manifest and the shards.
+        shard_size (int): The number of ids per shard; fixed when the store is created.
+        durability (DurabilityLevel): How hard each file write is pushed to disk.
+        metrics (Optional[MetricsRecorderPort]): Where shard loads and saves are recorded, if anywhere.
+    """
+    def __init__(self, directory: Optional[str] = None, shard_size: int = DEFAULT_SHARD_SIZE,
+                 durability: DurabilityLevel = DurabilityLevel.NONE,
+                 metrics: Optional[MetricsRecorderPort] = None):
+        """
+        Initializes the TaskShardedJsonRepository and reads its manifest.
+
+        Args:
+            directory (Optional[str]): The store directory. If None, 'data/tasks.shards' is used.
+            shard_size (int): The number of ids per shard for a new store. An existing
+                              store keeps the shard size recorded in its manifest.
+            durability (DurabilityLevel): How hard each file write is pushed to disk. Defaults
+                                          to NONE; DATASYNC and FSYNC cost a sync per file written.
+            metrics (Optional[MetricsRecorderPort]): Records the `load_shard` and `save_shard`
+                                                     phases and the bytes read and written.
+
+        Raises:
+            ValueError: If shard_size is not positive or the manifest cannot be read.
+        """
+        if shard_size < 1:
+            raise ValueError("The shard size must be at least 1.")
+        self.directory: str = directory or os.path.abspath(
+            os.path.join(os.path.dirname(__file__), '../../../data/tasks.shards'))
+        self.shard_size = shard_size
+        self.durability = durability
+        self.metrics = metrics
+        self.manifest_path: str = os.path.join(self.directory, MANIFEST_NAME)
+
+        self._next_id: int = 1
+        self._shards: Dict[int, TaskIndex] = {} # Loaded shards by number
+        self._dirty_shards: Set[int] = set() # Shards changed since they were last written
+        self._manifest_dirty: bool = False
+        self._deferred: int = 0 # Depth of nested defer_writes() blocks
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._load_manifest()
+
+    def _load_manifest(self):
+        """Reads next_id and the shard size, creating the manifest of a new store."""
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+            self._next_id = manifest["next_id"]
+            self.shard_size = manifest["shard_size"]
+        except FileNotFoundError:
+            self._write_manifest()
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            # Without next_id, new tasks could overwrite existing ones, so refuse to guess
+            raise ValueError(f"Could not read the shard manifest {self.manifest_path}: {e}")
+
+    def _phase(self, name: str) -> AbstractContextManager:
+        """Times a load or save phase if metrics are enabled."""
+        if self.metrics is None:
+            return NO_PHASE
+        return self.metrics.timer("json_phase_seconds", phase=name)
+
+    def _count_bytes(self, direction: str, file: str, amount: int):
+        """Counts bytes read or written if metrics are enabled."""
+        if self.metrics is not None:
+            self.metrics.inc(f"json_bytes_{direction}_total", amount, file=file)
+
+    def _shard_number(self, task_id: int) -> int:
+        return (task_id - 1) // self.shard_size
+
+    def shard_path(self, number: int) -> str:
+        """Returns the path of a shard file."""
+        return os.path.join(self.directory, f"shard-{number:06d}.json")
+
+    def _shard_count(self) -> int:
+        """Returns the number of shards that ids handed out so far can fall into."""
+        return self._shard_number(self._next_id - 1) + 1 if self._next_id > 1 else 0
+
+    def _shard(self, number: int) -> TaskIndex:
+        """Returns a shard, reading its file on first access."""
+        shard = self._shards.get(number)
+        if shard is None:
+            shard = self._shards[number] = self._load_shard(number)
+        return shard
+
+    def _load_shard(self, number: int) -> TaskIndex:
+        """Reads a shard file; a missing file is an empty shard."""
+        path = self.shard_path(number)
+        shard = TaskIndex()
+        try:
+            with self._phase("load_shard"), open(path) as f:
+                data = json.load(f)
+                for task_data in data["tasks"]:
+                    try:
+                        shard.put(deserialize_task(task_data))
+                    except (ValueError, TypeError) as e:
+                        print(f"Warning: Skipping malformed task data: {task_data}. Error: {e}")
+            self._count_bytes("read", "shard", os.path.getsize(path))
+        except FileNotFoundError:
+            pass
+        except (IOError, ValueError, KeyError, TypeError) as e:
+            # Keep the unreadable file for recovery; the shard starts empty and is rewritten on the next change
+            backup_path = f"{path}.corrupt-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+            try:
+                os.replace(path, backup_path)
+                print(f"Warning: Could not load tasks from {path}. Error: {e}. "
+                      f"The unreadable file was moved to {backup_path}.")
+            except OSError:
+                print(f"Warning: Could not load tasks from {path}. Error: {e}.")
+            shard = TaskIndex()
+        return shard
+
+    def _write_file(self, path: str, data: Dict[str, Any], file: str):
+        """
+        Writes a JSON document through a temporary file and a rename.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        # A unique temporary file, so that two writers never write into the same one
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except FileNotFoundError:
+                mode = 0o644 # mkstemp creates owner-only files; match what open() would have produced
+            os.chmod(tmp_path, mode)
+            with self._phase("save_shard"):
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=4)
+                    f.flush()
+                    written = f.tell()
+                    if self.durability != DurabilityLevel.NONE:
+                        sync_data(f.fileno())
+                os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._count_bytes("written", file, written)
+
+    def _write_manifest(self):
+        """Writes next_id and the shard size."""
+        try:
+            self._write_file(self.manifest_path, {"next_id": self._next_id, "shard_size": self.shard_size}, "manifest")
+        except (IOError, OSError) as e:
+            print(f"Error: Could not save the shard manifest {self.manifest_path}. Error: {e}")
+            return
+        self._manifest_dirty = False
+
+    def _write_shard(self, number: int):
+        """Rewrites one shard file, or removes it once the shard is empty."""
+        path = self.shard_path(number)
+        shard = self._shards[number]
+        try:
+            if len(shard):
+                self._write_file(path, {"tasks": [serialize_task(task) for task in shard]}, "shard")
+            elif os.path.exists(path):
+                os.remove(path)
+        except (IOError, OSError, TypeError, ValueError) as e:
+            print(f"Error: Could not save tasks to {path}. Error: {e}")
+            return
+        self._dirty_shards.discard(number)
+
+    def _persist(self):
+        """Writes the changed files unless writes are being deferred."""
+        if not self._deferred:
+            self.flush()
+
+    def flush(self):
+        """Writes the manifest, if ids were handed out, and every changed shard."""
+        if self._manifest_dirty:
+            self._write_manifest()
+        for number in sorted(self._dirty_shards):
+            self._write_shard(number)
+        if self.durability == DurabilityLevel.FSYNC:
+            sync_directory(self.directory)
+
+    @contextmanager
+    def defer_writes(self) -> Iterator[None]:
+        """
+        Buffers changes in memory and writes each changed shard once when the block exits.
+
+        Blocks can be nested; the files are written when the outermost one
+        exits or whenever flush() is called.
+        """
+        self._deferred += 1
+        try:
+            yield
+        finally:
+            self._deferred -= 1
+            if not self._deferred:
+                self.flush()
+
+    def add(self, description: str) -> Task:
+        """Adds a new task to the shard of its id."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks, writing the manifest and each shard they fall into once."""
+        current_time = datetime.datetime.now()
+        tasks = []
+        for description in descriptions:
+            task = Task(
+                id=self._next_id,
+                description=description,
+                status=TaskStatusEnum.TODO,
+                createdAt=current_time,
+                updatedAt=current_time
+            )
+            self._next_id += 1
+            number = self._shard_number(task.id)
+            self._shard(number).put(task)
+            self._dirty_shards.add(number)
+            tasks.append(task)
+        if tasks:
+            self._manifest_dirty = True
+            self._persist()
+        return tasks
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID, reading only its shard."""
+        if not 1 <= task_id < self._next_id:
+            return None
+        return self._shard(self._shard_number(task_id)).get(task_id)
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks in ID order, optionally filtered by status and paginated."""
+        if limit is None and not offset and after_id is None:
+            tasks: List[Task] = []
+            for number in range(self._shard_count()):
+                shard = self._shard(number)
+                tasks += shard.with_status(status) if status else shard.all()
+            return tasks
+        return self._page(self.iter_tasks(status, after_id), limit, offset)
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterates over the tasks in ID order, reading each shard as the iteration reaches it.
+
+        Shards before after_id are skipped without being read, so a keyset page
+        only reads the shards it covers. The repository must not be changed
+        until the iteration has finished.
+        """
+        first = self._shard_number(after_id + 1) if after_id is not None and after_id > 0 else 0
+        for number in range(first, self._shard_count()):
+            yield from self._shard(number).iter_from(status, after_id)
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Updates an existing task, rewriting only its shard."""
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks, rewriting each shard they are in once."""
+        current_time = datetime.datetime.now()
+        results: List[Optional[Task]] = []
+        for task in tasks:
+            if self.get_by_id(task.id) is None:
+                results.append(None) # None if task to update is not found
+                continue
+            task.updatedAt = current_time # Ensure updatedAt is current
+            number = self._shard_number(task.id)
+            self._shards[number].put(task)
+            self._dirty_shards.add(number)
+            results.append(task)
+        if self._dirty_shards:
+            self._persist()
+        return results
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task by its ID, rewriting only its shard."""
+        return self.delete_many([task_id])[0]
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks, rewriting each shard they were in once."""
+        deleted = []
+        for task_id in task_ids:
+            found = self.get_by_id(task_id) is not None
+            if found:
+                number = self._shard_number(task_id)
+                self._shards[number].remove(task_id)
+                self._dirty_shards.add(number)
+            deleted.append(found)
+        if self._dirty_shards:
+            self._persist()
+        return deleted
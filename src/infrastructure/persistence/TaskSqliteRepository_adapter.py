@@ -0,0 +1,218 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from src.domain.Task import Task, LazyTask, TaskStatusEnum, TIMESTAMP_FIELDS
+from src.domain.TaskRepository_port import TaskRepositoryPort
+
+from typing import Optional, List, Tuple, Iterator
+import datetime
+
+# The sqlite3 module keeps a per-connection cache of compiled statements keyed by
+# their SQL text, so using these constants for every call reuses the prepared statements.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    description TEXT NOT NULL,
+    status TEXT NOT NULL,
+    createdAt TEXT NOT NULL,
+    updatedAt TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_updatedAt ON tasks (updatedAt);
+CREATE INDEX IF NOT EXISTS idx_tasks_createdAt ON tasks (createdAt);
+"""
+INSERT_TASK = "INSERT INTO tasks (description, status, createdAt, updatedAt) VALUES (?, ?, ?, ?)"
+SELECT_ALL = "SELECT id, description, status, createdAt, updatedAt FROM tasks ORDER BY id"
+SELECT_BY_STATUS = "SELECT id, description, status, createdAt, updatedAt FROM tasks WHERE status = ? ORDER BY id"
+SELECT_PAGE = "SELECT id, description, status, createdAt, updatedAt FROM tasks WHERE id > ? ORDER BY id LIMIT ? OFFSET ?"
+SELECT_PAGE_BY_STATUS = ("SELECT id, description, status, createdAt, updatedAt FROM tasks "
+                         "WHERE status = ? AND id > ? ORDER BY id LIMIT ? OFFSET ?")
+# Timestamps are stored as ISO 8601 text, which sorts like the times it encodes
+SELECT_RANGE = {
+    field: f"SELECT id, description, status, createdAt, updatedAt FROM tasks "
+           f"WHERE {field} >= ? AND {field} < ? ORDER BY {field}, id"
+    for field in TIMESTAMP_FIELDS
+}
+NO_UPPER_BOUND = "~" # Sorts after every ISO 8601 timestamp
+SELECT_BY_ID = "SELECT id, description, status, createdAt, updatedAt FROM tasks WHERE id = ?"
+UPDATE_TASK = "UPDATE tasks SET description = ?, status = ?, createdAt = ?, updatedAt = ? WHERE id = ?"
+DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+class TaskSqliteRepository(TaskRepositoryPort):
+    """
+    A SQLite-based implementation of the TaskRepositoryPort.
+
+    Tasks are stored in a single table indexed on status, createdAt and
+    updatedAt, so mutations only touch the affected rows instead of rewriting
+    the whole dataset, and time range queries are index range scans. The database runs in WAL mode and the repository keeps a single
+    connection open for its lifetime.
+
+    Attributes:
+        file_path (str): The path to the SQLite database file.
+    """
+    def __init__(self, file_path: Optional[str] = None):
+        """
+        Initializes the TaskSqliteRepository.
+
+        Args:
+            file_path (Optional[str]): The path to the database file.
+                                       If None, a default path ('data/tasks.db') is used.
+        """
+        self.file_path: str = file_path or os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../data/tasks.db'))
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+
+        # Autocommit mode: every mutation is a single statement and commits on its own
+        self._connection = sqlite3.connect(self.file_path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL") # Durable across application crashes in WAL mode
+        self._connection.executescript(SCHEMA)
+
+    @staticmethod
+    def _row_to_task(row: Tuple) -> Task:
+        """Builds a Task object from a database row, leaving the timestamps to be parsed on first access."""
+        task_id, description, status, created_at, updated_at = row
+        return LazyTask(
+            id=task_id,
+            description=description,
+            status=TaskStatusEnum(status),
+            createdAt=created_at,
+            updatedAt=updated_at
+        )
+
+    @staticmethod
+    def _created_at_text(task: Task) -> str:
+        """Returns createdAt as stored text, without parsing it if it was loaded and never read."""
+        return task.timestamp_text("createdAt") if isinstance(task, LazyTask) else task.createdAt.isoformat()
+
+    def close(self):
+        """Closes the database connection."""
+        self._connection.close()
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Runs the enclosed statements in one transaction, rolling back if they raise.
+
+        Inside an open transaction (see defer_writes()) a savepoint is used
+        instead, so a failing batch only undoes its own statements.
+        """
+        if self._connection.in_transaction:
+            begin, rollback, commit = "SAVEPOINT batch", "ROLLBACK TO batch", "RELEASE batch"
+        else:
+            begin, rollback, commit = "BEGIN", "ROLLBACK", "COMMIT"
+        self._connection.execute(begin)
+        try:
+            yield
+        except BaseException:
+            self._connection.execute(rollback)
+            if commit == "RELEASE batch":
+                self._connection.execute(commit)
+            raise
+        self._connection.execute(commit)
+
+    def flush(self):
+        """Commits the transaction opened by defer_writes(), if any, and starts a new one."""
+        if self._connection.in_transaction:
+            self._connection.execute("COMMIT")
+            self._connection.execute("BEGIN")
+
+    @contextmanager
+    def defer_writes(self) -> Iterator[None]:
+        """Runs the enclosed mutations in one transaction that is committed when the block exits."""
+        if self._connection.in_transaction:
+            yield # Already inside an outer defer_writes() block
+            return
+        self._connection.execute("BEGIN")
+        try:
+            yield
+        finally:
+            self._connection.execute("COMMIT")
+
+    def add(self, description: str) -> Task:
+        """Adds a new task to the database."""
+        return self.add_many([description])[0]
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks to the database in a single transaction."""
+        current_time = datetime.datetime.now()
+        timestamp = current_time.isoformat()
+        tasks = []
+        with self._transaction():
+            for description in descriptions:
+                cursor = self._connection.execute(INSERT_TASK, (description, TaskStatusEnum.TODO.value, timestamp, timestamp))
+                tasks.append(Task(
+                    id=cursor.lastrowid,
+                    description=description,
+                    status=TaskStatusEnum.TODO,
+                    createdAt=current_time,
+                    updatedAt=current_time
+                ))
+        return tasks
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """Retrieves tasks from the database, optionally filtered by status and paginated."""
+        if limit is None and not offset and after_id is None:
+            if status:
+                rows = self._connection.execute(SELECT_BY_STATUS, (status.value,))
+            else:
+                rows = self._connection.execute(SELECT_ALL)
+        else:
+            rows = self._select_page(status, limit, offset, after_id)
+        return [self._row_to_task(row) for row in rows]
+
+    def iter_tasks(self, status: Optional[TaskStatusEnum] = None, after_id: Optional[int] = None) -> Iterator[Task]:
+        """Iterates over the tasks as SQLite produces the rows."""
+        return map(self._row_to_task, self._select_page(status, None, 0, after_id))
+
+    def _select_page(self, status: Optional[TaskStatusEnum], limit: Optional[int], offset: int,
+                     after_id: Optional[int]) -> sqlite3.Cursor:
+        """Runs the paginated query; the primary key index lets it start right after after_id."""
+        after_id = after_id if after_id is not None else 0 # Row ids are positive
+        limit = limit if limit is not None else -1 # A negative LIMIT means no limit
+        if status:
+            return self._connection.execute(SELECT_PAGE_BY_STATUS, (status.value, after_id, limit, offset))
+        return self._connection.execute(SELECT_PAGE, (after_id, limit, offset))
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """Retrieves the tasks in a time range through the index on the timestamp column."""
+        self._check_time_field(field)
+        bounds = (since.isoformat() if since is not None else "",
+                  until.isoformat() if until is not None else NO_UPPER_BOUND)
+        return [self._row_to_task(row) for row in self._connection.execute(SELECT_RANGE[field], bounds)]
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Retrieves a task by its ID from the database."""
+        row = self._connection.execute(SELECT_BY_ID, (task_id,)).fetchone()
+        return self._row_to_task(row) if row else None
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task by its ID from the database."""
+        return self._connection.execute(DELETE_TASK, (task_id,)).rowcount > 0
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks from the database in a single transaction."""
+        with self._transaction():
+            return [self._connection.execute(DELETE_TASK, (task_id,)).rowcount > 0 for task_id in task_ids]
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Updates an existing task in the database."""
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Updates several existing tasks in the database in a single transaction."""
+        current_time = datetime.datetime.now()
+        updated = []
+        with self._transaction():
+            for task in tasks:
+                cursor = self._connection.execute(
+                    UPDATE_TASK,
+                    (task.description, task.status.value, self._created_at_text(task), current_time.isoformat(), task.id)
+                )
+                updated.append(cursor.rowcount > 0)
+        for task, found in zip(tasks, updated):
+            if found:
+                task.updatedAt = current_time # Ensure updatedAt is current
+        return [task if found else None for task, found in zip(tasks, updated)]
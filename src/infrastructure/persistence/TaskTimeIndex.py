@@ -0,0 +1,77 @@
+import datetime
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.domain.Task import Task, TIMESTAMP_FIELDS
+
+class TaskTimeIndex:
+    """
+    Sorted indexes of task ids by createdAt and by updatedAt.
+
+    Each field keeps a list of (timestamp, id) pairs in ascending order, so a
+    range query finds both ends by binary search and then reads only the k
+    matching entries: O(log n + k). The index also remembers the timestamps
+    each task was indexed with, because the service changes updatedAt in
+    place before handing the task back, and the old entry has to be found
+    to move it. Updated tasks get the newest updatedAt, so moving an entry
+    is mostly a removal plus an append at the end of the list.
+    """
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initializes the index.
+
+        Args:
+            tasks (Iterable[Task]): Tasks to index.
+        """
+        self._stamps: Dict[int, Tuple[datetime.datetime, ...]] = {} # Indexed timestamps per id, in TIMESTAMP_FIELDS order
+        for task in tasks:
+            self._stamps[task.id] = tuple(getattr(task, field) for field in TIMESTAMP_FIELDS)
+        self._keys: Dict[str, List[Tuple[datetime.datetime, int]]] = {
+            field: sorted((stamps[position], task_id) for task_id, stamps in self._stamps.items())
+            for position, field in enumerate(TIMESTAMP_FIELDS)
+        }
+
+    def __len__(self) -> int:
+        return len(self._stamps)
+
+    def put(self, task: Task):
+        """Indexes a task, moving its entries if its timestamps changed since it was indexed."""
+        stamps = tuple(getattr(task, field) for field in TIMESTAMP_FIELDS)
+        old_stamps = self._stamps.get(task.id)
+        if stamps == old_stamps:
+            return
+        for position, field in enumerate(TIMESTAMP_FIELDS):
+            if old_stamps is not None and old_stamps[position] == stamps[position]:
+                continue
+            keys = self._keys[field]
+            if old_stamps is not None:
+                del keys[bisect_left(keys, (old_stamps[position], task.id))]
+            insort(keys, (stamps[position], task.id))
+        self._stamps[task.id] = stamps
+
+    def remove(self, task_id: int):
+        """Removes a task from the index, if it is indexed."""
+        stamps = self._stamps.pop(task_id, None)
+        if stamps is not None:
+            for position, field in enumerate(TIMESTAMP_FIELDS):
+                keys = self._keys[field]
+                del keys[bisect_left(keys, (stamps[position], task_id))]
+
+    def between(self, field: str, since: Optional[datetime.datetime] = None,
+                until: Optional[datetime.datetime] = None) -> List[int]:
+        """
+        Returns the ids of the tasks whose timestamp lies in [since, until).
+
+        Args:
+            field (str): "createdAt" or "updatedAt".
+            since (Optional[datetime.datetime]): Inclusive lower bound; None for no bound.
+            until (Optional[datetime.datetime]): Exclusive upper bound; None for no bound.
+
+        Returns:
+            List[int]: The ids, ordered by the timestamp and then by id.
+        """
+        keys = self._keys[field]
+        # A 1-tuple sorts before every pair that starts with the same timestamp
+        start = bisect_left(keys, (since,)) if since is not None else 0
+        end = bisect_left(keys, (until,)) if until is not None else len(keys)
+        return [task_id for _, task_id in keys[start:end]]
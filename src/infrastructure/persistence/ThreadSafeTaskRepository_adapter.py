@@ -0,0 +1,131 @@
+import copy
+from contextlib import contextmanager
+
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.TaskRepository_port import TaskRepositoryPort
+from src.infrastructure.persistence.ReadWriteLock import ReadWriteLock
+
+from typing import Iterator, Optional, List
+import datetime
+
+class ThreadSafeTaskRepository(TaskRepositoryPort):
+    """
+    A thread-safe implementation of the TaskRepositoryPort that guards another repository.
+
+    Reads (get_by_id, get_all) hold a shared read lock and run in parallel;
+    mutations hold the exclusive write lock, so id allocation and persistence
+    never interleave. Wrap a TaskMemoryRepository or TaskJsonRepository with it
+    to share one repository between the threads of a worker pool.
+
+    Tasks never cross the boundary by reference: reads return copies, and
+    add/update store copies of what the caller passes in, so a caller mutating
+    a task it holds cannot change the repository's state behind the lock, and
+    a list from get_all() is a stable snapshot. Changes take effect once the
+    task is passed to update().
+
+    Attributes:
+        repository (TaskRepositoryPort): The wrapped repository. It must not be used
+                                         directly while it is wrapped.
+    """
+    def __init__(self, repository: TaskRepositoryPort):
+        """
+        Initializes the ThreadSafeTaskRepository.
+
+        Args:
+            repository (TaskRepositoryPort): The repository to guard.
+        """
+        self.repository = repository
+        self._lock = ReadWriteLock()
+
+    @staticmethod
+    def _copy(task: Optional[Task]) -> Optional[Task]:
+        """Returns a detached copy of a task (every field is immutable, so a shallow copy suffices)."""
+        return copy.copy(task) if task is not None else None
+
+    def add(self, description: str) -> Task:
+        """Adds a new task under the write lock."""
+        with self._lock.write():
+            return self._copy(self.repository.add(description))
+
+    def add_many(self, descriptions: List[str]) -> List[Task]:
+        """Adds several tasks under one hold of the write lock."""
+        with self._lock.write():
+            return [self._copy(task) for task in self.repository.add_many(descriptions)]
+
+    def get_all(self, status: Optional[TaskStatusEnum] = None, limit: Optional[int] = None,
+                offset: int = 0, after_id: Optional[int] = None) -> List[Task]:
+        """
+        Returns a snapshot of the tasks, optionally filtered by status and paginated, under the read lock.
+
+        The inherited iter_tasks() is built on this method, so it yields copies
+        and only holds the read lock while it fetches each page.
+        """
+        with self._lock.read():
+            tasks = self.repository.get_all(status=status, limit=limit, offset=offset, after_id=after_id)
+            return [self._copy(task) for task in tasks]
+
+    def search(self, query: str) -> List[Task]:
+        """
+        Returns copies of the matching tasks under the write lock.
+
+        The wrapped repository may build its search index on the first search,
+        so searches are not run in parallel with each other.
+        """
+        with self._lock.write():
+            return [self._copy(task) for task in self.repository.search(query)]
+
+    def get_in_range(self, field: str = "updatedAt", since: Optional[datetime.datetime] = None,
+                     until: Optional[datetime.datetime] = None) -> List[Task]:
+        """
+        Returns copies of the tasks in a time range under the write lock.
+
+        Like the search index, the wrapped repository may build its timestamp
+        index on the first range query.
+        """
+        with self._lock.write():
+            return [self._copy(task) for task in self.repository.get_in_range(field, since, until)]
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Returns a copy of a task under the read lock."""
+        with self._lock.read():
+            return self._copy(self.repository.get_by_id(task_id))
+
+    def delete(self, task_id: int) -> bool:
+        """Deletes a task under the write lock."""
+        with self._lock.write():
+            return self.repository.delete(task_id)
+
+    def delete_many(self, task_ids: List[int]) -> List[bool]:
+        """Deletes several tasks under one hold of the write lock."""
+        with self._lock.write():
+            return self.repository.delete_many(task_ids)
+
+    def update(self, task: Task) -> Optional[Task]:
+        """Stores a copy of the task under the write lock."""
+        return self.update_many([task])[0]
+
+    def update_many(self, tasks: List[Task]) -> List[Optional[Task]]:
+        """Stores copies of several tasks under one hold of the write lock."""
+        with self._lock.write():
+            updated = self.repository.update_many([self._copy(task) for task in tasks])
+        for task, stored in zip(tasks, updated):
+            if stored is not None:
+                task.updatedAt = stored.updatedAt # Keep the caller's task in step, as the other adapters do
+        return [task if stored is not None else None for task, stored in zip(tasks, updated)]
+
+    def flush(self):
+        """Persists buffered writes under the write lock."""
+        with self._lock.write():
+            self.repository.flush()
+
+    @contextmanager
+    def defer_writes(self) -> Iterator[None]:
+        """Enters and leaves the wrapped repository's defer_writes() block under the write lock."""
+        deferred = self.repository.defer_writes()
+        with self._lock.write():
+            deferred.__enter__()
+        try:
+            yield
+        finally:
+            with self._lock.write():
+                deferred.__exit__(None, None, None)
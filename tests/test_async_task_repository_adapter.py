@@ -0,0 +1,86 @@
+import unittest
+import asyncio
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+from src.infrastructure.persistence.AsyncTaskRepository_adapter import AsyncTaskRepository
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.domain.Task import TaskStatusEnum
+
+class TestAsyncTaskRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.sync_repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        self.repository = AsyncTaskRepository(self.sync_repository)
+
+    async def asyncTearDown(self):
+        await self.repository.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_basic_operations(self):
+        task = await self.repository.add("Task 1")
+        self.assertEqual(await self.repository.get_by_id(task.id), task)
+        task.mark_as_done()
+        self.assertEqual(await self.repository.update(task), task)
+        self.assertEqual(await self.repository.get_all(status=TaskStatusEnum.DONE), [task])
+        self.assertTrue(await self.repository.delete(task.id))
+        self.assertEqual(await self.repository.get_all(), [])
+
+    async def test_iter_tasks_pages_through_get_all(self):
+        await self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        with patch('src.domain.AsyncTaskRepository_port.ITER_PAGE_SIZE', 2):
+            ids = [task.id async for task in self.repository.iter_tasks(after_id=1)]
+        self.assertEqual(ids, [2, 3, 4, 5])
+        self.assertEqual([task.id for task in await self.repository.get_all(limit=2, offset=1)], [2, 3])
+
+    async def test_mutations_are_persisted_before_returning(self):
+        await self.repository.add("Task 1")
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 1)
+
+    async def test_concurrent_mutations_share_one_save(self):
+        with patch.object(self.sync_repository, '_save', wraps=self.sync_repository._save) as save:
+            tasks = await asyncio.gather(*(self.repository.add(f"Task {i}") for i in range(20)))
+            self.assertEqual(save.call_count, 1)
+            self.assertEqual(sorted(task.id for task in tasks), list(range(1, 21)))
+
+            results = await asyncio.gather(*(self.repository.delete(task_id) for task_id in (1, 2, 99)))
+            self.assertEqual(results, [True, True, False])
+            self.assertEqual(save.call_count, 2)
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 18)
+
+    async def test_blocking_calls_run_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        threads = []
+        original = self.sync_repository.add_many
+
+        def record_thread(descriptions):
+            threads.append(threading.get_ident())
+            return original(descriptions)
+
+        with patch.object(self.sync_repository, 'add_many', side_effect=record_thread):
+            await self.repository.add_many(["Task 1"])
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], loop_thread)
+
+    async def test_cancelled_caller_does_not_cancel_the_save(self):
+        pending = asyncio.ensure_future(self.repository.add("Task 1"))
+        other = asyncio.ensure_future(self.repository.add("Task 2"))
+        await asyncio.sleep(0)
+        pending.cancel()
+        await other
+        await self.repository.flush()
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 2)
+
+    async def test_wraps_repositories_without_deferred_writes(self):
+        repository = AsyncTaskRepository(TaskMemoryRepository())
+        self.assertEqual([task.id for task in await repository.add_many(["A", "B"])], [1, 2])
+        self.assertEqual(await repository.delete_many([1, 3]), [True, False])
+        await repository.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import MagicMock
+from src.application.AsyncTodoService_adapter import AsyncTodoService
+from src.domain.Task import Task, TaskStatusEnum
+from src.domain.AsyncTaskRepository_port import AsyncTaskRepositoryPort
+import datetime
+
+class TestAsyncTodoService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Async methods of the spec become AsyncMocks
+        self.mock_repository = MagicMock(spec=AsyncTaskRepositoryPort)
+        self.service = AsyncTodoService(repository=self.mock_repository)
+        self.now = datetime.datetime.now()
+
+    def _create_sample_task(self, id=1, description="Test Task", status=TaskStatusEnum.TODO):
+        return Task(id=id, description=description, status=status, createdAt=self.now, updatedAt=self.now)
+
+    async def test_add_task(self):
+        sample_task = self._create_sample_task(description="New Task")
+        self.mock_repository.add.return_value = sample_task
+
+        task = await self.service.add_task("New Task")
+        self.mock_repository.add.assert_awaited_once_with(description="New Task")
+        self.assertEqual(task, sample_task)
+
+    async def test_list_tasks_in_range(self):
+        done = self._create_sample_task(id=1, status=TaskStatusEnum.DONE)
+        self.mock_repository.get_in_range.return_value = [done, self._create_sample_task(id=2)]
+        tasks = await self.service.list_tasks_in_range(since=self.now, status=TaskStatusEnum.DONE)
+        self.assertEqual(tasks, [done])
+        self.mock_repository.get_in_range.assert_awaited_once_with(field="updatedAt", since=self.now, until=None)
+
+    async def test_add_task_empty_description(self):
+        with self.assertRaises(ValueError) as context:
+            await self.service.add_task("   ")
+        self.assertEqual(str(context.exception), "Task description cannot be empty.")
+        self.mock_repository.add.assert_not_called()
+
+    async def test_list_tasks(self):
+        sample_tasks = [self._create_sample_task(id=1)]
+        self.mock_repository.get_all.return_value = sample_tasks
+        self.assertEqual(await self.service.list_tasks(TaskStatusEnum.TODO), sample_tasks)
+        self.mock_repository.get_all.assert_awaited_once_with(status=TaskStatusEnum.TODO)
+
+    async def test_complete_task(self):
+        sample_task = self._create_sample_task(id=1)
+        self.mock_repository.get_by_id.return_value = sample_task
+        self.mock_repository.update.side_effect = lambda task: task
+
+        task = await self.service.complete_task(1)
+        self.mock_repository.update.assert_awaited_once_with(sample_task)
+        self.assertEqual(task.status, TaskStatusEnum.DONE)
+
+    async def test_begin_task_not_found(self):
+        self.mock_repository.get_by_id.return_value = None
+        self.assertIsNone(await self.service.begin_task(99))
+        self.mock_repository.update.assert_not_called()
+
+    async def test_remove_task(self):
+        self.mock_repository.delete.return_value = True
+        self.assertTrue(await self.service.remove_task(1))
+        self.mock_repository.delete.assert_awaited_once_with(1)
+
+    async def test_complete_tasks(self):
+        task1 = self._create_sample_task(id=1)
+        self.mock_repository.get_by_id.side_effect = lambda task_id: {1: task1}.get(task_id)
+        self.mock_repository.update_many.side_effect = lambda tasks: list(tasks)
+
+        self.assertEqual(await self.service.complete_tasks([1, 2]), [task1, None])
+        self.mock_repository.update_many.assert_awaited_once_with([task1])
+        self.assertEqual(task1.status, TaskStatusEnum.DONE)
+
+    async def test_add_tasks_validates_first(self):
+        with self.assertRaises(ValueError):
+            await self.service.add_tasks(["Valid", ""])
+        self.mock_repository.add_many.assert_not_called()
+
+    async def test_flush(self):
+        await self.service.flush()
+        self.mock_repository.flush.assert_awaited_once_with()
+
+if __name__ == '__main__':
+    unittest.main()
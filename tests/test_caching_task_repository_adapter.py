@@ -0,0 +1,139 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import MagicMock, patch
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+from src.infrastructure.persistence.CachingTaskRepository_adapter import CachingTaskRepository, LRUCache
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.domain.Task import TaskStatusEnum
+
+class TestLRUCache(unittest.TestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), (True, 1)) # "b" is now the least recently used
+        cache.put("c", 3)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual((cache.hits, cache.misses, cache.evictions, len(cache)), (1, 1, 1, 2))
+
+    @patch('src.infrastructure.persistence.CachingTaskRepository_adapter.time.monotonic')
+    def test_entries_expire_after_ttl(self, monotonic):
+        monotonic.return_value = 100.0
+        cache = LRUCache(2, ttl=5)
+        cache.put("a", 1)
+        monotonic.return_value = 104.9
+        self.assertEqual(cache.get("a"), (True, 1))
+        monotonic.return_value = 105.0
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual((cache.expirations, len(cache)), (1, 0))
+
+    def test_invalid_settings_are_refused(self):
+        with self.assertRaises(ValueError):
+            LRUCache(0)
+        with self.assertRaises(ValueError):
+            LRUCache(1, ttl=0)
+
+class TestCachingTaskRepository(unittest.TestCase):
+    def setUp(self):
+        self.inner = MagicMock(wraps=TaskMemoryRepository())
+        self.repository = CachingTaskRepository(self.inner, max_tasks=2)
+
+    def test_get_by_id_is_read_through(self):
+        task = self.inner.add("Buy milk")
+        self.assertIs(self.repository.get_by_id(task.id), task)
+        self.assertIs(self.repository.get_by_id(task.id), task)
+        self.assertIsNone(self.repository.get_by_id(99))
+        self.assertIsNone(self.repository.get_by_id(99)) # Missing ids are not cached
+        self.assertEqual(self.inner.get_by_id.call_count, 3)
+        self.assertEqual(self.repository.stats()["tasks"],
+                         {"hits": 1, "misses": 3, "evictions": 0, "expirations": 0, "size": 1})
+
+    def test_get_all_is_cached_per_filter_and_page(self):
+        self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        self.assertEqual(len(self.repository.get_all()), 3)
+        self.assertEqual(len(self.repository.get_all(status=TaskStatusEnum.TODO)), 3)
+        self.assertEqual([task.id for task in self.repository.get_all(limit=1, after_id=1)], [2])
+        listed = self.repository.get_all()
+        listed.clear() # Callers get their own list
+        self.assertEqual(len(self.repository.get_all(status=TaskStatusEnum.TODO)), 3)
+        self.assertEqual(self.inner.get_all.call_count, 3)
+        self.assertEqual(self.repository.stats()["lists"]["hits"], 2)
+
+    def test_writes_go_through_and_keep_the_cache_current(self):
+        first, second = self.repository.add_many(["Task 1", "Task 2"])
+        self.assertEqual(len(self.repository.get_all(status=TaskStatusEnum.TODO)), 2)
+        self.assertIs(self.repository.get_by_id(first.id), first) # Cached by add
+        self.inner.get_by_id.assert_not_called()
+
+        first.mark_as_done()
+        self.repository.update(first)
+        self.assertEqual([task.id for task in self.repository.get_all(status=TaskStatusEnum.TODO)], [second.id])
+        self.assertTrue(self.repository.delete(second.id))
+        self.assertIsNone(self.repository.get_by_id(second.id))
+        self.assertEqual(self.repository.get_all(status=TaskStatusEnum.TODO), [])
+        self.assertEqual(self.inner.get_all.call_count, 3)
+        self.inner.update_many.assert_called_once()
+        self.inner.delete_many.assert_called_once()
+
+    def test_failed_update_drops_the_unsaved_task(self):
+        task = self.repository.add("Task 1")
+        self.inner.update_many.side_effect = OSError("Disk full")
+        with self.assertRaises(OSError):
+            task.description = "Unsaved"
+            self.repository.update(task)
+        self.inner.update_many.side_effect = None
+        self.assertEqual(self.repository.stats()["tasks"]["size"], 0)
+        self.repository.get_by_id(task.id)
+        self.inner.get_by_id.assert_called_once_with(task.id)
+
+    def test_cache_size_is_bounded(self):
+        tasks = self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        self.assertEqual(self.repository.stats()["tasks"]["size"], 2)
+        self.repository.get_by_id(tasks[0].id) # Evicted by the third add
+        self.inner.get_by_id.assert_called_once_with(tasks[0].id)
+
+    def test_hits_and_misses_are_recorded_as_metrics(self):
+        metrics = MetricsRegistry()
+        repository = CachingTaskRepository(TaskMemoryRepository(), metrics=metrics)
+        task = repository.add("Task 1")
+        repository.get_by_id(task.id)
+        repository.get_all()
+        repository.get_all()
+        self.assertEqual(metrics.counters(), {
+            ("cache_requests_total", (("cache", "lists"), ("result", "hit"))): 1,
+            ("cache_requests_total", (("cache", "lists"), ("result", "miss"))): 1,
+            ("cache_requests_total", (("cache", "tasks"), ("result", "hit"))): 1,
+        })
+
+    def test_uncached_reads_and_deferred_writes_pass_through(self):
+        self.repository.add_many(["Buy milk", "Walk dog"])
+        self.assertEqual([task.id for task in self.repository.search("milk")], [1])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(after_id=1)], [2])
+        with self.repository.defer_writes():
+            self.repository.add("Task 3")
+        self.inner.defer_writes.assert_called_once()
+        self.assertEqual(len(self.repository.get_in_range("createdAt")), 3)
+
+class TestCreateCache(unittest.TestCase):
+    def test_cache_is_only_added_when_configured(self):
+        import main
+        repository = TaskMemoryRepository()
+        with patch.dict(os.environ, {"TASK_TRACKER_CACHE_SIZE": ""}):
+            self.assertIs(main.create_cache(repository), repository)
+        with patch.dict(os.environ, {"TASK_TRACKER_CACHE_SIZE": "100", "TASK_TRACKER_CACHE_TTL": ""}):
+            self.assertIsInstance(main.create_cache(repository), CachingTaskRepository)
+
+    def test_multiprocess_store_requires_a_ttl(self):
+        import main
+        with tempfile.TemporaryDirectory() as temp_dir:
+            repository = TaskJsonRepository(os.path.join(temp_dir, 'tasks.json'), multiprocess=True)
+            with patch.dict(os.environ, {"TASK_TRACKER_CACHE_SIZE": "100", "TASK_TRACKER_CACHE_TTL": ""}):
+                with self.assertRaises(ValueError):
+                    main.create_cache(repository)
+            with patch.dict(os.environ, {"TASK_TRACKER_CACHE_SIZE": "100", "TASK_TRACKER_CACHE_TTL": "2"}):
+                self.assertEqual(main.create_cache(repository)._tasks.ttl, 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+import unittest
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+from unittest.mock import patch
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.cli.handler import CLIHandler, parse_time
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+from src.domain.Task import TaskStatusEnum
+
+class TestCLIHandlerParser(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.handler = CLIHandler(TodoService(TaskJsonRepository(os.path.join(self.temp_dir.name, 'tasks.json'))))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_only_the_requested_subparser_is_built(self):
+        with patch.object(self.handler, '_setup_parser', wraps=self.handler._setup_parser) as setup, \
+                contextlib.redirect_stdout(io.StringIO()) as output:
+            self.handler.handle(["add", "Buy milk"])
+        setup.assert_called_once_with(["add"])
+        self.assertIn("Task Added: [✗] ID: 1 - Buy milk", output.getvalue())
+
+    def test_full_parser_is_used_for_unknown_commands(self):
+        with contextlib.redirect_stderr(io.StringIO()) as errors, self.assertRaises(SystemExit):
+            self.handler.handle(["unknown"])
+        self.assertIn("mark-in-progress", errors.getvalue())
+
+class TestCLIHandlerList(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        repository = TaskJsonRepository(os.path.join(self.temp_dir.name, 'tasks.json'))
+        repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.handler = CLIHandler(TodoService(repository))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, args):
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            self.handler.handle(args)
+        return output.getvalue()
+
+    def test_list_pages_with_limit_and_after(self):
+        output = self._run(["list", "--limit", "2"])
+        self.assertEqual(output.splitlines(), [
+            "To-Do List:", "- [✗] ID: 1 - Task 1", "- [✗] ID: 2 - Task 2",
+            "More tasks follow; continue with --after 2."
+        ])
+        output = self._run(["list", "--limit", "3", "--after", "2"])
+        self.assertEqual(output.splitlines()[1:], ["- [✗] ID: 3 - Task 3", "- [✗] ID: 4 - Task 4", "- [✗] ID: 5 - Task 5"])
+
+    def test_list_writes_in_chunks(self):
+        with patch('src.infrastructure.cli.handler.OUTPUT_CHUNK_LINES', 3), \
+                patch('sys.stdout', new_callable=io.StringIO) as output, \
+                patch.object(output, 'write', wraps=output.write) as write:
+            self.handler.handle(["list"])
+        self.assertEqual(write.call_count, 2) # The header and two tasks, then the last three tasks
+        self.assertEqual(len(output.getvalue().splitlines()), 6)
+
+    def test_search(self):
+        output = self._run(["search", "task", "3"])
+        self.assertEqual(output.splitlines(), ['Tasks matching "task 3":', "- [✗] ID: 3 - Task 3"])
+        self.assertEqual(self._run(["search", "milk"]), 'No tasks match "milk".\n')
+
+    def test_list_after_last_task(self):
+        self.assertEqual(self._run(["list", "--after", "5"]), "No tasks found.\n")
+        self.assertIn("Input Error", self._run(["list", "--limit", "-1"]))
+        self.assertIn("Input Error: --limit must be at least 1.", self._run(["list", "--limit", "0"]))
+        self.assertIn("Input Error: --limit must be at least 1.", self._run(["list", "--since", "1h", "--limit", "0"]))
+
+    def test_list_in_time_range(self):
+        task = self.handler._service.get_task(4)
+        task.mark_as_done()
+        self.handler._service.repository.update(task)
+        tomorrow = (datetime.date.today() + datetime.timedelta(days=1)).isoformat()
+
+        output = self._run(["list", "--since", "1h", "--until", tomorrow, "--by", "created", "--limit", "4"])
+        self.assertEqual(output.splitlines()[0], "To-Do List:")
+        self.assertEqual(len(output.splitlines()), 6)
+        self.assertEqual(output.splitlines()[-1], "1 more task(s) in that time range; narrow it or raise --limit.")
+        output = self._run(["list", "--since", "1h", "--status", "done"])
+        self.assertEqual(output.splitlines(), ["To-Do List:", "- [✓] ID: 4 - Task 4"])
+        self.assertEqual(self._run(["list", "--since", tomorrow]), "No tasks found in that time range.\n")
+        self.assertIn("Input Error", self._run(["list", "--since", "1h", "--after", "2"]))
+
+    def test_parse_time(self):
+        self.assertEqual(parse_time("2024-05-01"), datetime.datetime(2024, 5, 1))
+        self.assertAlmostEqual(parse_time("2d"), datetime.datetime.now() - datetime.timedelta(days=2),
+                               delta=datetime.timedelta(seconds=5))
+        self.assertIsNone(parse_time("2024-05-01T09:30+00:00").tzinfo)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_time("yesterday")
+
+class TestCLIHandlerBatch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.commands_path = os.path.join(self.temp_dir.name, 'commands.txt')
+        self.repository = TaskJsonRepository(self.tasks_json_path)
+        self.handler = CLIHandler(TodoService(self.repository))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, args, stdin=None):
+        """Runs the handler and returns what it printed."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            if stdin is None:
+                self.handler.handle(args)
+            else:
+                with patch('sys.stdin', io.StringIO(stdin)):
+                    self.handler.handle(args)
+        return output.getvalue()
+
+    def _write_commands(self, lines):
+        with open(self.commands_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_batch_runs_commands_and_saves_once(self):
+        self._write_commands([
+            'add "Buy milk"',
+            'add "Walk the dog"',
+            '# A comment',
+            '',
+            'mark-done 1',
+            'mark-in-progress 2',
+            'remove 2',
+        ])
+        with patch.object(self.repository, '_save', wraps=self.repository._save) as save:
+            output = self._run(["batch", self.commands_path])
+        self.assertEqual(save.call_count, 1)
+        self.assertIn("Batch finished: 5 command(s) executed, 0 failed.", output)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        tasks = reloaded.get_all()
+        self.assertEqual([(task.id, task.description, task.status) for task in tasks],
+                         [(1, "Buy milk", TaskStatusEnum.DONE)])
+
+    def test_batch_reports_errors_per_line_and_continues(self):
+        self._write_commands([
+            'add "Valid"',
+            'add ""',
+            'unknown-command 1',
+            'add "unterminated',
+            'batch other.txt',
+            'stats',
+            'get 1',
+        ])
+        output = self._run(["batch", self.commands_path])
+        self.assertIn("Line 2: Input Error: Task description cannot be empty.", output)
+        self.assertIn("Line 3: Invalid command: unknown-command 1", output)
+        self.assertIn("Line 4: Input Error: No closing quotation", output)
+        self.assertIn("Line 5: Input Error: batch commands cannot be nested.", output)
+        self.assertIn("Line 6: Input Error: stats cannot be run inside a batch.", output)
+        self.assertIn("Task details: [✗] ID: 1 - Valid", output)
+        self.assertIn("Batch finished: 2 command(s) executed, 5 failed.", output)
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 1)
+
+    def test_batch_reads_stdin(self):
+        output = self._run(["batch"], stdin='add "From stdin"\nlist\n')
+        self.assertIn("- [✗] ID: 1 - From stdin", output)
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 1)
+
+    def test_batch_flushes_every_n_commands(self):
+        self._write_commands(['add "Task %d"' % i for i in range(5)])
+        with patch.object(self.repository, '_save', wraps=self.repository._save) as save:
+            self._run(["batch", self.commands_path, "--flush-every", "2"])
+        self.assertEqual(save.call_count, 3) # After commands 2 and 4, then at the end
+
+    def test_batch_missing_file(self):
+        output = self._run(["batch", os.path.join(self.temp_dir.name, 'missing.txt')])
+        self.assertIn("An unexpected error occurred", output)
+class TestCLIHandlerStats(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.metrics_path = os.path.join(self.temp_dir.name, 'metrics.json')
+        self.metrics = MetricsRegistry()
+        self.service = TodoService(TaskJsonRepository(os.path.join(self.temp_dir.name, 'tasks.json')))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, args, metrics=None):
+        handler = CLIHandler(self.service, metrics=metrics, metrics_path=self.metrics_path if metrics else None)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            handler.handle(args)
+        return output.getvalue()
+
+    def test_stats_combines_the_file_with_this_process(self):
+        earlier = MetricsRegistry()
+        earlier.observe("service_call_seconds", 0.002, method="add_task")
+        earlier.merge_into_file(self.metrics_path)
+        self.metrics.observe("service_call_seconds", 0.004, method="add_task")
+        self.metrics.inc("json_bytes_written_total", 120, file="journal")
+
+        lines = self._run(["stats"], self.metrics).splitlines()
+        self.assertTrue(lines[0].startswith("call"))
+        self.assertEqual(lines[1].split()[:4], ["service_call", "add_task", "2", "6.000"])
+        self.assertEqual(lines[2:], ["Counters:", "  json_bytes_written_total{file=journal} 120"])
+
+    def test_stats_writes_prometheus_and_resets(self):
+        self.metrics.inc("json_bytes_written_total", 120, file="journal")
+        self.metrics.merge_into_file(self.metrics_path)
+        prometheus_path = os.path.join(self.temp_dir.name, 'task_tracker.prom')
+        output = self._run(["stats", "--prometheus", prometheus_path, "--reset"], self.metrics)
+        self.assertIn("Metrics reset.", output)
+        with open(prometheus_path) as f:
+            self.assertIn('task_tracker_json_bytes_written_total{file="journal"} 120', f.read())
+        self.assertFalse(os.path.exists(self.metrics_path))
+        self.assertIn("No metrics recorded", self._run(["stats"], self.metrics))
+
+    def test_stats_when_disabled(self):
+        self.assertIn("Metrics are disabled", self._run(["stats"]))
+class TestCLIHandlerProfiling(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repository = TaskJsonRepository(os.path.join(self.temp_dir.name, 'tasks.json'), journal=True)
+        self.repository.add("Buy milk")
+        self.service = TodoService(self.repository)
+        self.handler = CLIHandler(self.service)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run(self, args):
+        with contextlib.redirect_stdout(io.StringIO()) as output, contextlib.redirect_stderr(io.StringIO()) as errors:
+            self.handler.handle(args)
+        return output.getvalue(), errors.getvalue()
+
+    def test_profile_reports_phases_and_functions_on_stderr(self):
+        output, report = self._run(["--profile", "--profile-top", "5", "mark-done", "1"])
+        self.assertEqual(output, "Task marked as done: [✓] ID: 1 - Buy milk\n")
+        for phase in ("argparse setup", "repository load", "save", "other repository work",
+                      "service logic and output", "total"):
+            self.assertIn(f"  {phase} ", report)
+        self.assertIn("Top 5 functions by cumulative time:", report)
+        self.assertIn("complete_task", report)
+        self.assertNotIn("allocation sites", report)
+        # The wrappers installed for the run are removed again
+        self.assertIs(self.service.repository, self.repository)
+        self.assertIsNone(self.repository.metrics)
+
+    def test_trace_memory_writes_to_a_file(self):
+        report_path = os.path.join(self.temp_dir.name, 'profile.txt')
+        output, errors = self._run(["--trace-memory", "--profile-output", report_path, "list"])
+        self.assertIn("- [✗] ID: 1 - Buy milk", output)
+        self.assertEqual(errors, "")
+        with open(report_path) as f:
+            report = f.read()
+        self.assertIn("Peak traced memory:", report)
+        self.assertIn("allocation sites", report)
+        self.assertNotIn("functions by cumulative time", report)
+
+    def test_profile_keeps_recording_enabled_metrics(self):
+        metrics = MetricsRegistry()
+        self.repository.metrics = metrics
+        self._run(["--profile", "add", "Walk dog"])
+        self.assertIs(self.repository.metrics, metrics)
+        self.assertIn(("json_phase_seconds", (("phase", "journal_append"),)), metrics.histograms())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from src.application.InstrumentedTodoService_adapter import InstrumentedTodoService
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
+from src.infrastructure.persistence.InstrumentedTaskRepository_adapter import InstrumentedTaskRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.domain.Task import TaskStatusEnum
+
+class TestInstrumentedAdapters(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+        self.repository = InstrumentedTaskRepository(TaskMemoryRepository(), self.metrics)
+        self.service = InstrumentedTodoService(TodoService(self.repository), self.metrics)
+
+    def _count(self, name, method):
+        histogram = self.metrics.histograms().get((name, (("method", method),)))
+        return histogram.count if histogram else 0
+
+    def test_calls_are_passed_through_and_timed(self):
+        task = self.service.add_task("Buy milk")
+        self.assertEqual(self.service.complete_task(task.id).status, TaskStatusEnum.DONE)
+        self.assertEqual([t.id for t in self.service.iter_tasks()], [task.id])
+        self.assertIs(self.service.repository, self.repository)
+
+        self.assertEqual(self._count("service_call_seconds", "add_task"), 1)
+        self.assertEqual(self._count("service_call_seconds", "complete_task"), 1)
+        self.assertEqual(self._count("service_call_seconds", "iter_tasks"), 1)
+        self.assertEqual(self._count("repository_call_seconds", "add"), 1)
+        self.assertEqual(self._count("repository_call_seconds", "get_by_id"), 1)
+        self.assertEqual(self._count("repository_call_seconds", "update"), 1)
+        self.assertEqual(self._count("repository_call_seconds", "iter_tasks"), 1)
+
+    def test_failed_calls_are_counted(self):
+        with self.assertRaises(ValueError):
+            self.service.add_task("")
+        self.assertEqual(self.metrics.counters(), {("service_call_errors_total", (("method", "add_task"),)): 1})
+        self.assertEqual(self._count("service_call_seconds", "add_task"), 1)
+
+    def test_deferred_writes_pass_through(self):
+        with self.service.defer_writes():
+            self.service.add_tasks(["Task 1", "Task 2"])
+        self.assertEqual(len(self.service.list_tasks()), 2)
+        self.assertEqual(self._count("repository_call_seconds", "add_many"), 1)
+
+    def test_transaction_passes_through(self):
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                self.service.add_task("Discarded")
+                raise RuntimeError("Step failed")
+        self.assertEqual(self.service.list_tasks(), [])
+        self.assertEqual(self._count("service_call_seconds", "add_task"), 1)
+        self.assertEqual(self._count("repository_call_seconds", "add"), 0) # Staged, never reached the repository
+
+if __name__ == '__main__':
+    unittest.main()
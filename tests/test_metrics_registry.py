@@ -0,0 +1,107 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry, Histogram, BUCKETS
+
+class TestHistogram(unittest.TestCase):
+    def test_quantile_interpolates_within_the_bucket(self):
+        histogram = Histogram()
+        for _ in range(100):
+            histogram.observe(0.0008) # In the (0.0005, 0.001] bucket
+        self.assertAlmostEqual(histogram.quantile(0.5), 0.00075)
+        self.assertAlmostEqual(histogram.quantile(1.0), 0.001)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.sum, 0.08)
+
+    def test_quantile_of_overflow_and_empty_histograms(self):
+        histogram = Histogram()
+        self.assertIsNone(histogram.quantile(0.5))
+        histogram.observe(60.0)
+        self.assertEqual(histogram.quantile(0.99), BUCKETS[-1])
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.metrics_path = os.path.join(self.temp_dir.name, 'metrics.json')
+        self.registry = MetricsRegistry()
+        self.registry.observe("service_call_seconds", 0.002, method="add_task")
+        self.registry.observe("service_call_seconds", 0.004, method="add_task")
+        self.registry.inc("json_bytes_written_total", 120, file="journal")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_series_are_keyed_by_name_and_labels(self):
+        self.registry.observe("service_call_seconds", 0.001, method="get_task")
+        histograms = self.registry.histograms()
+        self.assertEqual(histograms[("service_call_seconds", (("method", "add_task"),))].count, 2)
+        self.assertEqual(histograms[("service_call_seconds", (("method", "get_task"),))].count, 1)
+        self.assertEqual(self.registry.counters(), {("json_bytes_written_total", (("file", "journal"),)): 120})
+
+    def test_merge_into_file_accumulates_and_resets(self):
+        self.registry.merge_into_file(self.metrics_path)
+        self.assertTrue(self.registry.is_empty())
+        other = MetricsRegistry()
+        other.observe("service_call_seconds", 0.003, method="add_task")
+        other.merge_into_file(self.metrics_path)
+
+        stored = MetricsRegistry.load(self.metrics_path)
+        histogram = stored.histograms()[("service_call_seconds", (("method", "add_task"),))]
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.sum, 0.009)
+        self.assertEqual(stored.counters()[("json_bytes_written_total", (("file", "journal"),))], 120)
+
+    def test_load_missing_and_malformed_files(self):
+        self.assertTrue(MetricsRegistry.load(self.metrics_path).is_empty())
+        with open(self.metrics_path, 'w') as f:
+            json.dump({"format": 0}, f)
+        with self.assertRaises(ValueError):
+            MetricsRegistry.load(self.metrics_path)
+
+    def test_unreadable_file_is_replaced_on_merge(self):
+        with open(self.metrics_path, 'w') as f:
+            f.write("{not json")
+        self.registry.merge_into_file(self.metrics_path)
+        self.assertEqual(MetricsRegistry.load(self.metrics_path).histograms()[
+            ("service_call_seconds", (("method", "add_task"),))].count, 2)
+
+    def test_prometheus_text_format(self):
+        text = self.registry.to_prometheus()
+        lines = text.splitlines()
+        self.assertIn("# TYPE task_tracker_json_bytes_written_total counter", lines)
+        self.assertIn('task_tracker_json_bytes_written_total{file="journal"} 120', lines)
+        self.assertIn("# TYPE task_tracker_service_call_seconds histogram", lines)
+        self.assertIn('task_tracker_service_call_seconds_bucket{method="add_task",le="0.001"} 0', lines)
+        self.assertIn('task_tracker_service_call_seconds_bucket{method="add_task",le="0.0025"} 1', lines)
+        self.assertIn('task_tracker_service_call_seconds_bucket{method="add_task",le="+Inf"} 2', lines)
+        self.assertIn('task_tracker_service_call_seconds_count{method="add_task"} 2', lines)
+        self.assertIn('task_tracker_service_call_seconds_sum{method="add_task"} 0.006', lines)
+        self.assertEqual(MetricsRegistry().to_prometheus(), "")
+
+    def test_concurrent_writes_leave_a_complete_file(self):
+        prometheus_path = os.path.join(self.temp_dir.name, 'task_tracker.prom')
+        barrier = threading.Barrier(2)
+        def export():
+            registry = MetricsRegistry()
+            registry.inc("json_bytes_written_total", 1, file="journal")
+            barrier.wait()
+            for _ in range(100):
+                registry.write_prometheus(prometheus_path)
+            for _ in range(20):
+                registry.merge_into_file(self.metrics_path)
+                registry.inc("json_bytes_written_total", 1, file="journal")
+        threads = [threading.Thread(target=export) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(MetricsRegistry.load(self.metrics_path).counters(),
+                         {("json_bytes_written_total", (("file", "journal"),)): 40})
+        with open(prometheus_path) as f:
+            self.assertIn("# TYPE task_tracker_json_bytes_written_total counter", f.read())
+        self.assertFalse([name for name in os.listdir(self.temp_dir.name) if name.endswith('.tmp')])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+import threading
+import time
+from src.infrastructure.persistence.ReadWriteLock import ReadWriteLock
+
+class TestReadWriteLock(unittest.TestCase):
+    def setUp(self):
+        self.lock = ReadWriteLock()
+
+    def test_readers_share_the_lock(self):
+        both_inside = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with self.lock.read():
+                both_inside.wait() # Fails with BrokenBarrierError unless both readers hold the lock at once
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(both_inside.broken)
+
+    def test_writer_excludes_readers(self):
+        events = []
+        self.lock.acquire_write()
+        reader = threading.Thread(target=lambda: self._read(events))
+        reader.start()
+        time.sleep(0.05)
+        events.append("writer done")
+        self.lock.release_write()
+        reader.join()
+        self.assertEqual(events, ["writer done", "read"])
+
+    def _read(self, events):
+        with self.lock.read():
+            events.append("read")
+
+    def test_waiting_writer_blocks_new_readers(self):
+        events = []
+        self.lock.acquire_read()
+
+        def writer():
+            with self.lock.write():
+                events.append("write")
+
+        writer_thread = threading.Thread(target=writer)
+        writer_thread.start()
+        time.sleep(0.05) # The writer is now waiting for the first reader
+        reader_thread = threading.Thread(target=lambda: self._read(events))
+        reader_thread.start()
+        time.sleep(0.05)
+        self.assertEqual(events, [])
+        self.lock.release_read()
+        writer_thread.join()
+        reader_thread.join()
+        self.assertEqual(events, ["write", "read"])
+
+    def test_reentrancy(self):
+        with self.lock.write():
+            with self.lock.write():
+                with self.lock.read():
+                    pass
+        with self.lock.read():
+            with self.lock.read():
+                pass
+        # Fully released: another thread can write
+        writer = threading.Thread(target=lambda: self.lock.write().__enter__())
+        writer.start()
+        writer.join(timeout=5)
+        self.assertFalse(writer.is_alive())
+
+    def test_upgrade_is_refused(self):
+        with self.lock.read():
+            with self.assertRaises(RuntimeError):
+                self.lock.acquire_write()
+
+    def test_release_without_acquire(self):
+        with self.assertRaises(RuntimeError):
+            self.lock.release_read()
+        with self.assertRaises(RuntimeError):
+            self.lock.release_write()
+
+if __name__ == '__main__':
+    unittest.main()
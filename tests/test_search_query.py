@@ -0,0 +1,28 @@
+import unittest
+from src.domain.SearchQuery import SearchQuery, tokenize
+
+class TestSearchQuery(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Buy MILK, e-mail Bob!"), ["buy", "milk", "e", "mail", "bob"])
+
+    def test_parse(self):
+        query = SearchQuery.parse("Milk  mil* e-ma*")
+        self.assertEqual(query.terms, ("milk", "e"))
+        self.assertEqual(query.prefixes, ("mil", "ma"))
+        self.assertEqual(str(query), "milk e mil* ma*")
+
+    def test_parse_rejects_queries_without_words(self):
+        for query in ("", "   ", "*", "!?"):
+            with self.subTest(query=query), self.assertRaises(ValueError):
+                SearchQuery.parse(query)
+
+    def test_matches_requires_every_word(self):
+        query = SearchQuery.parse("buy mil*")
+        self.assertTrue(query.matches("Buy milk"))
+        self.assertTrue(query.matches("MILESTONE: buy"))
+        self.assertFalse(query.matches("Buy bread"))
+        self.assertFalse(query.matches("Drink milk"))
+        self.assertFalse(SearchQuery.parse("mil").matches("Buy milk"))
+
+if __name__ == '__main__':
+    unittest.main()
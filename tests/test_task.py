@@ -1,6 +1,7 @@
 import unittest
 import datetime
-from src.domain.Task import Task, TaskStatusEnum
+from unittest.mock import patch
+from src.domain.Task import Task, LazyTask, TaskStatusEnum
 
 class TestTask(unittest.TestCase):
     def test_task_creation(self):
@@ -40,5 +41,49 @@ class TestTask(unittest.TestCase):
         # The actual character might differ based on implementation, this is a common representation
         self.assertEqual(str(task_done), "[✓] ID: 2 - Done Task")
 
+class TestLazyTask(unittest.TestCase):
+    def test_timestamps_are_decoded_on_first_access_and_cached(self):
+        task = LazyTask(description="Lazy", status=TaskStatusEnum.TODO,
+                        createdAt="2024-01-02T03:04:05", updatedAt="2024-01-02T03:04:06", id=1)
+        self.assertEqual(task.__dict__["_createdAt"], "2024-01-02T03:04:05")
+        self.assertEqual(task.createdAt, datetime.datetime(2024, 1, 2, 3, 4, 5))
+        self.assertIsInstance(task.__dict__["_createdAt"], datetime.datetime)
+        self.assertEqual(task.updatedAt, datetime.datetime(2024, 1, 2, 3, 4, 6))
+
+    def test_missing_timestamp_resolves_once(self):
+        task = LazyTask(description="Lazy", status=TaskStatusEnum.TODO, createdAt=None, updatedAt=None, id=1)
+        first = task.createdAt
+        self.assertIsInstance(first, datetime.datetime)
+        self.assertEqual(task.createdAt, first)
+
+    def test_invalid_timestamp_resolves_once_with_a_warning(self):
+        task = LazyTask(description="Lazy", status=TaskStatusEnum.TODO,
+                        createdAt="2024-13-45T99:99:99", updatedAt="2024-01-02T03:04:05", id=1)
+        with patch('builtins.print') as mock_print:
+            created_at = task.createdAt
+            self.assertIs(task.createdAt, created_at)
+        mock_print.assert_called_once()
+        self.assertIn("invalid createdAt timestamp '2024-13-45T99:99:99'", mock_print.call_args.args[0])
+        self.assertEqual(task.timestamp_text("createdAt"), created_at.isoformat())
+        self.assertEqual(task.updatedAt, datetime.datetime(2024, 1, 2, 3, 4, 5))
+
+    def test_timestamp_text_does_not_decode(self):
+        task = LazyTask(description="Lazy", status=TaskStatusEnum.TODO,
+                        createdAt="2024-01-02T03:04:05", updatedAt="2024-01-02T03:04:05", id=1)
+        self.assertEqual(task.timestamp_text("createdAt"), "2024-01-02T03:04:05")
+        self.assertEqual(task.__dict__["_createdAt"], "2024-01-02T03:04:05")
+        task.mark_as_done()
+        self.assertEqual(task.timestamp_text("updatedAt"), task.updatedAt.isoformat())
+
+    def test_equals_task_with_same_fields(self):
+        now = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        task = Task(description="Lazy", status=TaskStatusEnum.TODO, createdAt=now, updatedAt=now, id=1)
+        lazy = LazyTask(description="Lazy", status=TaskStatusEnum.TODO,
+                        createdAt=now.isoformat(), updatedAt=now.isoformat(), id=1)
+        self.assertEqual(task, lazy)
+        self.assertEqual(lazy, task)
+        lazy.mark_as_done()
+        self.assertNotEqual(task, lazy)
+
 if __name__ == '__main__':
     unittest.main()
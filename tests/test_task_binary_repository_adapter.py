@@ -0,0 +1,173 @@
+import unittest
+import os
+import tempfile
+from src.infrastructure.persistence.TaskBinaryRepository_adapter import TaskBinaryRepository
+from src.domain.Task import TaskStatusEnum, Task
+import datetime
+
+class TestTaskBinaryRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bin_path = os.path.join(self.temp_dir.name, 'tasks.bin')
+        self.repository = TaskBinaryRepository(self.bin_path)
+
+    def tearDown(self):
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def test_add_task(self):
+        task = self.repository.add("Test Task 1")
+        self.assertEqual(task.description, "Test Task 1")
+        self.assertEqual(task.status, TaskStatusEnum.TODO)
+        self.assertIsNotNone(task.id)
+        self.assertIsNotNone(task.createdAt)
+        self.assertIsNotNone(task.updatedAt)
+        if task.id:
+            self.assertEqual(self.repository.get_by_id(task.id), task)
+
+    def test_get_by_id(self):
+        task1 = self.repository.add("Test Task 1")
+        if task1.id:
+            retrieved_task = self.repository.get_by_id(task1.id)
+            self.assertEqual(retrieved_task, task1)
+        self.assertIsNone(self.repository.get_by_id(999))  # Non-existent ID
+
+    def test_get_all_tasks(self):
+        self.repository.add("Task 1")
+        self.repository.add("Task 2")
+        tasks = self.repository.get_all()
+        self.assertEqual(len(tasks), 2)
+
+    def test_get_all_tasks_with_status_filter(self):
+        self.repository.add("Task 1 Todo")
+        task_done = self.repository.add("Task 2 Done")
+        task_done.mark_as_done()
+        self.repository.update(task_done)
+
+        todo_tasks = self.repository.get_all(status=TaskStatusEnum.TODO)
+        self.assertEqual(len(todo_tasks), 1)
+        self.assertEqual(todo_tasks[0].description, "Task 1 Todo")
+
+        done_tasks = self.repository.get_all(status=TaskStatusEnum.DONE)
+        self.assertEqual(len(done_tasks), 1)
+        self.assertEqual(done_tasks[0].description, "Task 2 Done")
+
+        inprogress_tasks = self.repository.get_all(status=TaskStatusEnum.INPROGRESS)
+        self.assertEqual(len(inprogress_tasks), 0)
+
+    def test_update_task(self):
+        task = self.repository.add("Original Description")
+        task.description = "Updated Description"
+        task.mark_as_done()
+        updated_task = self.repository.update(task)
+        self.assertIsNotNone(updated_task, "Updated task should not be None")
+        if updated_task:  # Only check attributes if update was successful
+            self.assertEqual(updated_task.description, "Updated Description")
+            self.assertEqual(updated_task.status, TaskStatusEnum.DONE)
+
+        # Test updating a non-existent task
+        non_existent_task = Task(id=999, description="Non Existent", status=TaskStatusEnum.TODO, createdAt=datetime.datetime.now(), updatedAt=datetime.datetime.now())
+        self.assertIsNone(self.repository.update(non_existent_task))
+
+    def test_delete_task(self):
+        task = self.repository.add("Task to delete")
+        if task.id:
+            self.assertTrue(self.repository.delete(task.id))
+            self.assertIsNone(self.repository.get_by_id(task.id))
+        self.assertFalse(self.repository.delete(999))  # Non-existent ID
+
+    def test_tasks_persist_across_reopen(self):
+        task = self.repository.add("Persistent task")
+        task.description = "Persistent task, renamed"
+        task.mark_as_inprogress()
+        self.repository.update(task)
+        self.repository.delete(self.repository.add("Deleted task").id)
+        self.repository.close()
+
+        self.repository = TaskBinaryRepository(self.bin_path)
+        self.assertEqual(self.repository.get_all(), [task])
+        self.assertEqual(self.repository.add("Task 3").id, 3)
+
+    def test_deleted_task_cannot_be_updated_or_deleted_again(self):
+        task = self.repository.add("Task 1")
+        self.assertTrue(self.repository.delete(task.id))
+        self.assertFalse(self.repository.delete(task.id))
+        self.assertIsNone(self.repository.update(task))
+        self.assertEqual(self.repository.get_all(), [])
+
+    def test_status_filter_keeps_id_order(self):
+        tasks = [self.repository.add(f"Task {i}") for i in range(1, 6)]
+        for task in (tasks[3], tasks[0]):
+            task.mark_as_done()
+            self.repository.update(task)
+        self.assertEqual([task.id for task in self.repository.get_all(status=TaskStatusEnum.DONE)], [1, 4])
+        self.assertEqual([task.id for task in self.repository.get_all(status=TaskStatusEnum.TODO)], [2, 3, 5])
+
+    def test_timestamps_round_trip_exactly(self):
+        task = self.repository.add("Task")
+        task.createdAt = datetime.datetime(2025, 5, 18, 0, 14, 24, 125175)
+        self.repository.update(task)
+        self.repository.close()
+        self.repository = TaskBinaryRepository(self.bin_path)
+        self.assertEqual(self.repository.get_by_id(task.id), task)
+
+    def test_add_many(self):
+        self.repository.add("Task 1")
+        tasks = self.repository.add_many(["Task 2", "Task 3", "Task 4"])
+        self.assertEqual([task.id for task in tasks], [2, 3, 4])
+        self.repository.close()
+        self.repository = TaskBinaryRepository(self.bin_path)
+        self.assertEqual(self.repository.get_all()[1:], tasks)
+
+    def test_rejects_foreign_file(self):
+        other_path = os.path.join(self.temp_dir.name, 'other.bin')
+        with open(other_path, 'wb') as f:
+            f.write(b"not a task file at all, just some bytes")
+        with self.assertRaises(ValueError):
+            TaskBinaryRepository(other_path)
+
+    def test_rejects_empty_and_truncated_files(self):
+        self.repository.add_many(["Task 1", "Task 2"])
+        self.repository.close()
+        with open(self.bin_path, 'rb') as f:
+            data = f.read()
+        for name, content in (("empty.bin", b""), ("header.bin", data[:10]), ("records.bin", data[:-5])):
+            with self.subTest(name=name):
+                path = os.path.join(self.temp_dir.name, name)
+                with open(path, 'wb') as f:
+                    f.write(content)
+                with self.assertRaises(ValueError):
+                    TaskBinaryRepository(path)
+        self.repository = TaskBinaryRepository(self.bin_path) # Reopened for tearDown
+
+    def test_get_all_pagination(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        self.repository.delete(3)
+        for task_id in (2, 5, 6):
+            task = self.repository.get_by_id(task_id)
+            task.mark_as_done()
+            self.repository.update(task)
+
+        ids = lambda tasks: [task.id for task in tasks]
+        self.assertEqual(ids(self.repository.get_all(limit=3)), [1, 2, 4])
+        self.assertEqual(ids(self.repository.get_all(limit=3, offset=3)), [5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(limit=2, after_id=4)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(after_id=3)), [4, 5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(status=TaskStatusEnum.DONE, limit=2, after_id=2)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(limit=0)), [])
+        self.assertEqual(ids(self.repository.get_all(after_id=7)), [])
+
+    def test_iter_tasks(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.repository.delete(2)
+        task = self.repository.get_by_id(4)
+        task.mark_as_done()
+        self.repository.update(task)
+
+        self.assertEqual([task.id for task in self.repository.iter_tasks()], [1, 3, 4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(after_id=3)], [4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(status=TaskStatusEnum.TODO, after_id=1)], [3, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import unittest
+import contextlib
+import io
+import os
+import socket
+import tempfile
+import threading
+from unittest.mock import patch
+from src.application.TodoService_adapter import TodoService
+from src.infrastructure.daemon import client
+from src.infrastructure.daemon.protocol import send_message, recv_message, FRAME_HEADER
+from src.infrastructure.daemon.server import TaskDaemon
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+class TestProtocol(unittest.TestCase):
+    def test_round_trip(self):
+        left, right = socket.socketpair()
+        with left, right:
+            send_message(left, {"op": "command", "args": ["add", "Café ☕"]})
+            send_message(left, {"op": "ping"})
+            self.assertEqual(recv_message(right), {"op": "command", "args": ["add", "Café ☕"]})
+            self.assertEqual(recv_message(right), {"op": "ping"})
+            left.close()
+            self.assertIsNone(recv_message(right))
+
+    def test_truncated_message(self):
+        left, right = socket.socketpair()
+        with left, right:
+            left.sendall(FRAME_HEADER.pack(10) + b'{"op"')
+            left.close()
+            with self.assertRaises(ConnectionError):
+                recv_message(right)
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix domain sockets are not available")
+class TestTaskDaemon(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.socket_path = os.path.join(self.temp_dir.name, 'daemon.sock')
+        self.store = {"backend": "json", "file": self.tasks_json_path}
+        self.repository = TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, background_compaction=False)
+        self.daemon = TaskDaemon(TodoService(self.repository), self.socket_path, self.store, flush_interval=60)
+        self.thread = threading.Thread(target=self.daemon.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        if self.thread.is_alive():
+            self.daemon.shutdown()
+            self.thread.join()
+        self.temp_dir.cleanup()
+
+    def _forward(self, args, stdin=None):
+        """Forwards a command and returns (exit code, stdout)."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            if stdin is None:
+                exit_code = client.forward(args, self.store, self.socket_path)
+            else:
+                with patch('sys.stdin', io.StringIO(stdin)):
+                    exit_code = client.forward(args, self.store, self.socket_path)
+        return exit_code, output.getvalue()
+
+    def test_commands_run_in_the_daemon(self):
+        self.assertEqual(self._forward(["add", "Buy milk"]), (0, "Task Added: [✗] ID: 1 - Buy milk\n"))
+        self.assertEqual(self._forward(["mark-done", "1"])[0], 0)
+        self.assertEqual(self._forward(["get", "1"]), (0, "Task details: [✓] ID: 1 - Buy milk\n"))
+
+    def test_usage_errors_return_the_exit_code(self):
+        self.assertEqual(self._forward(["get", "not-a-number"])[0], 2)
+
+    def test_batch_from_stdin_and_file(self):
+        exit_code, output = self._forward(["batch"], stdin='add "One"\nadd "Two"\n')
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Batch finished: 2 command(s) executed, 0 failed.", output)
+
+        commands_path = os.path.join(self.temp_dir.name, 'commands.txt')
+        with open(commands_path, 'w') as f:
+            f.write("remove 1\n")
+        exit_code, output = self._forward(["batch", commands_path, "--flush-every", "1"])
+        self.assertIn("Task with ID 1 removed successfully.", output)
+
+    def test_profiled_batch_is_rewritten_after_the_global_options(self):
+        commands_path = os.path.join(self.temp_dir.name, 'commands.txt')
+        with open(commands_path, 'w') as f:
+            f.write('add "One"\n')
+        report_path = os.path.join(self.temp_dir.name, 'profile.txt')
+        exit_code, output = self._forward(["--profile", "--profile-output", report_path, "batch", commands_path])
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Batch finished: 1 command(s) executed, 0 failed.", output)
+        with open(report_path) as f:
+            self.assertIn("repository load", f.read())
+
+    def test_background_output_stays_out_of_the_response(self):
+        def handle(args):
+            print("Command output")
+            background = threading.Thread(target=print, args=("Warning: Background flush failed.",))
+            background.start()
+            background.join()
+        daemon_output = io.StringIO()
+        with patch.object(self.daemon._handler, 'handle', side_effect=handle), contextlib.redirect_stdout(daemon_output):
+            response = self.daemon.execute(["list"])
+        self.assertEqual(response["stdout"], "Command output\n")
+        self.assertEqual(daemon_output.getvalue(), "Warning: Background flush failed.\n")
+
+    def test_changes_are_flushed_on_shutdown(self):
+        self._forward(["add", "Buy milk"])
+        self.assertEqual(client.request(self.socket_path, {"op": "shutdown"}), {"status": "ok"})
+        self.thread.join()
+        self.assertFalse(os.path.exists(self.socket_path))
+        self.assertEqual([task.description for task in TaskJsonRepository(self.tasks_json_path).get_all()], ["Buy milk"])
+
+    def test_daemon_stop_command_gets_the_reply(self):
+        import main
+        self._forward(["add", "Buy milk"])
+        output = io.StringIO()
+        with patch.dict(os.environ, {"TASK_TRACKER_SOCKET": self.socket_path}), contextlib.redirect_stdout(output):
+            main.run_daemon(["status"], "json", self.tasks_json_path, self.store)
+            main.run_daemon(["stop"], "json", self.tasks_json_path, self.store)
+        self.thread.join()
+        self.assertIn(f"is serving {self.store} on {self.socket_path}.", output.getvalue())
+        self.assertTrue(output.getvalue().endswith("Task daemon stopped.\n"))
+        self.assertEqual([task.description for task in TaskJsonRepository(self.tasks_json_path).get_all()], ["Buy milk"])
+
+    def test_daemon_stop_reports_a_dropped_connection(self):
+        import main
+        output = io.StringIO()
+        with patch.dict(os.environ, {"TASK_TRACKER_SOCKET": self.socket_path}), contextlib.redirect_stdout(output), \
+                patch.object(client, 'request', side_effect=ConnectionError("closed")):
+            with self.assertRaises(SystemExit):
+                main.run_daemon(["stop"], "json", self.tasks_json_path, self.store)
+        self.assertEqual(output.getvalue(), "Error: Could not reach the task daemon. Error: closed\n")
+
+    def test_other_stores_fall_back_to_in_process(self):
+        other = {"backend": "json", "file": os.path.join(self.temp_dir.name, 'other.json')}
+        self.assertIsNone(client.forward(["list"], other, self.socket_path))
+
+    def test_no_daemon(self):
+        self.assertIsNone(client.forward(["list"], self.store, os.path.join(self.temp_dir.name, 'missing.sock')))
+        self.assertIsNone(client.request(os.path.join(self.temp_dir.name, 'missing.sock'), {"op": "ping"}))
+
+    def test_second_daemon_is_refused(self):
+        with self.assertRaises(RuntimeError):
+            TaskDaemon(TodoService(self.repository), self.socket_path, self.store)
+
+    def test_stale_socket_is_replaced(self):
+        self.daemon.shutdown()
+        self.thread.join()
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.socket_path) # Leaves a socket file nobody listens on
+        stale.close()
+        self.daemon = TaskDaemon(TodoService(self.repository), self.socket_path, self.store, flush_interval=60)
+        self.thread = threading.Thread(target=self.daemon.serve_forever)
+        self.thread.start()
+        self.assertEqual(client.request(self.socket_path, {"op": "ping"})["status"], "ok")
+
+if __name__ == '__main__':
+    unittest.main()
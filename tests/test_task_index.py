@@ -0,0 +1,99 @@
+import unittest
+import datetime
+from src.domain.SearchQuery import SearchQuery
+from src.domain.Task import Task, TaskStatusEnum
+from src.infrastructure.persistence.TaskIndex import TaskIndex
+
+class TestTaskIndex(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime.datetime.now()
+        self.index = TaskIndex(self._create_task(id) for id in (1, 2, 3))
+
+    def _create_task(self, id, description="Task", status=TaskStatusEnum.TODO):
+        return Task(id=id, description=f"{description} {id}", status=status, createdAt=self.now, updatedAt=self.now)
+
+    def test_get(self):
+        self.assertEqual(self.index.get(2).description, "Task 2")
+        self.assertIsNone(self.index.get(99))
+        self.assertIn(3, self.index)
+        self.assertNotIn(99, self.index)
+
+    def test_put_replaces_in_place(self):
+        self.index.put(self._create_task(2, description="Replaced"))
+        self.assertEqual([task.id for task in self.index], [1, 2, 3])
+        self.assertEqual(self.index.get(2).description, "Replaced 2")
+
+    def test_put_appends_new_task(self):
+        self.index.put(self._create_task(4))
+        self.assertEqual([task.id for task in self.index.all()], [1, 2, 3, 4])
+        self.assertEqual(len(self.index), 4)
+
+    def test_remove(self):
+        removed = self.index.remove(2)
+        self.assertEqual(removed.id, 2)
+        self.assertIsNone(self.index.remove(2))
+        self.assertEqual([task.id for task in self.index], [1, 3])
+
+    def test_all_returns_a_copy(self):
+        tasks = self.index.all()
+        tasks.clear()
+        self.assertEqual(len(self.index), 3)
+
+    def test_with_status(self):
+        self.index.put(self._create_task(4, status=TaskStatusEnum.DONE))
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.TODO)], [1, 2, 3])
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.DONE)], [4])
+        self.assertEqual(self.index.with_status(TaskStatusEnum.INPROGRESS), [])
+
+    def test_status_change_moves_task_between_buckets(self):
+        task = self.index.get(2)
+        task.mark_as_done()
+        self.index.put(task)
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.TODO)], [1, 3])
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.DONE)], [2])
+
+    def test_with_status_keeps_id_order(self):
+        for task_id in (3, 1, 2):
+            task = self.index.get(task_id)
+            task.mark_as_done()
+            self.index.put(task)
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.DONE)], [1, 2, 3])
+
+    def test_remove_drops_task_from_status_bucket(self):
+        self.index.remove(1)
+        self.assertEqual([task.id for task in self.index.with_status(TaskStatusEnum.TODO)], [2, 3])
+
+    def test_iter_from(self):
+        self.index.put_many([self._create_task(4, status=TaskStatusEnum.DONE), self._create_task(5)])
+        self.index.put(self._create_task(1, status=TaskStatusEnum.DONE)) # Out of id order in the DONE bucket
+        self.assertEqual([task.id for task in self.index.iter_from()], [1, 2, 3, 4, 5])
+        self.assertEqual([task.id for task in self.index.iter_from(after_id=2)], [3, 4, 5])
+        self.assertEqual([task.id for task in self.index.iter_from(TaskStatusEnum.DONE)], [1, 4])
+        self.assertEqual([task.id for task in self.index.iter_from(TaskStatusEnum.TODO, after_id=3)], [5])
+        self.assertEqual(list(self.index.iter_from(after_id=5)), [])
+
+    def test_search_index_follows_changes(self):
+        self.assertIsNone(self.index.search_index)
+        self.assertEqual([task.id for task in self.index.search(SearchQuery.parse("task"))], [1, 2, 3])
+        self.assertIsNotNone(self.index.search_index)
+        self.index.put(self._create_task(2, description="Renamed"))
+        self.index.remove(3)
+        self.index.put(self._create_task(4, description="Renamed"))
+        self.assertEqual([task.id for task in self.index.search(SearchQuery.parse("task"))], [1])
+        self.assertEqual([task.id for task in self.index.search(SearchQuery.parse("ren*"))], [2, 4])
+
+    def test_time_index_follows_changes(self):
+        self.assertEqual([task.id for task in self.index.between("updatedAt", since=self.now)], [1, 2, 3])
+        self.assertIsNotNone(self.index.time_index)
+        later = self.now + datetime.timedelta(minutes=5)
+        task = self.index.get(1)
+        task.updatedAt = later
+        self.index.put(task)
+        self.index.remove(2)
+        self.assertEqual([task.id for task in self.index.between("updatedAt", since=later)], [1])
+        self.assertEqual([task.id for task in self.index.between("updatedAt", until=later)], [3])
+        self.assertEqual([task.id for task in self.index.between("createdAt", until=later)], [1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,23 @@
 import unittest
 import os  # Added for file operations
-from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+import json
+import tempfile
+from unittest.mock import patch
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository, DurabilityLevel
+from src.infrastructure.persistence.TaskSearchIndex import TaskSearchIndex
+from src.infrastructure.metrics.MetricsRegistry_adapter import MetricsRegistry
 from src.domain.Task import TaskStatusEnum, Task
 import datetime
+import multiprocessing
+import time
+
+def _add_tasks_in_process(file_path: str, journal: bool, count: int):
+    """Adds tasks from a separate process through its own multiprocess repository."""
+    repository = TaskJsonRepository(file_path, journal=journal, lazy=True, multiprocess=True,
+                                    background_compaction=False)
+    for i in range(count):
+        repository.add(f"Task {os.getpid()}-{i}")
+    repository.close()
 
 class TestTaskJsonRepository(unittest.TestCase):
     def setUp(self):
@@ -86,5 +101,600 @@ class TestTaskJsonRepository(unittest.TestCase):
             self.assertIsNone(self.repository.get_by_id(task.id))
         self.assertFalse(self.repository.delete(999))  # Non-existent ID
 
+class TestTaskJsonRepositoryBulk(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_each_batch_is_saved_once(self):
+        repository = TaskJsonRepository(self.tasks_json_path)
+        with patch.object(repository, '_save', wraps=repository._save) as save:
+            tasks = repository.add_many(["Task 1", "Task 2", "Task 3"])
+            self.assertEqual(save.call_count, 1)
+            for task in tasks:
+                task.mark_as_done()
+            self.assertEqual(repository.update_many(tasks), tasks)
+            self.assertEqual(save.call_count, 2)
+            self.assertEqual(repository.delete_many([1, 999]), [True, False])
+            self.assertEqual(save.call_count, 3)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual([task.id for task in reloaded.get_all(status=TaskStatusEnum.DONE)], [2, 3])
+
+    def test_batch_is_one_journal_record(self):
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        repository.add_many(["Task 1", "Task 2", "Task 3"])
+        repository.delete_many([1, 2])
+        with open(repository.journal_path) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual([task.id for task in reloaded.get_all()], [3])
+        self.assertEqual(reloaded.add("Task 4").id, 4)
+
+class TestTaskJsonRepositoryDeferredWrites(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_snapshot_is_saved_once_when_the_block_exits(self):
+        repository = TaskJsonRepository(self.tasks_json_path)
+        with patch.object(repository, '_save', wraps=repository._save) as save:
+            with repository.defer_writes():
+                task = repository.add("Task 1")
+                repository.add("Task 2")
+                task.mark_as_done()
+                repository.update(task)
+                repository.delete(2)
+                self.assertEqual(repository.get_all(), [task])
+                self.assertEqual(save.call_count, 0)
+            self.assertEqual(save.call_count, 1)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual(reloaded.get_all(), [task])
+        self.assertEqual(reloaded.add("Task 3").id, 3)
+
+    def test_flush_inside_the_block(self):
+        repository = TaskJsonRepository(self.tasks_json_path)
+        with repository.defer_writes():
+            repository.add("Task 1")
+            repository.flush()
+            self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 1)
+            repository.add("Task 2")
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 2)
+
+    def test_journal_records_are_coalesced_per_task(self):
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        with repository.defer_writes():
+            task = repository.add("Task 1")
+            repository.add("Task 2")
+            task.mark_as_inprogress()
+            repository.update(task)
+            task.mark_as_done()
+            repository.update(task)
+            repository.delete(2)
+        with open(repository.journal_path) as f:
+            lines = f.readlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(len(json.loads(lines[0])["records"]), 2)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual(reloaded.get_all(), [task])
+        self.assertEqual(reloaded.get_by_id(1).status, TaskStatusEnum.DONE)
+
+    def test_block_without_changes_writes_nothing(self):
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True)
+        with patch.object(repository, '_append_journal') as append:
+            with repository.defer_writes():
+                repository.get_all()
+        append.assert_not_called()
+
+class TestTaskJsonRepositoryJournal(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.repository = self._open()
+
+    def tearDown(self):
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def _open(self, **kwargs):
+        kwargs.setdefault("background_compaction", False)
+        return TaskJsonRepository(self.tasks_json_path, journal=True, **kwargs)
+
+    def _journal_lines(self):
+        with open(self.repository.journal_path) as f:
+            return f.read().splitlines()
+
+    def test_mutations_append_to_journal_without_rewriting_snapshot(self):
+        snapshot_before = os.path.getmtime(self.tasks_json_path), os.path.getsize(self.tasks_json_path)
+        task = self.repository.add("Journaled task")
+        task.mark_as_done()
+        self.repository.update(task)
+        self.repository.delete(task.id)
+
+        ops = [json.loads(line)["op"] for line in self._journal_lines()]
+        self.assertEqual(ops, ["put", "put", "delete"])
+        self.assertEqual((os.path.getmtime(self.tasks_json_path), os.path.getsize(self.tasks_json_path)), snapshot_before)
+
+    def test_reload_replays_journal_on_top_of_snapshot(self):
+        task1 = self.repository.add("Task 1")
+        task2 = self.repository.add("Task 2")
+        task1.mark_as_done()
+        self.repository.update(task1)
+        self.repository.delete(task2.id)
+
+        reloaded = self._open()
+        tasks = reloaded.get_all()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].id, task1.id)
+        self.assertEqual(tasks[0].status, TaskStatusEnum.DONE)
+        self.assertEqual(reloaded.add("Task 3").id, 3)
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        self.repository.close()
+        self.repository = self._open(compact_records=3)
+        for i in range(4):
+            self.repository.add(f"Task {i}")
+
+        # Three records were folded into the snapshot, the fourth one stays in the journal
+        self.assertEqual(len(self._journal_lines()), 1)
+        with open(self.tasks_json_path) as f:
+            self.assertEqual(len(json.load(f)["tasks"]), 3)
+        self.assertEqual(len(self._open().get_all()), 4)
+
+    def test_trimming_keeps_later_records_and_the_journal_mode(self):
+        for i in range(3):
+            self.repository.add(f"Task {i}")
+        os.chmod(self.repository.journal_path, 0o600)
+        self.repository._trim_journal(1)
+
+        self.assertEqual([json.loads(line)["seq"] for line in self._journal_lines()], [2, 3])
+        self.assertEqual(os.stat(self.repository.journal_path).st_mode & 0o777, 0o600)
+        self.assertFalse([name for name in os.listdir(self.temp_dir.name) if name.endswith('.tmp')])
+
+    def test_background_compaction(self):
+        self.repository.close()
+        self.repository = self._open(compact_records=2, background_compaction=True)
+        for i in range(5):
+            self.repository.add(f"Task {i}")
+        self.repository.close()
+        self.repository.compact()
+
+        self.assertEqual(self._journal_lines(), [])
+        self.assertEqual([task.id for task in self._open().get_all()], [1, 2, 3, 4, 5])
+
+    def test_truncated_journal_record_is_dropped(self):
+        self.repository.add("Task 1")
+        self.repository.add("Task 2")
+        with open(self.repository.journal_path, 'ab') as f:
+            f.write(b'{"op":"put","task":{"id":3')
+
+        reloaded = self._open()
+        self.assertEqual(len(reloaded.get_all()), 2)
+        reloaded.add("Task 3")
+        self.assertEqual(len(self._open().get_all()), 3)
+
+class TestTaskJsonRepositoryAtomicSave(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_each_durability_level_persists_tasks(self):
+        for level in DurabilityLevel:
+            with self.subTest(level=level):
+                repository = TaskJsonRepository(self.tasks_json_path, durability=level)
+                task = repository.add(f"Task saved with {level.value}")
+                reloaded = TaskJsonRepository(self.tasks_json_path)
+                self.assertEqual(reloaded.get_by_id(task.id), task)
+
+    def test_only_the_sync_levels_wait_for_the_disk(self):
+        for level, syncs in ((None, False), (DurabilityLevel.DATASYNC, True)):
+            with self.subTest(level=level), \
+                    patch('src.infrastructure.persistence.TaskJsonRepository_adapter.sync_data') as sync_data:
+                repository = (TaskJsonRepository(self.tasks_json_path) if level is None
+                              else TaskJsonRepository(self.tasks_json_path, durability=level))
+                repository.add("Task 1")
+                self.assertEqual(sync_data.called, syncs)
+
+    def test_failed_save_leaves_previous_file_intact(self):
+        repository = TaskJsonRepository(self.tasks_json_path)
+        repository.add("Task 1")
+        with open(self.tasks_json_path) as f:
+            content_before = f.read()
+
+        with patch("src.infrastructure.persistence.TaskJsonRepository_adapter.json.dump", side_effect=IOError("disk full")):
+            repository.add("Task 2")
+
+        with open(self.tasks_json_path) as f:
+            self.assertEqual(f.read(), content_before)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['tasks.json']) # No temp file left behind
+
+    def test_corrupt_file_is_moved_aside_instead_of_overwritten(self):
+        with open(self.tasks_json_path, 'w') as f:
+            f.write('{"tasks": [{"id": 1, "descr')
+
+        repository = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual(repository.get_all(), [])
+
+        backups = [name for name in os.listdir(self.temp_dir.name) if name.startswith('tasks.json.corrupt-')]
+        self.assertEqual(len(backups), 1)
+        with open(os.path.join(self.temp_dir.name, backups[0])) as f:
+            self.assertEqual(f.read(), '{"tasks": [{"id": 1, "descr')
+
+class TestTaskJsonRepositoryLazy(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        writer = TaskJsonRepository(self.tasks_json_path)
+        for i in range(1, 6):
+            writer.add(f"Task {i}")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_by_id_does_not_load_every_task(self):
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        with patch.object(TaskJsonRepository, '_deserialize_task', wraps=TaskJsonRepository._deserialize_task) as deserialize:
+            task = repository.get_by_id(3)
+            self.assertIsNone(repository.get_by_id(99))
+        self.assertEqual(task.description, "Task 3")
+        self.assertEqual(deserialize.call_count, 1)
+        self.assertFalse(repository._loaded)
+
+    def test_mutation_triggers_full_load(self):
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        task = repository.get_by_id(2)
+        task.mark_as_done()
+        self.assertEqual(repository.update(task), task)
+        self.assertEqual(repository.add("Task 6").id, 6)
+
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual(len(reloaded.get_all()), 6)
+        self.assertEqual([task.id for task in reloaded.get_all(status=TaskStatusEnum.DONE)], [2])
+
+    def test_get_by_id_sees_journaled_changes(self):
+        journaled = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        journaled.delete(3)
+
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        self.assertIsNone(repository.get_by_id(3))
+
+    def test_get_by_id_reads_journal_without_full_load(self):
+        journaled = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        task = journaled.get_by_id(2)
+        task.mark_as_done()
+        journaled.update(task)
+        journaled.delete_many([4])
+
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        self.assertEqual(repository.get_by_id(2).status, TaskStatusEnum.DONE)
+        self.assertIsNone(repository.get_by_id(4))
+        self.assertEqual(repository.get_by_id(5).description, "Task 5")
+        self.assertFalse(repository._loaded)
+
+    def test_list_does_not_parse_timestamps(self):
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        tasks = repository.get_all()
+        self.assertEqual(len([str(task) for task in tasks]), 5)
+        for task in tasks:
+            # Undecoded timestamps are still the text they were loaded from
+            self.assertIsInstance(task.__dict__["_createdAt"], str)
+            self.assertIsInstance(task.__dict__["_updatedAt"], str)
+
+    def test_malformed_timestamp_is_skipped_at_load(self):
+        with open(self.tasks_json_path) as f:
+            data = json.load(f)
+        data["tasks"][1]["createdAt"] = "2024-01-0" # Truncated by a hand edit
+        data["tasks"][2]["updatedAt"] = ""
+        with open(self.tasks_json_path, 'w') as f:
+            json.dump(data, f)
+
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        with patch('builtins.print') as mock_print:
+            self.assertIsNone(repository.get_by_id(2))
+            self.assertEqual([task.id for task in repository.get_all()], [1, 4, 5])
+        self.assertTrue(all("Skipping malformed task data" in call.args[0] for call in mock_print.call_args_list))
+        self.assertEqual(mock_print.call_count, 3)
+        # Every loaded task can be printed, queried by time and saved without a late ValueError
+        self.assertEqual(len(repository.get_in_range("createdAt")), 3)
+        repository.add("Task 6")
+        self.assertEqual([task.id for task in TaskJsonRepository(self.tasks_json_path).get_all()], [1, 4, 5, 6])
+
+    def test_well_shaped_invalid_timestamp_is_replaced_on_access(self):
+        with open(self.tasks_json_path) as f:
+            data = json.load(f)
+        data["tasks"][1]["createdAt"] = "2024-13-45T99:99:99" # The right shape, but no such date
+        with open(self.tasks_json_path, 'w') as f:
+            json.dump(data, f)
+
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        self.assertEqual(str(repository.get_by_id(2)), "[✗] ID: 2 - Task 2")
+        with patch('builtins.print') as mock_print:
+            self.assertEqual(len(repository.get_in_range("createdAt")), 5)
+        mock_print.assert_called_once()
+        self.assertIn("Task 2 has an invalid createdAt timestamp", mock_print.call_args.args[0])
+
+    def test_unread_timestamps_are_saved_unchanged(self):
+        with open(self.tasks_json_path) as f:
+            created_at = json.load(f)["tasks"][0]["createdAt"]
+        repository = TaskJsonRepository(self.tasks_json_path)
+        repository.delete(5) # Rewrites the snapshot from the loaded tasks
+        with open(self.tasks_json_path) as f:
+            self.assertEqual(json.load(f)["tasks"][0]["createdAt"], created_at)
+        self.assertEqual(repository.get_by_id(1).createdAt, datetime.datetime.fromisoformat(created_at))
+
+    def test_page_is_streamed_without_full_load(self):
+        journaled = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        task = journaled.get_by_id(2)
+        task.mark_as_done()
+        journaled.update(task)
+        journaled.delete(3)
+        journaled.add("Task 6")
+
+        repository = TaskJsonRepository(self.tasks_json_path, lazy=True)
+        self.assertEqual([task.id for task in repository.get_all(limit=2)], [1, 2])
+        self.assertEqual(repository.get_all(limit=1, after_id=1)[0].status, TaskStatusEnum.DONE)
+        self.assertEqual([task.id for task in repository.get_all(limit=10, after_id=2)], [4, 5, 6])
+        self.assertEqual([task.id for task in repository.iter_tasks(status=TaskStatusEnum.TODO)], [1, 4, 5, 6])
+        self.assertFalse(repository._loaded)
+
+    def test_snapshot_header_precedes_tasks(self):
+        with open(self.tasks_json_path) as f:
+            self.assertEqual(list(json.load(f)), ["version", "next_id", "journal_seq", "tasks"])
+
+    def test_add_in_journal_mode_only_appends(self):
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, background_compaction=False)
+        with patch.object(TaskJsonRepository, '_deserialize_task', wraps=TaskJsonRepository._deserialize_task) as deserialize:
+            self.assertEqual(repository.add("Task 6").id, 6)
+            self.assertEqual([task.id for task in repository.add_many(["Task 7", "Task 8"])], [7, 8])
+        self.assertEqual(deserialize.call_count, 0)
+        self.assertFalse(repository._loaded)
+
+        second = TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, background_compaction=False)
+        self.assertEqual(second.add("Task 9").id, 9)
+        self.assertEqual(second.get_by_id(7).description, "Task 7")
+        self.assertEqual([task.id for task in second.get_all()], list(range(1, 10)))
+
+    def test_add_falls_back_to_full_load_for_old_snapshots(self):
+        with open(self.tasks_json_path) as f:
+            data = json.load(f)
+        with open(self.tasks_json_path, 'w') as f:
+            json.dump({"tasks": data["tasks"], "next_id": data["next_id"]}, f) # Header after the tasks
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, background_compaction=False)
+        self.assertEqual(repository.add("Task 6").id, 6)
+        self.assertTrue(repository._loaded)
+
+    def test_add_falls_back_to_full_load_for_incomplete_journal(self):
+        journaled = TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        journaled.add("Task 6")
+        with open(journaled.journal_path, 'a') as f:
+            f.write('{"op":"put","task":{"id":7')
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, background_compaction=False)
+        self.assertEqual(repository.add("Task 7").id, 7)
+        self.assertTrue(repository._loaded)
+        self.assertEqual(len(TaskJsonRepository(self.tasks_json_path).get_all()), 7)
+
+class TestTaskJsonRepositorySearch(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _open(self, **kwargs) -> TaskJsonRepository:
+        return TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False,
+                                  persist_search_index=True, **kwargs)
+
+    def test_saved_index_is_loaded_and_caught_up_with_the_journal(self):
+        first = self._open()
+        first.add_many(["Buy milk", "Buy bread", "Call Bob"])
+        first.compact()
+        self.assertEqual([task.id for task in first.search("buy")], [1, 2]) # Builds and saves the index
+        self.assertTrue(os.path.exists(first.search_path))
+        first.delete(1) # Only in the journal
+        task = first.get_by_id(3)
+        task.description = "Buy stamps"
+        first.update(task)
+
+        second = self._open()
+        with patch.object(TaskSearchIndex, 'put', autospec=True, side_effect=TaskSearchIndex.put) as put:
+            self.assertEqual([task.id for task in second.search("buy")], [2, 3])
+        self.assertEqual(put.call_count, 1) # Only the journaled update is re-indexed
+
+    def test_index_is_saved_with_every_snapshot(self):
+        repository = self._open()
+        repository.add_many(["Buy milk", "Buy bread"])
+        repository.search("milk")
+        repository.add("Buy more milk")
+        repository.compact()
+
+        with open(repository.search_path) as f:
+            saved = json.load(f)
+        self.assertEqual(saved["version"], repository._version)
+        self.assertEqual(sorted(saved["postings"]["milk"]), [1, 3])
+
+    def test_stale_index_is_rebuilt(self):
+        first = self._open()
+        first.add_many(["Buy milk", "Buy bread"])
+        first.search("milk")
+        TaskJsonRepository(self.tasks_json_path).add("Buy milk again") # Rewrites the snapshot, not the index
+
+        self.assertEqual([task.id for task in self._open().search("milk")], [1, 3])
+
+class TestTaskJsonRepositoryTimeRange(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _open(self) -> TaskJsonRepository:
+        return TaskJsonRepository(self.tasks_json_path, journal=True, lazy=True, multiprocess=True,
+                                  background_compaction=False)
+
+    def test_range_follows_updates_from_this_and_other_processes(self):
+        first = self._open()
+        first.add_many(["Task 1", "Task 2", "Task 3"])
+        since = first.get_by_id(3).createdAt + datetime.timedelta(microseconds=1)
+        time.sleep(0.001) # So that the updates below are strictly later than the adds
+        self.assertEqual(first.get_in_range(since=since), []) # Builds the time index
+
+        task = first.get_by_id(2)
+        task.mark_as_done()
+        first.update(task)
+        second = self._open()
+        task = second.get_by_id(1)
+        task.mark_as_inprogress()
+        second.update(task)
+        second.close()
+
+        self.assertEqual([task.id for task in first.get_in_range("updatedAt", since=since)], [2, 1])
+        self.assertEqual([task.id for task in first.get_in_range("createdAt", until=since)], [1, 2, 3])
+        first.close()
+
+
+class TestTaskJsonRepositoryMetrics(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.metrics = MetricsRegistry()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _phase_count(self, phase):
+        histogram = self.metrics.histograms().get(("json_phase_seconds", (("phase", phase),)))
+        return histogram.count if histogram else 0
+
+    def test_load_and_save_phases_are_recorded(self):
+        TaskJsonRepository(self.tasks_json_path) # Creates the file without recording
+        repository = TaskJsonRepository(self.tasks_json_path, metrics=self.metrics)
+        self.assertEqual(self._phase_count("load_snapshot"), 1)
+        repository.add("Task 1")
+        self.assertEqual(self._phase_count("save_build"), 1)
+        self.assertEqual(self._phase_count("save_write"), 1)
+        counters = self.metrics.counters()
+        self.assertEqual(counters[("json_bytes_written_total", (("file", "snapshot"),))],
+                         os.path.getsize(self.tasks_json_path))
+
+        self.metrics.reset()
+        TaskJsonRepository(self.tasks_json_path, metrics=self.metrics)
+        self.assertEqual(self._phase_count("load_snapshot"), 1)
+        self.assertEqual(self.metrics.counters()[("json_bytes_read_total", (("file", "snapshot"),))],
+                         os.path.getsize(self.tasks_json_path))
+
+    def test_journal_appends_and_replays_are_recorded(self):
+        repository = TaskJsonRepository(self.tasks_json_path, journal=True, metrics=self.metrics)
+        repository.add("Task 1")
+        repository.add("Task 2")
+        journal_bytes = os.path.getsize(self.tasks_json_path + '.journal')
+        self.assertEqual(self.metrics.counters()[("json_bytes_written_total", (("file", "journal"),))], journal_bytes)
+
+        TaskJsonRepository(self.tasks_json_path, journal=True, metrics=self.metrics)
+        self.assertEqual(self._phase_count("load_journal"), 1)
+        self.assertEqual(self.metrics.counters()[("json_bytes_read_total", (("file", "journal"),))], journal_bytes)
+
+
+class TestTaskJsonRepositoryMultiprocess(unittest.TestCase):
+    journal = False
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _open(self) -> TaskJsonRepository:
+        return TaskJsonRepository(self.tasks_json_path, journal=self.journal, multiprocess=True,
+                                  background_compaction=False)
+
+    def test_stale_instances_hand_out_unique_ids(self):
+        first, second = self._open(), self._open()
+        self.assertEqual(first.add("From first").id, 1)
+        self.assertEqual(second.add("From second").id, 2)
+        self.assertEqual(first.add("From first again").id, 3)
+
+        descriptions = [task.description for task in self._open().get_all()]
+        self.assertEqual(descriptions, ["From first", "From second", "From first again"])
+
+    def test_stale_update_keeps_other_instances_changes(self):
+        first = self._open()
+        first.add_many(["Task 1", "Task 2"])
+        second = self._open()
+
+        task = first.get_by_id(1)
+        task.mark_as_done()
+        first.update(task)
+        other = second.get_by_id(2)
+        other.mark_as_inprogress()
+        second.update(other)
+
+        reloaded = self._open()
+        self.assertEqual(reloaded.get_by_id(1).status, TaskStatusEnum.DONE)
+        self.assertEqual(reloaded.get_by_id(2).status, TaskStatusEnum.INPROGRESS)
+
+    def test_update_of_task_deleted_elsewhere_returns_none(self):
+        first = self._open()
+        first.add("Task 1")
+        second = self._open()
+        task = second.get_by_id(1)
+
+        self.assertTrue(first.delete(1))
+        self.assertIsNone(second.update(task))
+        self.assertEqual(self._open().get_all(), [])
+
+    def test_reads_see_other_instances_changes(self):
+        first, second = self._open(), self._open()
+        first.add("Task 1")
+        self.assertEqual(second.get_by_id(1).description, "Task 1")
+        self.assertEqual(len(second.get_all()), 1)
+
+    def test_deferred_writes_lock_out_other_instances_until_flushed(self):
+        first = self._open()
+        with first.defer_writes():
+            first.add("Task 1")
+            self.assertTrue(first._holding_lock)
+        self.assertFalse(first._holding_lock)
+        self.assertEqual(self._open().add("Task 2").id, 2)
+
+    def test_concurrent_processes_hand_out_unique_ids(self):
+        self._open() # Create the snapshot before the workers race for it
+        workers = [multiprocessing.Process(target=_add_tasks_in_process, args=(self.tasks_json_path, self.journal, 25))
+                   for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            self.assertEqual(worker.exitcode, 0)
+
+        self.assertEqual([task.id for task in self._open().get_all()], list(range(1, 101)))
+
+class TestTaskJsonRepositoryMultiprocessJournal(TestTaskJsonRepositoryMultiprocess):
+    journal = True
+
+    def test_compaction_by_another_instance_is_picked_up(self):
+        first = self._open()
+        first.add_many(["Task 1", "Task 2"])
+        second = self._open()
+        first.compact()
+        first.delete(1)
+
+        self.assertEqual(second.add("Task 3").id, 3)
+        self.assertEqual([task.id for task in self._open().get_all()], [2, 3])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import os
+import json
+import tempfile
+from src.infrastructure.persistence.TaskJsonStream import TaskJsonStream
+
+class TestTaskJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, content):
+        with open(self.file_path, 'w') as f:
+            f.write(content)
+
+    def _tasks(self, count):
+        return [{"id": i, "description": f"Task {i}", "status": "to do",
+                 "createdAt": "2025-05-18T00:14:24.125175", "updatedAt": "2025-05-18T00:25:22.948514"}
+                for i in range(1, count + 1)]
+
+    def test_reads_records_and_header_across_chunk_boundaries(self):
+        document = {"tasks": self._tasks(20), "next_id": 123456, "journal_seq": 7}
+        for indent in (None, 4):
+            self._write(json.dumps(document, indent=indent))
+            for chunk_size in (1, 3, 7, 64, 1 << 16):
+                with self.subTest(indent=indent, chunk_size=chunk_size):
+                    stream = TaskJsonStream(self.file_path, chunk_size=chunk_size)
+                    self.assertEqual(list(stream.iter_records()), document["tasks"])
+                    self.assertEqual(stream.header, {"next_id": 123456, "journal_seq": 7})
+
+    def test_header_before_tasks_is_available_immediately(self):
+        self._write(json.dumps({"next_id": 4, "tasks": self._tasks(3)}))
+        stream = TaskJsonStream(self.file_path, chunk_size=5)
+        records = stream.iter_records()
+        self.assertEqual(next(records)["id"], 1)
+        self.assertEqual(stream.header, {"next_id": 4})
+
+    def test_stops_early(self):
+        self._write(json.dumps({"tasks": self._tasks(3)}) + "garbage that is never read")
+        for record in TaskJsonStream(self.file_path, chunk_size=8).iter_records():
+            if record["id"] == 2:
+                break
+        self.assertEqual(record["id"], 2)
+
+    def test_empty_documents(self):
+        for content in ("", "{}", '{"tasks": []}', ' { "tasks" : [ ] , "next_id" : 1 } '):
+            with self.subTest(content=content):
+                self._write(content)
+                self.assertEqual(list(TaskJsonStream(self.file_path, chunk_size=2).iter_records()), [])
+
+    def test_malformed_document_raises(self):
+        for content in ('{"tasks": [{"id": 1, "descr', '{"tasks": [1 2]}', '[1, 2]', '{"tasks": [1]'):
+            with self.subTest(content=content):
+                self._write(content)
+                with self.assertRaises(json.JSONDecodeError):
+                    list(TaskJsonStream(self.file_path, chunk_size=4).iter_records())
+
+if __name__ == '__main__':
+    unittest.main()
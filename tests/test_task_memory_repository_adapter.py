@@ -1,4 +1,5 @@
 import unittest
+import time
 from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
 from src.domain.Task import TaskStatusEnum, Task
 import datetime
@@ -70,5 +71,78 @@ class TestTaskMemoryRepository(unittest.TestCase):
             self.assertIsNone(self.repository.get_by_id(task.id))
         self.assertFalse(self.repository.delete(999)) # Non-existent ID
 
+    def test_bulk_operations(self):
+        tasks = self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        self.assertEqual([task.id for task in tasks], [1, 2, 3])
+
+        tasks[0].mark_as_done()
+        tasks[2].mark_as_done()
+        missing = Task(id=999, description="Missing", status=TaskStatusEnum.TODO, createdAt=datetime.datetime.now(), updatedAt=datetime.datetime.now())
+        self.assertEqual(self.repository.update_many([tasks[0], missing, tasks[2]]), [tasks[0], None, tasks[2]])
+        self.assertEqual(self.repository.get_all(status=TaskStatusEnum.DONE), [tasks[0], tasks[2]])
+
+        self.assertEqual(self.repository.delete_many([2, 999, 3]), [True, False, True])
+        self.assertEqual(self.repository.get_all(), [tasks[0]])
+
+    def test_get_all_pagination(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        self.repository.delete(3)
+        for task_id in (2, 5, 6):
+            task = self.repository.get_by_id(task_id)
+            task.mark_as_done()
+            self.repository.update(task)
+
+        ids = lambda tasks: [task.id for task in tasks]
+        self.assertEqual(ids(self.repository.get_all(limit=3)), [1, 2, 4])
+        self.assertEqual(ids(self.repository.get_all(limit=3, offset=3)), [5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(limit=2, after_id=4)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(after_id=3)), [4, 5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(status=TaskStatusEnum.DONE, limit=2, after_id=2)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(limit=0)), [])
+        self.assertEqual(ids(self.repository.get_all(after_id=7)), [])
+
+    def test_iter_tasks(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.repository.delete(2)
+        task = self.repository.get_by_id(4)
+        task.mark_as_done()
+        self.repository.update(task)
+
+        self.assertEqual([task.id for task in self.repository.iter_tasks()], [1, 3, 4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(after_id=3)], [4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(status=TaskStatusEnum.TODO, after_id=1)], [3, 5])
+
+    def test_search(self):
+        self.repository.add_many(["Buy milk", "Call Bob", "Buy bread"])
+        self.assertEqual([task.id for task in self.repository.search("buy")], [1, 3])
+        task = self.repository.get_by_id(2)
+        task.description = "Buy stamps"
+        self.repository.update(task)
+        self.repository.delete(1)
+        self.assertEqual([task.id for task in self.repository.search("BUY")], [2, 3])
+        self.assertEqual([task.id for task in self.repository.search("bu* st*")], [2])
+        with self.assertRaises(ValueError):
+            self.repository.search("  ")
+
+    def test_get_in_range(self):
+        self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        created = self.repository.get_by_id(1).createdAt
+        time.sleep(0.001) # So that the updates below are strictly later than the adds
+        for task_id in (3, 1):
+            task = self.repository.get_by_id(task_id)
+            task.mark_as_done()
+            self.repository.update(task)
+        updated_since = created + datetime.timedelta(microseconds=1)
+
+        self.assertEqual([task.id for task in self.repository.get_in_range("updatedAt", since=updated_since)], [3, 1])
+        self.assertEqual([task.id for task in self.repository.get_in_range("updatedAt", until=updated_since)], [2])
+        self.assertEqual([task.id for task in self.repository.get_in_range("createdAt", since=created)], [1, 2, 3])
+        self.assertEqual(self.repository.get_in_range("createdAt", until=created), [])
+        self.repository.delete(3)
+        self.assertEqual([task.id for task in self.repository.get_in_range(since=updated_since)], [1])
+        with self.assertRaises(ValueError):
+            self.repository.get_in_range("dueAt")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import datetime
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+from src.domain.SearchQuery import SearchQuery
+from src.domain.Task import Task, TaskStatusEnum
+from src.infrastructure.persistence.TaskSearchIndex import TaskSearchIndex
+
+class TestTaskSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.now = datetime.datetime.now()
+        self.index = TaskSearchIndex([
+            self._create_task(1, "Buy milk"),
+            self._create_task(2, "Buy bread and milk"),
+            self._create_task(3, "Plan the milestone review"),
+        ])
+
+    def _create_task(self, id, description):
+        return Task(id=id, description=description, status=TaskStatusEnum.TODO, createdAt=self.now, updatedAt=self.now)
+
+    def _search(self, query):
+        return sorted(self.index.search(SearchQuery.parse(query)))
+
+    def test_and_query(self):
+        self.assertEqual(self._search("milk"), [1, 2])
+        self.assertEqual(self._search("buy milk"), [1, 2])
+        self.assertEqual(self._search("bread milk"), [2])
+        self.assertEqual(self._search("bread review"), [])
+        self.assertEqual(self._search("unknown"), [])
+
+    def test_prefix_query(self):
+        self.assertEqual(self._search("mil*"), [1, 2, 3])
+        self.assertEqual(self._search("mile*"), [3])
+        self.assertEqual(self._search("buy mil*"), [1, 2])
+
+    def test_put_replaces_and_remove_unlinks(self):
+        self.index.put(self._create_task(1, "Sell cheese"))
+        self.assertEqual(self._search("milk"), [2])
+        self.assertEqual(self._search("chee*"), [1])
+        self.index.remove(2)
+        self.assertEqual(self._search("milk"), [])
+        self.assertEqual(self._search("bre*"), [])
+        self.assertEqual(len(self.index), 2)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'tasks.json.search')
+            TaskSearchIndex.save(path, 7, self.index.postings())
+            self.assertIsNone(TaskSearchIndex.load(path, 8)) # Saved for another snapshot version
+            loaded = TaskSearchIndex.load(path, 7)
+            self.assertIsNone(TaskSearchIndex.load(os.path.join(temp_dir, 'missing'), 7))
+        self.assertEqual(sorted(loaded.search(SearchQuery.parse("buy mil*"))), [1, 2])
+        loaded.remove(1)
+        self.assertEqual(sorted(loaded.search(SearchQuery.parse("milk"))), [2])
+
+    def test_concurrent_saves_do_not_clobber_each_other(self):
+        postings = {f"word{i}": list(range(i, i + 50)) for i in range(2000)}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'tasks.json.search')
+            start = threading.Barrier(2)
+            def rebuild(version):
+                start.wait()
+                for _ in range(20):
+                    TaskSearchIndex.save(path, version, postings)
+            with patch('builtins.print') as mock_print:
+                threads = [threading.Thread(target=rebuild, args=(version,)) for version in (1, 2)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            mock_print.assert_not_called()
+            self.assertTrue(TaskSearchIndex.load(path, 1) or TaskSearchIndex.load(path, 2))
+            self.assertEqual(os.listdir(temp_dir), ['tasks.json.search'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import json
+import os
+import tempfile
+from unittest.mock import patch
+from src.infrastructure.persistence.TaskShardedJsonRepository_adapter import TaskShardedJsonRepository
+from src.domain.Task import TaskStatusEnum
+
+class TestTaskShardedJsonRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.temp_dir.name, 'tasks.shards')
+        self.repository = TaskShardedJsonRepository(self.directory, shard_size=3)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _reopen(self) -> TaskShardedJsonRepository:
+        return TaskShardedJsonRepository(self.directory)
+
+    def _shard_ids(self, number):
+        with open(self.repository.shard_path(number)) as f:
+            return [task["id"] for task in json.load(f)["tasks"]]
+
+    def test_tasks_are_split_by_id_range(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        self.assertEqual([self._shard_ids(number) for number in range(3)], [[1, 2, 3], [4, 5, 6], [7]])
+        with open(os.path.join(self.directory, 'manifest.json')) as f:
+            self.assertEqual(json.load(f), {"next_id": 8, "shard_size": 3})
+
+        reopened = self._reopen()
+        self.assertEqual(reopened.shard_size, 3)
+        self.assertEqual([task.id for task in reopened.get_all()], list(range(1, 8)))
+        self.assertEqual(reopened.add("Task 8").id, 8)
+
+    def test_shards_are_loaded_on_first_access(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        reopened = self._reopen()
+        self.assertEqual(reopened.get_by_id(5).description, "Task 5")
+        self.assertEqual(sorted(reopened._shards), [1])
+        self.assertIsNone(reopened.get_by_id(99))
+        self.assertEqual(sorted(reopened._shards), [1])
+        self.assertEqual([task.id for task in reopened.get_all(limit=2, after_id=4)], [5, 6])
+        self.assertEqual(sorted(reopened._shards), [1]) # The page ends before shard 2
+        self.assertEqual([task.id for task in reopened.get_all(limit=2, after_id=5)], [6, 7])
+        self.assertEqual(sorted(reopened._shards), [1, 2])
+
+    def test_mutations_rewrite_only_the_affected_shard(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        repository = self._reopen()
+        with patch.object(repository, '_write_file', wraps=repository._write_file) as write:
+            task = repository.get_by_id(4)
+            task.mark_as_done()
+            repository.update(task)
+            repository.delete(5)
+        self.assertEqual([call.args[0] for call in write.call_args_list], [repository.shard_path(1)] * 2)
+        self.assertEqual(self._shard_ids(1), [4, 6])
+        reopened = self._reopen()
+        self.assertEqual(reopened.get_by_id(4).status, TaskStatusEnum.DONE)
+        self.assertEqual([task.id for task in reopened.get_all(status=TaskStatusEnum.TODO)], [1, 2, 3, 6, 7])
+
+    def test_deferred_writes_save_each_shard_once(self):
+        with patch.object(self.repository, '_write_file', wraps=self.repository._write_file) as write:
+            with self.repository.defer_writes():
+                for i in range(1, 5):
+                    self.repository.add(f"Task {i}")
+                self.repository.delete(2)
+        written = [os.path.basename(call.args[0]) for call in write.call_args_list]
+        self.assertEqual(written, ["manifest.json", "shard-000000.json", "shard-000001.json"])
+
+    def test_writes_go_through_unique_temporary_files(self):
+        other_writer = self.repository.shard_path(0) + '.tmp'
+        with open(other_writer, 'w') as f:
+            f.write("in progress")
+        self.repository.add("Task 1")
+        with open(other_writer) as f:
+            self.assertEqual(f.read(), "in progress")
+        self.assertEqual(sorted(os.listdir(self.directory)), ["manifest.json", "shard-000000.json", "shard-000000.json.tmp"])
+
+    def test_empty_shards_are_removed(self):
+        self.repository.add_many(["Task 1", "Task 2", "Task 3", "Task 4"])
+        self.assertEqual(self.repository.delete_many([4, 5]), [True, False])
+        self.assertFalse(os.path.exists(self.repository.shard_path(1)))
+        self.assertEqual(self._reopen().add("Task 5").id, 5) # Ids of deleted tasks are not reused
+
+    def test_search_and_time_range_read_every_shard(self):
+        self.repository.add_many(["Buy milk", "Walk dog", "Buy bread", "Call mom"])
+        reopened = self._reopen()
+        self.assertEqual([task.id for task in reopened.search("buy")], [1, 3])
+        self.assertEqual(len(reopened.get_in_range("createdAt")), 4)
+
+    def test_unreadable_manifest_is_refused(self):
+        with open(os.path.join(self.directory, 'manifest.json'), 'w') as f:
+            f.write("{broken")
+        with self.assertRaises(ValueError):
+            self._reopen()
+
+    def test_corrupt_shard_is_moved_aside(self):
+        self.repository.add_many(["Task 1", "Task 4"])
+        with open(self.repository.shard_path(0), 'w') as f:
+            f.write("{broken")
+        reopened = self._reopen()
+        with patch('builtins.print'):
+            self.assertIsNone(reopened.get_by_id(1))
+        self.assertTrue(any(name.startswith("shard-000000.json.corrupt-") for name in os.listdir(self.directory)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+import unittest
+import time
+import os
+import sqlite3
+import tempfile
+from src.infrastructure.persistence.TaskSqliteRepository_adapter import TaskSqliteRepository
+from src.domain.Task import TaskStatusEnum, Task
+import datetime
+
+class TestTaskSqliteRepository(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.repository = TaskSqliteRepository(self.db_path)
+
+    def tearDown(self):
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def test_add_task(self):
+        task = self.repository.add("Test Task 1")
+        self.assertEqual(task.description, "Test Task 1")
+        self.assertEqual(task.status, TaskStatusEnum.TODO)
+        self.assertIsNotNone(task.id)
+        self.assertIsNotNone(task.createdAt)
+        self.assertIsNotNone(task.updatedAt)
+        if task.id:
+            self.assertEqual(self.repository.get_by_id(task.id), task)
+
+    def test_get_by_id(self):
+        task1 = self.repository.add("Test Task 1")
+        if task1.id:
+            retrieved_task = self.repository.get_by_id(task1.id)
+            self.assertEqual(retrieved_task, task1)
+        self.assertIsNone(self.repository.get_by_id(999))  # Non-existent ID
+
+    def test_get_all_tasks(self):
+        self.repository.add("Task 1")
+        self.repository.add("Task 2")
+        tasks = self.repository.get_all()
+        self.assertEqual(len(tasks), 2)
+
+    def test_get_all_tasks_with_status_filter(self):
+        self.repository.add("Task 1 Todo")
+        task_done = self.repository.add("Task 2 Done")
+        task_done.mark_as_done()
+        self.repository.update(task_done)
+
+        todo_tasks = self.repository.get_all(status=TaskStatusEnum.TODO)
+        self.assertEqual(len(todo_tasks), 1)
+        self.assertEqual(todo_tasks[0].description, "Task 1 Todo")
+
+        done_tasks = self.repository.get_all(status=TaskStatusEnum.DONE)
+        self.assertEqual(len(done_tasks), 1)
+        self.assertEqual(done_tasks[0].description, "Task 2 Done")
+
+        inprogress_tasks = self.repository.get_all(status=TaskStatusEnum.INPROGRESS)
+        self.assertEqual(len(inprogress_tasks), 0)
+
+    def test_update_task(self):
+        task = self.repository.add("Original Description")
+        task.description = "Updated Description"
+        task.mark_as_done()
+        updated_task = self.repository.update(task)
+        self.assertIsNotNone(updated_task, "Updated task should not be None")
+        if updated_task:  # Only check attributes if update was successful
+            self.assertEqual(updated_task.description, "Updated Description")
+            self.assertEqual(updated_task.status, TaskStatusEnum.DONE)
+
+        # Test updating a non-existent task
+        non_existent_task = Task(id=999, description="Non Existent", status=TaskStatusEnum.TODO, createdAt=datetime.datetime.now(), updatedAt=datetime.datetime.now())
+        self.assertIsNone(self.repository.update(non_existent_task))
+
+    def test_delete_task(self):
+        task = self.repository.add("Task to delete")
+        if task.id:
+            self.assertTrue(self.repository.delete(task.id))
+            self.assertIsNone(self.repository.get_by_id(task.id))
+        self.assertFalse(self.repository.delete(999))  # Non-existent ID
+
+    def test_tasks_persist_across_connections(self):
+        task = self.repository.add("Persistent task")
+        task.mark_as_inprogress()
+        self.repository.update(task)
+        self.repository.close()
+
+        self.repository = TaskSqliteRepository(self.db_path)
+        self.assertEqual(self.repository.get_by_id(task.id), task)
+
+    def test_deleted_ids_are_not_reused(self):
+        self.repository.add("Task 1")
+        task2 = self.repository.add("Task 2")
+        self.repository.delete(task2.id)
+        self.assertEqual(self.repository.add("Task 3").id, 3)
+
+    def test_bulk_operations(self):
+        tasks = self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        self.assertEqual([task.id for task in tasks], [1, 2, 3])
+        tasks[1].mark_as_inprogress()
+        missing = Task(id=999, description="Missing", status=TaskStatusEnum.TODO, createdAt=datetime.datetime.now(), updatedAt=datetime.datetime.now())
+        self.assertEqual(self.repository.update_many([tasks[1], missing]), [tasks[1], None])
+        self.assertEqual(self.repository.get_all(status=TaskStatusEnum.INPROGRESS), [tasks[1]])
+        self.assertEqual(self.repository.delete_many([1, 999]), [True, False])
+        self.assertEqual(len(self.repository.get_all()), 2)
+
+    def test_failed_batch_is_rolled_back(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.repository.add_many(["Task 1", None])
+        self.assertEqual(self.repository.get_all(), [])
+
+    def test_deferred_writes_are_committed_when_the_block_exits(self):
+        other = TaskSqliteRepository(self.db_path)
+        try:
+            with self.repository.defer_writes():
+                self.repository.add_many(["Task 1", "Task 2"])
+                self.repository.delete(1)
+                self.assertEqual(len(self.repository.get_all()), 1)
+                self.assertEqual(other.get_all(), [])
+                self.repository.flush()
+                self.assertEqual(len(other.get_all()), 1)
+                self.repository.add("Task 3")
+            self.assertEqual(len(other.get_all()), 2)
+        finally:
+            other.close()
+
+    def test_failed_batch_inside_deferred_block_only_undoes_itself(self):
+        with self.repository.defer_writes():
+            self.repository.add("Task 1")
+            with self.assertRaises(sqlite3.IntegrityError):
+                self.repository.add_many(["Task 2", None])
+        self.assertEqual([task.description for task in self.repository.get_all()], ["Task 1"])
+
+    def test_uses_wal_mode(self):
+        mode = self.repository._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_get_all_pagination(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 8)])
+        self.repository.delete(3)
+        for task_id in (2, 5, 6):
+            task = self.repository.get_by_id(task_id)
+            task.mark_as_done()
+            self.repository.update(task)
+
+        ids = lambda tasks: [task.id for task in tasks]
+        self.assertEqual(ids(self.repository.get_all(limit=3)), [1, 2, 4])
+        self.assertEqual(ids(self.repository.get_all(limit=3, offset=3)), [5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(limit=2, after_id=4)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(after_id=3)), [4, 5, 6, 7])
+        self.assertEqual(ids(self.repository.get_all(status=TaskStatusEnum.DONE, limit=2, after_id=2)), [5, 6])
+        self.assertEqual(ids(self.repository.get_all(limit=0)), [])
+        self.assertEqual(ids(self.repository.get_all(after_id=7)), [])
+
+    def test_iter_tasks(self):
+        self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.repository.delete(2)
+        task = self.repository.get_by_id(4)
+        task.mark_as_done()
+        self.repository.update(task)
+
+        self.assertEqual([task.id for task in self.repository.iter_tasks()], [1, 3, 4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(after_id=3)], [4, 5])
+        self.assertEqual([task.id for task in self.repository.iter_tasks(status=TaskStatusEnum.TODO, after_id=1)], [3, 5])
+
+    def test_get_in_range(self):
+        self.repository.add_many(["Task 1", "Task 2", "Task 3"])
+        created = self.repository.get_by_id(1).createdAt
+        time.sleep(0.001) # So that the updates below are strictly later than the adds
+        for task_id in (3, 1):
+            task = self.repository.get_by_id(task_id)
+            task.mark_as_done()
+            self.repository.update(task)
+        updated_since = created + datetime.timedelta(microseconds=1)
+
+        self.assertEqual([task.id for task in self.repository.get_in_range("updatedAt", since=updated_since)], [3, 1])
+        self.assertEqual([task.id for task in self.repository.get_in_range("updatedAt", until=updated_since)], [2])
+        self.assertEqual([task.id for task in self.repository.get_in_range("createdAt", since=created)], [1, 2, 3])
+        self.assertEqual(self.repository.get_in_range("createdAt", until=created), [])
+        self.repository.delete(3)
+        self.assertEqual([task.id for task in self.repository.get_in_range(since=updated_since)], [1])
+        with self.assertRaises(ValueError):
+            self.repository.get_in_range("dueAt")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import datetime
+from src.domain.Task import Task, TaskStatusEnum
+from src.infrastructure.persistence.TaskTimeIndex import TaskTimeIndex
+
+class TestTaskTimeIndex(unittest.TestCase):
+    def setUp(self):
+        self.start = datetime.datetime(2024, 5, 1, 9, 0)
+        # Task n is created n hours after start and updated n hours after that
+        self.tasks = [self._create_task(id, id, 2 * id) for id in (1, 2, 3, 4)]
+        self.index = TaskTimeIndex(self.tasks)
+
+    def _at(self, hours):
+        return self.start + datetime.timedelta(hours=hours)
+
+    def _create_task(self, id, created_hours, updated_hours):
+        return Task(id=id, description=f"Task {id}", status=TaskStatusEnum.TODO,
+                    createdAt=self._at(created_hours), updatedAt=self._at(updated_hours))
+
+    def test_between_is_half_open(self):
+        self.assertEqual(self.index.between("createdAt", self._at(2), self._at(4)), [2, 3])
+        self.assertEqual(self.index.between("updatedAt", self._at(4), self._at(8)), [2, 3])
+        self.assertEqual(self.index.between("createdAt", since=self._at(3)), [3, 4])
+        self.assertEqual(self.index.between("createdAt", until=self._at(3)), [1, 2])
+        self.assertEqual(self.index.between("updatedAt"), [1, 2, 3, 4])
+        self.assertEqual(self.index.between("updatedAt", self._at(9), self._at(5)), [])
+
+    def test_equal_timestamps_are_ordered_by_id(self):
+        self.index.put(self._create_task(5, 2, 4))
+        self.assertEqual(self.index.between("createdAt", self._at(2), self._at(3)), [2, 5])
+
+    def test_put_moves_changed_timestamps(self):
+        task = self.tasks[0]
+        task.updatedAt = self._at(10) # Changed in place, as Task.mark_as_done() does
+        self.index.put(task)
+        self.assertEqual(self.index.between("updatedAt", since=self._at(7)), [4, 1])
+        self.assertEqual(self.index.between("updatedAt", until=self._at(3)), [])
+        self.assertEqual(self.index.between("createdAt", until=self._at(2)), [1])
+        self.assertEqual(len(self.index), 4)
+
+    def test_remove(self):
+        self.index.remove(2)
+        self.index.remove(99)
+        self.assertEqual(self.index.between("createdAt"), [1, 3, 4])
+        self.assertEqual(self.index.between("updatedAt"), [1, 3, 4])
+        self.assertEqual(len(self.index), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import os
+import tempfile
+from unittest.mock import patch
+from src.application.TodoService_adapter import TodoService
+from src.application.TaskUnitOfWork import TaskUnitOfWork
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.domain.Task import TaskStatusEnum
+
+def complete_and_follow_up(test: unittest.TestCase, service: TodoService, repository):
+    """Runs a multi-step workflow in a transaction and returns the expected statuses."""
+    with service.transaction():
+        service.complete_tasks([1, 2])
+        service.remove_task(3)
+        follow_ups = service.add_tasks(["Follow up", "Book room"])
+        service.begin_task(follow_ups[1].id)
+        # Reads inside the transaction see its changes
+        test.assertEqual(service.get_task(1).status, TaskStatusEnum.DONE)
+        test.assertIsNone(service.get_task(3))
+        test.assertEqual([task.id for task in service.list_tasks(TaskStatusEnum.TODO)], [4, 5, follow_ups[0].id])
+        # The repository itself is untouched until the block ends
+        test.assertEqual(repository.get_by_id(1).status, TaskStatusEnum.TODO)
+
+    test.assertEqual([task.id for task in follow_ups], [6, 7])
+    test.assertIs(service.repository, repository)
+    return {1: TaskStatusEnum.DONE, 2: TaskStatusEnum.DONE, 4: TaskStatusEnum.TODO,
+            5: TaskStatusEnum.TODO, 6: TaskStatusEnum.TODO, 7: TaskStatusEnum.INPROGRESS}
+
+def statuses(repository):
+    return {task.id: task.status for task in repository.get_all()}
+
+class TestMemoryTransaction(unittest.TestCase):
+    def setUp(self):
+        self.repository = TaskMemoryRepository()
+        self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.service = TodoService(self.repository)
+
+    def test_commit_applies_every_change(self):
+        expected = complete_and_follow_up(self, self.service, self.repository)
+        self.assertEqual(statuses(self.repository), expected)
+
+    def test_exception_discards_every_change(self):
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                self.service.complete_task(1)
+                self.service.remove_task(2)
+                self.service.add_task("Never stored")
+                raise RuntimeError("Step failed")
+        self.assertEqual(statuses(self.repository), {i: TaskStatusEnum.TODO for i in range(1, 6)})
+        self.assertIs(self.service.repository, self.repository)
+        self.assertEqual(self.service.add_task("Next").id, 6)
+
+    def test_nested_transaction_joins_the_outer_one(self):
+        with self.assertRaises(ValueError):
+            with self.service.transaction():
+                with self.service.transaction():
+                    self.service.complete_task(1)
+                self.service.add_task("") # Rejected by the service
+        self.assertEqual(self.repository.get_by_id(1).status, TaskStatusEnum.TODO)
+
+    def test_commit_is_refused_if_a_changed_task_disappeared(self):
+        with self.assertRaises(ValueError):
+            with self.service.transaction():
+                self.service.complete_task(1)
+                self.service.add_task("Never stored")
+                self.service.remove_task(2)
+                self.repository.delete(2) # Removed behind the transaction's back
+        self.assertEqual(statuses(self.repository), {i: TaskStatusEnum.TODO for i in (1, 3, 4, 5)})
+        self.assertIs(self.service.repository, self.repository)
+
+    def test_storage_failure_while_applying_is_not_rolled_back(self):
+        with patch.object(self.repository, 'add_many', side_effect=OSError("Disk full")):
+            with self.assertRaises(OSError):
+                with self.service.transaction():
+                    self.service.complete_task(1)
+                    self.service.add_task("Never stored")
+        # Documented limitation: the steps before the failing one stay applied
+        self.assertEqual(self.repository.get_by_id(1).status, TaskStatusEnum.DONE)
+        self.assertEqual(len(self.repository.get_all()), 5)
+        self.assertIs(self.service.repository, self.repository)
+
+    def test_task_added_and_removed_in_the_transaction_is_never_stored(self):
+        with self.service.transaction():
+            task = self.service.add_task("Short-lived")
+            self.assertTrue(self.service.remove_task(task.id))
+            self.assertFalse(self.service.remove_task(task.id))
+        self.assertEqual(len(self.repository.get_all()), 5)
+
+class TestJsonTransaction(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.repository = TaskJsonRepository(self.tasks_json_path)
+        self.repository.add_many([f"Task {i}" for i in range(1, 6)])
+        self.service = TodoService(self.repository)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_commit_is_a_single_save(self):
+        with patch.object(self.repository, '_save', wraps=self.repository._save) as save:
+            expected = complete_and_follow_up(self, self.service, self.repository)
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(statuses(TaskJsonRepository(self.tasks_json_path)), expected)
+
+    def test_rollback_writes_nothing(self):
+        with patch.object(self.repository, '_save', wraps=self.repository._save) as save:
+            with self.assertRaises(RuntimeError):
+                with self.service.transaction():
+                    self.service.complete_task(1)
+                    self.service.add_task("Never stored")
+                    raise RuntimeError("Step failed")
+        save.assert_not_called()
+        self.assertEqual(statuses(TaskJsonRepository(self.tasks_json_path)), {i: TaskStatusEnum.TODO for i in range(1, 6)})
+
+class TestTaskUnitOfWork(unittest.TestCase):
+    def test_reads_return_copies(self):
+        repository = TaskMemoryRepository()
+        repository.add("Task 1")
+        unit_of_work = TaskUnitOfWork(repository)
+        task = unit_of_work.get_by_id(1)
+        task.mark_as_done()
+        self.assertEqual(repository.get_by_id(1).status, TaskStatusEnum.TODO)
+        self.assertEqual(unit_of_work.get_by_id(1).status, TaskStatusEnum.TODO) # Not staged without update()
+        unit_of_work.update(task)
+        self.assertIs(unit_of_work.get_by_id(1), task)
+        unit_of_work.add("New")
+        unit_of_work.commit()
+        self.assertEqual(repository.get_by_id(1).status, TaskStatusEnum.DONE)
+        self.assertEqual(repository.get_by_id(2).description, "New")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+import os
+import tempfile
+import threading
+from src.infrastructure.persistence.ThreadSafeTaskRepository_adapter import ThreadSafeTaskRepository
+from src.infrastructure.persistence.TaskMemoryRepository_adapter import TaskMemoryRepository
+from src.infrastructure.persistence.TaskJsonRepository_adapter import TaskJsonRepository
+from src.domain.Task import TaskStatusEnum
+
+THREADS = 8
+TASKS_PER_THREAD = 50
+
+class ThreadSafeRepositoryStressMixin:
+    """Stress tests shared by the repositories that ThreadSafeTaskRepository guards."""
+    def _run_threads(self, target, count=THREADS):
+        errors = []
+
+        def run(index):
+            try:
+                target(index)
+            except Exception as e: # Surfaced in the main thread below
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_concurrent_adds_get_unique_ids(self):
+        ids = []
+        lock = threading.Lock()
+
+        def writer(index):
+            for i in range(TASKS_PER_THREAD):
+                task = self.repository.add(f"Thread {index} task {i}")
+                with lock:
+                    ids.append(task.id)
+
+        self._run_threads(writer)
+        self.assertEqual(sorted(ids), list(range(1, THREADS * TASKS_PER_THREAD + 1)))
+        self.assertEqual(len(self.repository.get_all()), THREADS * TASKS_PER_THREAD)
+
+    def test_no_lost_updates_with_concurrent_readers(self):
+        tasks = self.repository.add_many([f"Task {i}" for i in range(THREADS * TASKS_PER_THREAD)])
+        stop = threading.Event()
+        snapshots = []
+
+        def reader():
+            while not stop.is_set():
+                snapshot = self.repository.get_all()
+                ids = [task.id for task in snapshot]
+                snapshots.append(ids == sorted(set(ids)))
+                self.repository.get_all(status=TaskStatusEnum.DONE)
+
+        def writer(index):
+            for task in tasks[index::THREADS]:
+                task = self.repository.get_by_id(task.id)
+                task.mark_as_done()
+                self.assertIs(self.repository.update(task), task)
+
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in readers:
+            thread.start()
+        try:
+            self._run_threads(writer)
+        finally:
+            stop.set()
+            for thread in readers:
+                thread.join()
+
+        self.assertTrue(all(snapshots))
+        self.assertEqual(len(self.repository.get_all(status=TaskStatusEnum.DONE)), len(tasks))
+        self.assertEqual(self.repository.get_all(status=TaskStatusEnum.TODO), [])
+
+    def test_reads_return_detached_copies(self):
+        task = self.repository.add("Task 1")
+        snapshot = self.repository.get_all()
+        fetched = self.repository.get_by_id(task.id)
+        fetched.mark_as_done()
+        task.description = "Changed without update()"
+        self.assertEqual(self.repository.get_by_id(task.id).status, TaskStatusEnum.TODO)
+        self.assertEqual(self.repository.get_by_id(task.id).description, "Task 1")
+
+        self.repository.update(fetched)
+        self.assertEqual(snapshot[0].status, TaskStatusEnum.TODO) # Earlier snapshots do not change
+        self.assertEqual(self.repository.get_by_id(task.id).status, TaskStatusEnum.DONE)
+
+class TestThreadSafeMemoryRepository(ThreadSafeRepositoryStressMixin, unittest.TestCase):
+    def setUp(self):
+        self.repository = ThreadSafeTaskRepository(TaskMemoryRepository())
+
+class TestThreadSafeJsonRepository(ThreadSafeRepositoryStressMixin, unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks_json_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.repository = ThreadSafeTaskRepository(
+            TaskJsonRepository(self.tasks_json_path, journal=True, background_compaction=False)
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_persisted_state_matches_after_concurrent_writes(self):
+        self.test_concurrent_adds_get_unique_ids()
+        reloaded = TaskJsonRepository(self.tasks_json_path)
+        self.assertEqual([task.id for task in reloaded.get_all()], list(range(1, THREADS * TASKS_PER_THREAD + 1)))
+        self.assertEqual(reloaded.add("Next").id, THREADS * TASKS_PER_THREAD + 1)
+
+if __name__ == '__main__':
+    unittest.main()
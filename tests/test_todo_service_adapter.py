@@ -62,6 +62,51 @@ class TestTodoService(unittest.TestCase):
         self.mock_repository.get_all.assert_called_once_with(status=TaskStatusEnum.DONE)
         self.assertEqual(tasks, tasks_list)
 
+    def test_list_tasks_page(self):
+        tasks_list = [self._create_sample_task(id=5)]
+        self.mock_repository.get_all.return_value = tasks_list
+
+        tasks = self.service.list_tasks(status=TaskStatusEnum.TODO, limit=1, after_id=4)
+        self.mock_repository.get_all.assert_called_once_with(status=TaskStatusEnum.TODO, limit=1, offset=0, after_id=4)
+        self.assertEqual(tasks, tasks_list)
+
+    def test_list_tasks_rejects_negative_page_bounds(self):
+        with self.assertRaises(ValueError):
+            self.service.list_tasks(limit=-1)
+        with self.assertRaises(ValueError):
+            self.service.list_tasks(offset=-1)
+        self.mock_repository.get_all.assert_not_called()
+
+    def test_iter_tasks(self):
+        self.mock_repository.iter_tasks.return_value = iter([self._create_sample_task(id=3)])
+        tasks = list(self.service.iter_tasks(after_id=2))
+        self.mock_repository.iter_tasks.assert_called_once_with(status=None, after_id=2)
+        self.assertEqual([task.id for task in tasks], [3])
+
+    def test_search_tasks(self):
+        tasks_list = [self._create_sample_task(id=1, description="Buy milk")]
+        self.mock_repository.search.return_value = tasks_list
+        self.assertEqual(self.service.search_tasks("milk"), tasks_list)
+        self.mock_repository.search.assert_called_once_with("milk")
+
+    def test_search_tasks_empty_query(self):
+        with self.assertRaises(ValueError):
+            self.service.search_tasks("  ")
+        self.mock_repository.search.assert_not_called()
+
+    def test_list_tasks_in_range(self):
+        since = datetime.datetime(2024, 5, 1)
+        until = datetime.datetime(2024, 5, 2)
+        done = self._create_sample_task(id=1, status=TaskStatusEnum.DONE)
+        todo = self._create_sample_task(id=2, status=TaskStatusEnum.TODO)
+        self.mock_repository.get_in_range.return_value = [done, todo]
+
+        self.assertEqual(self.service.list_tasks_in_range(since, until), [done, todo])
+        self.mock_repository.get_in_range.assert_called_once_with(field="updatedAt", since=since, until=until)
+        self.assertEqual(self.service.list_tasks_in_range(since, field="createdAt", status=TaskStatusEnum.DONE), [done])
+        with self.assertRaises(ValueError):
+            self.service.list_tasks_in_range(until, since)
+
     def test_complete_task(self):
         original_task = self._create_sample_task(id=1, status=TaskStatusEnum.TODO)
         # When get_by_id is called, return the original task
@@ -127,5 +172,48 @@ class TestTodoService(unittest.TestCase):
         self.mock_repository.delete.assert_called_once_with(99)
         self.assertFalse(result)
 
+    def test_add_tasks(self):
+        sample_tasks = [self._create_sample_task(id=1, description="A"), self._create_sample_task(id=2, description="B")]
+        self.mock_repository.add_many.return_value = sample_tasks
+
+        tasks = self.service.add_tasks(["A", "B"])
+        self.mock_repository.add_many.assert_called_once_with(["A", "B"])
+        self.assertEqual(tasks, sample_tasks)
+
+    def test_add_tasks_validates_every_description_first(self):
+        with self.assertRaises(ValueError) as context:
+            self.service.add_tasks(["Valid", "   "])
+        self.assertEqual(str(context.exception), "Task description cannot be empty.")
+        self.mock_repository.add_many.assert_not_called()
+        self.mock_repository.add.assert_not_called()
+
+    def test_complete_tasks(self):
+        task1 = self._create_sample_task(id=1)
+        task3 = self._create_sample_task(id=3)
+        self.mock_repository.get_by_id.side_effect = lambda task_id: {1: task1, 3: task3}.get(task_id)
+        self.mock_repository.update_many.side_effect = lambda tasks: list(tasks)
+
+        results = self.service.complete_tasks([1, 2, 3])
+
+        self.mock_repository.update_many.assert_called_once_with([task1, task3])
+        self.assertEqual(results, [task1, None, task3])
+        self.assertEqual(task1.status, TaskStatusEnum.DONE)
+        self.assertEqual(task3.status, TaskStatusEnum.DONE)
+
+    def test_begin_tasks_none_found(self):
+        self.mock_repository.get_by_id.return_value = None
+        self.assertEqual(self.service.begin_tasks([7, 8]), [None, None])
+        self.mock_repository.update_many.assert_not_called()
+
+    def test_remove_tasks(self):
+        self.mock_repository.delete_many.return_value = [True, False]
+        self.assertEqual(self.service.remove_tasks([1, 99]), [True, False])
+        self.mock_repository.delete_many.assert_called_once_with([1, 99])
+
+    def test_defer_writes_and_flush_delegate_to_repository(self):
+        self.assertIs(self.service.defer_writes(), self.mock_repository.defer_writes.return_value)
+        self.service.flush()
+        self.mock_repository.flush.assert_called_once_with()
+
 if __name__ == '__main__':
     unittest.main()